@@ -0,0 +1,92 @@
+"""Module ran on the command line which runs the benchmarks of each stage on generated data"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from json import dump, dumps, load
+
+from benchmarks.data_generator import SyntheticDataGenerator
+from benchmarks.stage_benchmarks import StageBenchmarks
+from strings.args import KEY_WORDS_ARG, STORE_ACTION
+from strings.benchmark import *
+from strings.extract_handler import READ_OPT
+from strings.general import MAIN_NAME
+
+# The number of spaces each level of the json results is indented by
+JSON_INDENT: int = 4
+
+
+def get_args() -> Namespace:
+    """
+    Parses the parameters of the generated data and of comparing the results against a baseline
+
+    @return: The arguments
+    """
+
+    parser: ArgumentParser = ArgumentParser()
+
+    parser.add_argument(DIRS_ARG, type=int, default=20, action=STORE_ACTION, help=DIRS_ARG_HELP)
+    parser.add_argument(DEPTH_ARG, type=int, default=3, action=STORE_ACTION, help=DEPTH_ARG_HELP)
+    parser.add_argument(FILES_ARG, type=int, default=100, action=STORE_ACTION, help=FILES_ARG_HELP)
+    parser.add_argument(ROWS_ARG, type=int, default=1000, action=STORE_ACTION, help=ROWS_ARG_HELP)
+    parser.add_argument(COLS_ARG, type=int, default=20, action=STORE_ACTION, help=COLS_ARG_HELP)
+    parser.add_argument(CARDINALITY_ARG, type=int, default=10, action=STORE_ACTION, help=CARDINALITY_ARG_HELP)
+    parser.add_argument(
+        NOMINAL_FRACTION_ARG, type=float, default=0.25, action=STORE_ACTION, help=NOMINAL_FRACTION_ARG_HELP
+    )
+    parser.add_argument(ARCHIVE_LEVELS_ARG, type=int, default=1, action=STORE_ACTION, help=ARCHIVE_LEVELS_ARG_HELP)
+    parser.add_argument(UNREADABLE_ARG, type=int, default=2, action=STORE_ACTION, help=UNREADABLE_ARG_HELP)
+    parser.add_argument(SEED_ARG, type=int, default=0, action=STORE_ACTION, help=SEED_ARG_HELP)
+    parser.add_argument(
+        KEY_WORDS_ARG, nargs='+', default=DEFAULT_KEY_WORDS, action=STORE_ACTION, help=BENCHMARK_KEY_WORDS_ARG_HELP
+    )
+    parser.add_argument(REPEAT_ARG, type=int, default=1, action=STORE_ACTION, help=REPEAT_ARG_HELP)
+    parser.add_argument(BASELINE_ARG, type=str, action=STORE_ACTION, help=BASELINE_ARG_HELP)
+    parser.add_argument(THRESHOLD_ARG, type=float, default=0.2, action=STORE_ACTION, help=THRESHOLD_ARG_HELP)
+    parser.add_argument(OUTPUT_ARG, type=str, action=STORE_ACTION, help=OUTPUT_ARG_HELP)
+
+    return parser.parse_args()
+
+
+if __name__ == MAIN_NAME:
+    args: Namespace = get_args()
+
+    generator: SyntheticDataGenerator = SyntheticDataGenerator(
+        n_dirs=args.dirs, depth=args.depth, n_files=args.files, n_rows=args.rows, n_cols=args.cols,
+        cardinality=args.cardinality, nominal_fraction=args.nominal_fraction, archive_levels=args.archive_levels,
+        n_unreadable=args.unreadable, seed=args.seed
+    )
+    stage_benchmarks: StageBenchmarks = StageBenchmarks(
+        generator=generator, data_path=BENCHMARK_DATA_PATH, key_words=args.key_words
+    )
+
+    # The parameters of the generated data are kept with the results since only results of the same data can be compared
+    comparison_args: set = {arg.lstrip(ARG_PREFIX) for arg in [BASELINE_ARG, THRESHOLD_ARG, OUTPUT_ARG]}
+    params: dict = {name: value for name, value in vars(args).items() if name not in comparison_args}
+    results: dict = {PARAMS_KEY: params, STAGES_KEY: stage_benchmarks.run(repeat=args.repeat)}
+    mismatch_lines: list = []
+    regression_lines: list = []
+
+    if args.baseline is not None:
+        with open(args.baseline, READ_OPT) as f:
+            baseline: dict = load(f)
+
+        mismatch_lines: list = StageBenchmarks.find_param_mismatches(results=results, baseline=baseline)
+        regression_lines: list = StageBenchmarks.find_regressions(
+            results=results, baseline=baseline, threshold=args.threshold
+        )
+
+    if args.output is None:
+        print(dumps(results, indent=JSON_INDENT))
+    else:
+        with open(args.output, WRITE_OPT) as f:
+            dump(results, f, indent=JSON_INDENT)
+
+    for line in mismatch_lines + regression_lines:
+        print(line, file=sys.stderr)
+
+    # A baseline of different data is a mistake in how the benchmarks were run rather than a regression
+    if len(mismatch_lines) > 0:
+        sys.exit(2)
+
+    if len(regression_lines) > 0:
+        sys.exit(1)
@@ -0,0 +1 @@
+"""Package containing the benchmarks of each stage of inspecting csv files and the data they are run on"""
@@ -0,0 +1,211 @@
+"""Module for the synthetic data generator class"""
+
+from itertools import cycle
+from numpy import array, nan, ndarray
+from numpy.random import RandomState
+from os import listdir, mkdir, rename
+from os.path import basename, isdir, join, relpath
+from pandas import DataFrame
+from shutil import rmtree
+from tarfile import open as open_tar
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from strings.benchmark import (
+    ADNI_COL_NAMES, ADNI_NOMINAL_VALUES, COL_NAME, CSV_NAME, DIR_NAME, NOMINAL_VALUE, UNREADABLE_CSV_BYTES,
+    UNREADABLE_CSV_NAME, UNREADABLE_CSV_ROWS, WRITE_BYTES_OPT, WRITE_OPT
+)
+from strings.extract_handler import TAR_EXTENSION, TGZ_EXTENSION, ZIP_EXTENSION
+
+
+class SyntheticDataGenerator:
+    """
+    Generates a data directory of synthetic csv files that resemble the ADNI data the inspector is used on, with the
+    shape of the directory tree and of the csv files given as parameters so that the benchmarks can be run at any scale.
+    The same parameters and seed always generate the same data.
+    """
+
+    # The fraction of the values in each column that are nans
+    NAN_FRACTION: float = 0.05
+
+    # The modes for writing the archives that the top level directories are nested in, taking turns
+    TAR_WRITE_MODES: dict = {TAR_EXTENSION: 'w', TGZ_EXTENSION: 'w:gz'}
+
+    def __init__(
+        self, n_dirs: int, depth: int, n_files: int, n_rows: int, n_cols: int, cardinality: int,
+        nominal_fraction: float, archive_levels: int, n_unreadable: int, seed: int
+    ):
+        assert n_dirs >= 0 and depth >= 0 and n_files >= 0 and n_unreadable >= 0
+        assert n_rows > 0 and n_cols > 0 and cardinality > 0
+        assert 0 <= nominal_fraction <= 1
+        assert archive_levels >= 0
+        assert n_dirs == 0 or depth > 0
+
+        self._n_dirs: int = n_dirs
+        self._depth: int = depth
+        self._n_files: int = n_files
+        self._n_rows: int = n_rows
+        self._n_cols: int = n_cols
+        self._cardinality: int = cardinality
+        self._nominal_fraction: float = nominal_fraction
+        self._archive_levels: int = archive_levels
+        self._n_unreadable: int = n_unreadable
+        self._seed: int = seed
+
+    def generate(self, data_path: str):
+        """
+        Generates the data directory, replacing it if it already exists
+
+        @param data_path: The path to the data directory
+        """
+
+        if isdir(data_path):
+            rmtree(data_path)
+
+        mkdir(data_path)
+
+        random: RandomState = RandomState(self._seed)
+        dir_paths: list = self._make_dirs(data_path=data_path, random=random)
+
+        # The csv files are spread randomly across the data directory and the directories below it
+        for i in range(self._n_files):
+            dir_path: str = dir_paths[random.randint(len(dir_paths))]
+            self._make_csv(csv_path=join(dir_path, CSV_NAME.format(i)), random=random)
+
+        for i in range(self._n_unreadable):
+            dir_path: str = dir_paths[random.randint(len(dir_paths))]
+            SyntheticDataGenerator._make_unreadable_csv(
+                csv_path=join(dir_path, UNREADABLE_CSV_NAME.format(i)), decodable=i % 2 == 0
+            )
+
+        extensions: cycle = cycle([ZIP_EXTENSION, TAR_EXTENSION, TGZ_EXTENSION])
+
+        for name in sorted(listdir(data_path)):
+            dir_path: str = join(data_path, name)
+
+            if isdir(dir_path):
+                self._nest_in_archives(dir_path=dir_path, extensions=extensions)
+
+    def _make_dirs(self, data_path: str, random: RandomState) -> list:
+        """
+        Makes the directories below the data directory, each one inside a random directory that is not yet at the
+        maximum depth
+
+        @param data_path: The path to the data directory
+        @param random: The random state of the generation
+        @return: The paths of the data directory and the directories below it
+        """
+
+        dir_paths: list = [data_path]
+        depths: list = [0]
+
+        for i in range(self._n_dirs):
+            parents: list = [j for j, depth in enumerate(depths) if depth < self._depth]
+            parent: int = parents[random.randint(len(parents))]
+
+            dir_path: str = join(dir_paths[parent], DIR_NAME.format(i))
+            mkdir(dir_path)
+
+            dir_paths.append(dir_path)
+            depths.append(depths[parent] + 1)
+
+        return dir_paths
+
+    def _make_csv(self, csv_path: str, random: RandomState):
+        """
+        Makes a csv file with a mix of nominal, integer and float columns that contain nans
+
+        @param csv_path: The path to the csv file
+        @param random: The random state of the generation
+        """
+
+        n_nominal: int = round(self._n_cols * self._nominal_fraction)
+        n_nans: int = int(self._n_rows * SyntheticDataGenerator.NAN_FRACTION)
+        cols: dict = {}
+
+        for i in range(self._n_cols):
+            col_name: str = COL_NAME.format(ADNI_COL_NAMES[i % len(ADNI_COL_NAMES)], i)
+
+            if i < n_nominal:
+                classes: ndarray = array([
+                    NOMINAL_VALUE.format(ADNI_NOMINAL_VALUES[j % len(ADNI_NOMINAL_VALUES)], j)
+                    for j in range(self._cardinality)
+                ], dtype=object)
+                col: ndarray = classes[random.randint(self._cardinality, size=self._n_rows)]
+            elif i % 2 == 0:
+                # Integer columns without nans are parsed as integers, so only the float columns have nans
+                cols[col_name] = random.randint(100000, size=self._n_rows)
+                continue
+            else:
+                col: ndarray = random.normal(size=self._n_rows)
+
+            col[random.randint(self._n_rows, size=n_nans)] = nan
+            cols[col_name] = col
+
+        DataFrame(cols).to_csv(csv_path, index=False)
+
+    @staticmethod
+    def _make_unreadable_csv(csv_path: str, decodable: bool):
+        """
+        Makes a csv file that cannot be parsed
+
+        @param csv_path: The path to the csv file
+        @param decodable: Whether the csv file can be decoded, in which case its rows have different numbers of fields
+        """
+
+        if decodable:
+            with open(csv_path, WRITE_OPT) as f:
+                f.write(UNREADABLE_CSV_ROWS)
+        else:
+            with open(csv_path, WRITE_BYTES_OPT) as f:
+                f.write(UNREADABLE_CSV_BYTES)
+
+    def _nest_in_archives(self, dir_path: str, extensions: cycle):
+        """
+        Replaces a directory with an archive of it, which is itself put in a directory of the same name and archived
+        for each further archive level, so that extracting the archives one after another restores the directory
+
+        @param dir_path: The path to the directory
+        @param extensions: The extensions of the archives to take turns creating, which determine their formats
+        """
+
+        archive_path: str = None
+
+        for _ in range(self._archive_levels):
+            if archive_path is not None:
+                mkdir(dir_path)
+                rename(archive_path, join(dir_path, basename(archive_path)))
+
+            extension: str = next(extensions)
+            archive_path: str = dir_path + extension
+
+            if extension == ZIP_EXTENSION:
+                with ZipFile(archive_path, WRITE_OPT, compression=ZIP_DEFLATED) as zip_file:
+                    for file_path in SyntheticDataGenerator._list_files(dir_path=dir_path):
+                        zip_file.write(file_path, arcname=relpath(file_path, dir_path))
+            else:
+                with open_tar(archive_path, SyntheticDataGenerator.TAR_WRITE_MODES[extension]) as tar_file:
+                    for name in sorted(listdir(dir_path)):
+                        tar_file.add(join(dir_path, name), arcname=name)
+
+            rmtree(dir_path)
+
+    @staticmethod
+    def _list_files(dir_path: str) -> list:
+        """
+        Lists the files below a directory
+
+        @param dir_path: The path to the directory
+        @return: The paths of the files, sorted
+        """
+
+        file_paths: list = []
+
+        for name in sorted(listdir(dir_path)):
+            path: str = join(dir_path, name)
+
+            if isdir(path):
+                file_paths.extend(SyntheticDataGenerator._list_files(dir_path=path))
+            else:
+                file_paths.append(path)
+
+        return file_paths
@@ -0,0 +1,209 @@
+"""Module for the stage benchmarks class"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os.path import getsize
+from pandas import DataFrame, read_csv
+from pandas.errors import ParserError
+from shutil import rmtree
+from time import perf_counter
+
+from benchmarks.data_generator import SyntheticDataGenerator
+from handler.extract_handler import ExtractHandler
+from handler.inspect_handler.csv_object import CSVObject, NumericColumns
+from handler.inspect_handler.inspector import Inspector
+from handler.inspect_handler.key_word_matcher import KeyWordMatcher
+from handler.utils import get_compression, get_csv_paths
+from strings.args import THREAD_BACKEND
+from strings.benchmark import (
+    BASELINE_SECONDS_KEY, BYTES_KEY, ERRORS_KEY, EXTRACT_ALL_GLOB, EXTRACT_STAGE, FILES_KEY, MATCH_STAGE,
+    PARAM_MISMATCH_LINE, PARAMS_KEY, PARSE_STAGE, PRINT_STAGE, REGRESSED_KEY, REGRESSION_LINE, ROWS_KEY, SECONDS_KEY,
+    STAGES_KEY, SUMMARIZE_STAGE, THRESHOLD_KEY, WALK_STAGE
+)
+
+
+class StageBenchmarks:
+    """
+    Times each stage of inspecting a generated data directory on its own: extracting its compressed files, walking it
+    for csv files, parsing them, summarizing their columns, matching key words against the summaries and printing the
+    information of the relevant csv files. The results can be compared against those of a previous run to find the
+    stages that regressed.
+    """
+
+    # A stage is never a regression if it is slower by less than this, since such short times are mostly noise
+    MIN_REGRESSION_SECONDS: float = 0.05
+
+    def __init__(self, generator: SyntheticDataGenerator, data_path: str, key_words: list):
+        self._generator: SyntheticDataGenerator = generator
+        self._data_path: str = data_path
+        self._key_words: list = key_words
+
+    def run(self, repeat: int) -> dict:
+        """
+        Generates the data directory and times each stage on it, as many times as given
+
+        @param repeat: The number of times to run the stages
+        @return: The results of the fastest run of each stage mapped to by the name of the stage
+        """
+
+        assert repeat > 0
+
+        stages: dict = {}
+
+        for _ in range(repeat):
+            # Extracting changes the data directory so it is generated again each time
+            self._generator.generate(data_path=self._data_path)
+
+            try:
+                for stage, results in self._run_stages().items():
+                    if stage not in stages or results[SECONDS_KEY] < stages[stage][SECONDS_KEY]:
+                        stages[stage] = results
+            finally:
+                rmtree(self._data_path)
+
+        return stages
+
+    def _run_stages(self) -> dict:
+        """
+        Times each stage on the generated data directory
+
+        @return: The results of each stage mapped to by the name of the stage
+        """
+
+        stages: dict = {}
+
+        # The output of extracting and printing is discarded so that only the time to produce it is measured
+        with redirect_stdout(StringIO()):
+            start: float = perf_counter()
+            ExtractHandler.extract(
+                data_path=self._data_path, workers=1, backend=THREAD_BACKEND, only=[EXTRACT_ALL_GLOB]
+            )
+            stages[EXTRACT_STAGE] = {SECONDS_KEY: perf_counter() - start}
+
+        start: float = perf_counter()
+        csv_paths: list = list(get_csv_paths(data_path=self._data_path))
+        stages[WALK_STAGE] = {SECONDS_KEY: perf_counter() - start, FILES_KEY: len(csv_paths)}
+
+        stages.update(StageBenchmarks._parse_and_summarize(csv_paths=csv_paths))
+
+        # The csv objects are built beforehand so that matching only measures searching their summaries
+        matcher: KeyWordMatcher = KeyWordMatcher(key_words=self._key_words)
+        csv_objects: list = []
+        for file_path, rel_path in csv_paths:
+            csv_obj: CSVObject = CSVObject(csv_path=file_path)
+            csv_obj.load_values()
+            csv_objects.append((rel_path, csv_obj))
+
+        start: float = perf_counter()
+        relevant_csv_objects: dict = {
+            rel_path: csv_obj for rel_path, csv_obj in csv_objects
+            if Inspector._is_relevant(csv_obj=csv_obj, rel_path=rel_path, matcher=matcher)
+        }
+        stages[MATCH_STAGE] = {SECONDS_KEY: perf_counter() - start, FILES_KEY: len(relevant_csv_objects)}
+
+        with redirect_stdout(StringIO()):
+            start: float = perf_counter()
+            for output_line in Inspector.get_csv_objects_info(csv_objects=relevant_csv_objects, verbose=True):
+                print(output_line)
+            stages[PRINT_STAGE] = {SECONDS_KEY: perf_counter() - start}
+
+        return stages
+
+    @staticmethod
+    def _parse_and_summarize(csv_paths: list) -> dict:
+        """
+        Times parsing each csv file into a data frame and, separately, summarizing the columns of each data frame the
+        way a csv object does
+
+        @param csv_paths: The paths to the csv files and their paths relative to the data directory
+        @return: The results of the parse and summarize stages mapped to by the names of the stages
+        """
+
+        parse_seconds: float = 0
+        summarize_seconds: float = 0
+        n_bytes: int = 0
+        n_rows: int = 0
+        n_errors: int = 0
+
+        for file_path, _ in csv_paths:
+            n_bytes += getsize(file_path)
+
+            start: float = perf_counter()
+            try:
+                df: DataFrame = read_csv(file_path, compression=get_compression(file_name=file_path), low_memory=False)
+            except (ParserError, UnicodeDecodeError):
+                n_errors += 1
+                continue
+            finally:
+                parse_seconds += perf_counter() - start
+
+            start: float = perf_counter()
+            numeric_cols: NumericColumns = NumericColumns(df=df, count_nans=False)
+            CSVObject._get_nominal_cols(df=df, numeric_cols=numeric_cols)
+            summarize_seconds += perf_counter() - start
+
+            n_rows += len(df)
+
+        return {
+            PARSE_STAGE: {
+                SECONDS_KEY: parse_seconds, FILES_KEY: len(csv_paths), BYTES_KEY: n_bytes, ROWS_KEY: n_rows,
+                ERRORS_KEY: n_errors
+            },
+            SUMMARIZE_STAGE: {SECONDS_KEY: summarize_seconds, ROWS_KEY: n_rows}
+        }
+
+    @staticmethod
+    def find_param_mismatches(results: dict, baseline: dict) -> list:
+        """
+        Compares the parameters of the generated data against those of the baseline, since only the times of the same
+        data can be compared
+
+        @param results: The results of the benchmarks
+        @param baseline: The results of a previous run of the benchmarks
+        @return: The lines describing each parameter that differs from the baseline, which is empty if none do
+        """
+
+        params: dict = results.get(PARAMS_KEY, {})
+        baseline_params: dict = baseline.get(PARAMS_KEY, {})
+
+        return [
+            PARAM_MISMATCH_LINE.format(name, baseline_params.get(name), params.get(name))
+            for name in sorted(set(params) | set(baseline_params)) if params.get(name) != baseline_params.get(name)
+        ]
+
+    @staticmethod
+    def find_regressions(results: dict, baseline: dict, threshold: float) -> list:
+        """
+        Compares the time of each stage against the baseline, marking each stage with its baseline time and whether it
+        regressed. Nothing is compared if the parameters of the generated data differ from those of the baseline.
+
+        @param results: The results of the benchmarks, whose stages are marked
+        @param baseline: The results of a previous run of the benchmarks
+        @param threshold: The fraction by which a stage can be slower than in the baseline before it is a regression
+        @return: The lines describing each regression
+        """
+
+        assert threshold >= 0
+
+        if len(StageBenchmarks.find_param_mismatches(results=results, baseline=baseline)) > 0:
+            return []
+
+        results[THRESHOLD_KEY] = threshold
+        regression_lines: list = []
+
+        for stage, stage_results in results[STAGES_KEY].items():
+            if stage not in baseline[STAGES_KEY]:
+                continue
+
+            seconds: float = stage_results[SECONDS_KEY]
+            baseline_seconds: float = baseline[STAGES_KEY][stage][SECONDS_KEY]
+            regressed: bool = seconds > baseline_seconds * (1 + threshold) and \
+                seconds - baseline_seconds >= StageBenchmarks.MIN_REGRESSION_SECONDS
+
+            stage_results[BASELINE_SECONDS_KEY] = baseline_seconds
+            stage_results[REGRESSED_KEY] = regressed
+
+            if regressed:
+                regression_lines.append(REGRESSION_LINE.format(stage, seconds, baseline_seconds))
+
+        return regression_lines
@@ -0,0 +1,167 @@
+"""Module for the archive walker class"""
+
+from io import BytesIO
+from os.path import join
+from shutil import copyfileobj
+from tarfile import open as open_tar, TarError, TarFile
+from tempfile import TemporaryFile
+from typing import IO, Iterator
+from zipfile import BadZipFile, ZipFile
+
+from handler.utils import get_compressed_file_name, get_member_name, is_compressed_dir
+from strings.extract_handler import ARCHIVE_PATH_SEPARATOR, TAR_READ_MODE, ZIP_EXTENSION
+from strings.inspect_handler import READ_BYTES_OPT
+
+
+class ArchiveWalker:
+    """
+    Walks through each file in a compressed-directory file and the compressed-directory files nested in it without
+    extracting them, treating each one as the directory it would be extracted to. The files are read straight from the
+    archives, in the order they are stored so that compressed archives are only decompressed once.
+    """
+
+    # Nested zip files are read out of order, so they are copied into memory first, or into a temporary file if larger
+    SPOOL_MAX_BYTES: int = 64 * 1024 * 1024
+
+    def __init__(self, archive_path: str, rel_path: str):
+        assert is_compressed_dir(file_name=archive_path)
+
+        self._archive_path: str = archive_path
+        self._rel_path: str = rel_path
+
+    def __iter__(self) -> Iterator[tuple]:
+        """
+        Yields the files in the archive and its nested archives along with their paths relative to the walked directory,
+        which is where the archive would be extracted to. Each file must be read before the next one is yielded.
+
+        @return: Generator of tuples containing the relative path of a file, the open file and its size in bytes
+        """
+
+        try:
+            with open(self._archive_path, READ_BYTES_OPT) as archive_file:
+                yield from ArchiveWalker._walk(archive_file=archive_file, rel_path=self._rel_path, nested_size=None)
+        except (BadZipFile, EOFError, TarError):
+            # An archive that cannot be read has no files to walk, just as it could not be extracted
+            return
+
+    @staticmethod
+    def _walk(archive_file: IO, rel_path: str, nested_size: int) -> Iterator[tuple]:
+        """
+        Yields the files in an archive, walking the archives nested in it as well
+
+        @param archive_file: The open archive
+        @param rel_path: The relative path of the archive
+        @param nested_size: The size of the archive in bytes if it is inside another archive, in which case seeking
+        through it is slow, otherwise None
+        @return: Generator of tuples containing the relative path of a file, the open file and its size in bytes
+        """
+
+        head, archive_name = ArchiveWalker._split(rel_path=rel_path)
+        rel_dir_path: str = join(head, get_compressed_file_name(file_name=archive_name))
+
+        if archive_name.endswith(ZIP_EXTENSION):
+            if nested_size is not None:
+                # SpooledTemporaryFile is not seekable as far as zipfile can tell before Python 3.11
+                spooled_file: IO = BytesIO() if nested_size <= ArchiveWalker.SPOOL_MAX_BYTES else TemporaryFile()
+
+                with spooled_file:
+                    copyfileobj(archive_file, spooled_file)
+                    spooled_file.seek(0)
+                    yield from ArchiveWalker._walk_zip(archive_file=spooled_file, rel_dir_path=rel_dir_path)
+            else:
+                yield from ArchiveWalker._walk_zip(archive_file=archive_file, rel_dir_path=rel_dir_path)
+        else:
+            # The compression of a tar file, if any, is detected from its contents. Its members are read in order so
+            # even a nested one is only read forwards.
+            with open_tar(fileobj=archive_file, mode=TAR_READ_MODE) as tar_file:
+                yield from ArchiveWalker._walk_tar(tar_file=tar_file, rel_dir_path=rel_dir_path)
+
+    @staticmethod
+    def _walk_zip(archive_file: IO, rel_dir_path: str) -> Iterator[tuple]:
+        """
+        Yields the files in a zip file
+
+        @param archive_file: The open zip file
+        @param rel_dir_path: The relative path of the directory the zip file would be extracted to
+        @return: Generator of tuples containing the relative path of a file, the open file and its size in bytes
+        """
+
+        with ZipFile(archive_file) as zip_file:
+            for member in zip_file.infolist():
+                member_rel_path: str = ArchiveWalker._join_member(
+                    rel_dir_path=rel_dir_path, member_name=member.filename
+                )
+
+                if member.is_dir() or member_rel_path is None:
+                    continue
+
+                with zip_file.open(member) as member_file:
+                    yield from ArchiveWalker._walk_member(
+                        member_file=member_file, rel_path=member_rel_path, size=member.file_size
+                    )
+
+    @staticmethod
+    def _walk_tar(tar_file: TarFile, rel_dir_path: str) -> Iterator[tuple]:
+        """
+        Yields the files in a tar file
+
+        @param tar_file: The open tar file
+        @param rel_dir_path: The relative path of the directory the tar file would be extracted to
+        @return: Generator of tuples containing the relative path of a file, the open file and its size in bytes
+        """
+
+        for member in tar_file:
+            member_rel_path: str = ArchiveWalker._join_member(rel_dir_path=rel_dir_path, member_name=member.name)
+
+            if not member.isfile() or member_rel_path is None:
+                continue
+
+            with tar_file.extractfile(member) as member_file:
+                yield from ArchiveWalker._walk_member(
+                    member_file=member_file, rel_path=member_rel_path, size=member.size
+                )
+
+    @staticmethod
+    def _walk_member(member_file: IO, rel_path: str, size: int) -> Iterator[tuple]:
+        """
+        Yields a file in an archive, or the files in it if it is an archive itself
+
+        @param member_file: The open file
+        @param rel_path: The relative path of the file
+        @param size: The size of the file in bytes
+        @return: Generator of tuples containing the relative path of a file, the open file and its size in bytes
+        """
+
+        if is_compressed_dir(file_name=rel_path):
+            yield from ArchiveWalker._walk(archive_file=member_file, rel_path=rel_path, nested_size=size)
+        else:
+            yield rel_path, member_file, size
+
+    @staticmethod
+    def _join_member(rel_dir_path: str, member_name: str) -> str:
+        """
+        Creates the relative path of a file in an archive
+
+        @param rel_dir_path: The relative path of the directory the archive would be extracted to
+        @param member_name: The name of the file in the archive
+        @return: The relative path or None if the file would be extracted outside of the directory
+        """
+
+        member_name: str = get_member_name(member_name=member_name)
+
+        if member_name is None:
+            return None
+
+        return join(rel_dir_path, member_name)
+
+    @staticmethod
+    def _split(rel_path: str) -> tuple:
+        """
+        Splits a relative path into its parent directory and its name
+
+        @param rel_path: The relative path
+        @return: The relative path of the parent directory, being empty for the walked directory, and the name
+        """
+
+        head, _, name = rel_path.rpartition(ARCHIVE_PATH_SEPARATOR)
+        return head, name
@@ -0,0 +1,122 @@
+"""Module for the directory walker class"""
+
+from os import DirEntry, scandir, stat, stat_result
+from os.path import isdir, join
+from typing import Iterator
+
+
+class DirectoryWalker:
+    """
+    Iteratively walks through each file in a directory and its subdirectories, listing every directory exactly once.
+    Symbolic links to directories are followed unless they lead back to a directory that is already being walked.
+    Directories that cannot be listed are skipped like os.walk skips them.
+    """
+
+    def __init__(self, dir_path: str):
+        assert isdir(dir_path)
+
+        # Each pending directory is its path, its path relative to the walked directory and the chain of the identities
+        # of it and the directories it is in, each identity being the device and inode of a directory
+        dir_stat: stat_result = stat(dir_path)
+        self._pending_dirs: list = [(dir_path, None, ((dir_stat.st_dev, dir_stat.st_ino), None))]
+
+    def __iter__(self) -> Iterator[tuple]:
+        """
+        Yields the files in the walked directory and its subdirectories along with their paths relative to the walked
+        directory
+
+        @return: Generator of tuples containing the directory of the file, the path to the file and its relative path
+        """
+
+        while len(self._pending_dirs) > 0:
+            dir_path, rel_dir_path, identities = self._pending_dirs.pop()
+            files, sub_dirs = DirectoryWalker._list_dir(dir_path=dir_path)
+
+            for file_name in files:
+                file_path: str = join(dir_path, file_name)
+                yield dir_path, file_path, DirectoryWalker._join_rel(rel_dir_path=rel_dir_path, name=file_name)
+
+            # Push the subdirectories in reverse so they are walked in the order they were listed
+            for entry in reversed(sub_dirs):
+                self._push_dir(entry=entry, rel_dir_path=rel_dir_path, identities=identities)
+
+    def _push_dir(self, entry: DirEntry, rel_dir_path: str, identities: tuple):
+        """
+        Schedules a subdirectory of a directory being walked, skipping those that lead back to a directory it is in
+
+        @param entry: The directory entry of the subdirectory
+        @param rel_dir_path: The relative path of the directory the subdirectory is in
+        @param identities: The chain of the identities of the directory the subdirectory is in and those it is in
+        """
+
+        # The stat follows symbolic links so that a link to a directory has the identity of where it leads
+        try:
+            entry_stat: stat_result = entry.stat()
+        except OSError:
+            return
+
+        identity: tuple = (entry_stat.st_dev, entry_stat.st_ino)
+
+        if DirectoryWalker._in_chain(identity=identity, identities=identities):
+            return
+
+        rel_path: str = DirectoryWalker._join_rel(rel_dir_path=rel_dir_path, name=entry.name)
+        self._pending_dirs.append((entry.path, rel_path, (identity, identities)))
+
+    @staticmethod
+    def _list_dir(dir_path: str) -> tuple:
+        """
+        Lists a directory a single time, separating its files from its subdirectories using the cached entry types. A
+        directory that cannot be listed, such as one without read permission, has whatever was listed before the error.
+
+        @param dir_path: The path to the directory to list
+        @return: The names of the files and the directory entries of the subdirectories
+        """
+
+        files: list = []
+        sub_dirs: list = []
+
+        try:
+            with scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        sub_dirs.append(entry)
+                    elif entry.is_file():
+                        files.append(entry.name)
+        except OSError:
+            pass
+
+        return files, sub_dirs
+
+    @staticmethod
+    def _in_chain(identity: tuple, identities: tuple) -> bool:
+        """
+        Determines whether the identity of a directory is already in a chain of identities, meaning walking it would
+        cause a loop
+
+        @param identity: The device and inode of the directory
+        @param identities: The chain of identities, each being a tuple of an identity and the chain of its parents
+        @return: The truth value of the above mentioned query
+        """
+
+        while identities is not None:
+            if identities[0] == identity:
+                return True
+
+            identities: tuple = identities[1]
+        return False
+
+    @staticmethod
+    def _join_rel(rel_dir_path: str, name: str) -> str:
+        """
+        Creates a path relative to the walked directory
+
+        @param rel_dir_path: The relative path of the parent directory, being None for the walked directory itself
+        @param name: The name of the file or directory in the parent directory
+        @return: The relative path
+        """
+
+        if rel_dir_path is None:
+            return name
+
+        return join(rel_dir_path, name)
@@ -1,98 +1,573 @@
 """Module for the extract handler class"""
 
-from argparse import Namespace
-from os import mkdir, system
-from os.path import isdir, isfile, join, split
-
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from contextlib import nullcontext
+from errno import EINVAL, ENOSYS, ENOTSOCK, EOPNOTSUPP, EXDEV
+from fnmatch import fnmatchcase
+from functools import partial
+import os
+from os import makedirs, mkdir, remove, rename, sep, utime
+from os.path import basename, dirname, exists, getsize, isdir, isfile, join, split
+from shutil import copyfileobj, copystat, rmtree
+from struct import unpack
+from tarfile import open as open_tar, TarError
+from typing import IO, Iterator
+from zipfile import BadZipFile, sizeFileHeader, stringFileHeader, structFileHeader, ZIP_STORED, ZipFile, ZipInfo
+from zlib import error as ZlibError
+
+from handler.directory_walker import DirectoryWalker
+from handler.extract_journal import ExtractJournal
 from handler.handler import Handler
+from handler.profiler import FileProfile, Profiler
+from handler.telemetry import Telemetry
+from handler.utils import (
+    get_compression, get_compressed_file_name, get_decompressed_name, get_executor, get_member_name, is_compressed_dir,
+    open_decompressed, positive_int
+)
+from strings.args import (
+    BACKEND_ARG, BACKEND_ARG_HELP, EXTRACT_WORKERS_ARG_HELP, ONLY_ARG, ONLY_ARG_HELP, PROCESS_BACKEND, STORE_ACTION,
+    THREAD_BACKEND, WORKERS_ARG
+)
 from strings.extract_handler import *
+from strings.profiler import EXTRACT_STAGE
 
 
 class ExtractHandler(Handler):
-    """The handler for extracting all the compressed files in the data directory"""
+    """
+    The handler for extracting all the compressed files in the data directory. The compressed files are extracted in
+    this process with tarfile, zipfile and gzip, by a pool of workers if there is more than one, and the compressed
+    files found in each extracted directory are queued to be extracted as well. Each compressed file is extracted next
+    to its destination and only renamed to it once complete, and its progress is kept in a journal so that an
+    interrupted run can be resumed by running it again. Only the files whose names match the globs to extract are
+    written, along with the compressed files nested in them which may contain more such files. A compressed file is
+    only removed once every file in it was extracted, so a .tar or .zip file holding files that were not selected is
+    kept next to its extracted directory. The files that are stored in a .tar or .zip file without being compressed
+    are copied straight out of it by the kernel where possible.
+    """
+
+    # The errors that mean a compressed file could not be extracted, rather than that something is wrong with the code
+    EXTRACT_ERRORS: tuple = (BadZipFile, EOFError, OSError, TarError, ZlibError)
+
+    # The errors that mean the kernel cannot copy between two files, in which case they are copied through a buffer
+    COPY_UNSUPPORTED_ERRNOS: tuple = (EINVAL, ENOSYS, ENOTSOCK, EOPNOTSUPP, EXDEV)
+
+    # The flag of a file in a zip file that is encrypted and the fields of its local header that give the lengths of
+    # the name and extra field which come between the local header and its data
+    ZIP_ENCRYPTED_FLAG: int = 0x1
+    ZIP_NAME_LENGTH_FIELD: int = 10
+    ZIP_EXTRA_LENGTH_FIELD: int = 11
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the extract handler
+
+        @param parser: The parser to configure
+        """
+
+        Handler.configure_parser(parser)
+
+        parser.add_argument(
+            WORKERS_ARG, type=positive_int, default=1, action=STORE_ACTION, required=False,
+            help=EXTRACT_WORKERS_ARG_HELP
+        )
+
+        # Decompressing and writing files mostly happens outside of the interpreter lock so threads are the default
+        parser.add_argument(
+            BACKEND_ARG, type=str, default=THREAD_BACKEND, choices=[PROCESS_BACKEND, THREAD_BACKEND],
+            action=STORE_ACTION, required=False, help=BACKEND_ARG_HELP
+        )
+        parser.add_argument(
+            ONLY_ARG, nargs='+', default=[CSV_GLOB], action=STORE_ACTION, required=False, help=ONLY_ARG_HELP
+        )
+
+        Profiler.configure_parser(parser)
+        Telemetry.configure_parser(parser)
 
     @staticmethod
     def handle(args: Namespace):
         """
-        Extracts all the compressed files in the data directory so they can be queried
+        Extracts all the compressed files in the data directory so they can be queried, reporting whether each one was
+        extracted as soon as it is done
 
         @param args: The arguments for the extract handler
         """
 
-        Handler._directory_walk(dir_path=args.data_path, action=ExtractHandler._extract_file)
+        profiler: Profiler = Profiler(enabled=args.profile, top=args.profile_top, pstats_path=args.profile_pstats)
+        telemetry: Telemetry = Telemetry(
+            metrics_path=args.metrics_file, progress=args.progress, interval=args.metrics_interval
+        )
+
+        try:
+            ExtractHandler.extract(
+                data_path=args.data_path, workers=args.workers, backend=args.backend, only=args.only, profiler=profiler,
+                telemetry=telemetry
+            )
+        finally:
+            telemetry.close()
+
+        profiler.report()
+
+    @staticmethod
+    def extract(
+        data_path: str, workers: int, backend: str, only: list, on_found: callable = None, profiler: Profiler = None,
+        telemetry: Telemetry = None
+    ):
+        """
+        Extracts all the compressed files in a data directory, reporting whether each one was extracted as soon as it is
+        done
+
+        @param data_path: The path to the data directory
+        @param workers: The number of workers that extract compressed files in parallel
+        @param backend: Whether the workers are processes or threads
+        @param only: The globs that the names of the files to extract match
+        @param on_found: The function called with the path to each file that is not extracted, from the data directory
+        or from an extraction, and its path relative to the data directory, or None to ignore those files
+        @param profiler: The profiler to add the profile of extracting each compressed file to or None if not profiling
+        @param telemetry: The telemetry to record each compressed file starting and finishing in or None to not record
+        them
+        """
+
+        if profiler is None:
+            profiler: Profiler = Profiler(enabled=False)
+
+        if telemetry is None:
+            telemetry: Telemetry = Telemetry()
+
+        n_extracted: int = 0
+        n_failed: int = 0
+
+        journal: ExtractJournal = ExtractJournal(data_path=data_path)
+        finished: bool = False
+
+        try:
+            extracted_files: Iterator[tuple] = ExtractHandler._extract_all(
+                data_path=data_path, workers=workers, backend=backend, only=only, journal=journal, on_found=on_found,
+                profile=profiler.is_enabled() or telemetry.is_enabled(), telemetry=telemetry
+            )
+
+            with profiler.stage(name=EXTRACT_STAGE):
+                for (_, rel_path), error, file_profile in extracted_files:
+                    profiler.add_file(file_profile=file_profile)
+                    telemetry.extract_finished(file_profile=file_profile, error=error)
+
+                    if error is None:
+                        n_extracted += 1
+                        print(EXTRACTED_LINE.format(rel_path))
+                    else:
+                        n_failed += 1
+                        print(EXTRACT_FAILED_LINE.format(rel_path, type(error), error))
+
+            finished: bool = True
+        finally:
+            journal.close(finished=finished)
+
+        print(EXTRACT_SUMMARY_MSG.format(n_extracted, n_failed))
+
+    @staticmethod
+    def _extract_all(
+        data_path: str, workers: int, backend: str, only: list, journal: ExtractJournal, on_found: callable,
+        profile: bool, telemetry: Telemetry
+    ) -> Iterator[tuple]:
+        """
+        Extracts the compressed files in a directory and its sub directories, and the compressed files that they
+        contain, from a queue of work that starts out with the compressed files in the directory
+
+        @param data_path: The path to the directory
+        @param workers: The number of workers that extract compressed files in parallel
+        @param backend: Whether the workers are processes or threads
+        @param only: The globs that the names of the files to extract match
+        @param journal: The journal to record the progress of each compressed file in
+        @param on_found: The function called with the paths of each file that is not extracted or None
+        @param profile: Whether to record the profile of extracting each compressed file
+        @param telemetry: The telemetry to record each compressed file starting in
+        @return: Generator of tuples containing the paths of each compressed file, the error that prevented it from
+        being extracted or None if it was extracted and its profile or None if not profiling
+        """
+
+        partial_paths: set = ExtractHandler._get_partial_paths(journal=journal)
+        pending_files: deque = deque()
+        ExtractHandler._plan(
+            files=ExtractHandler._find_files(dir_path=data_path, rel_dir_path=None, partial_paths=partial_paths),
+            only=only, pending_files=pending_files, journal=journal, on_found=on_found
+        )
+
+        if workers == 1:
+            while len(pending_files) > 0:
+                file_paths, resume = ExtractHandler._start(
+                    pending_files=pending_files, journal=journal, telemetry=telemetry
+                )
+                dest_path, error, file_profile = ExtractHandler._extract_file(
+                    file_paths=file_paths, resume=resume, only=only, profile=profile
+                )
+
+                ExtractHandler._finish(
+                    file_paths=file_paths, dest_path=dest_path, error=error, only=only, pending_files=pending_files,
+                    journal=journal, partial_paths=partial_paths, on_found=on_found
+                )
+                yield file_paths, error, file_profile
+
+            return
+
+        with get_executor(workers=workers, backend=backend) as executor:
+            # The paths of the compressed file that each submitted extraction is for
+            extractions: dict = {}
+
+            while len(pending_files) > 0 or len(extractions) > 0:
+                while len(pending_files) > 0:
+                    file_paths, resume = ExtractHandler._start(
+                        pending_files=pending_files, journal=journal, telemetry=telemetry
+                    )
+                    extractions[
+                        executor.submit(ExtractHandler._extract_file, file_paths, resume, only, profile)
+                    ] = file_paths
+
+                done, _ = wait(extractions, return_when=FIRST_COMPLETED)
+
+                for extraction in done:
+                    file_paths: tuple = extractions.pop(extraction)
+                    dest_path, error, file_profile = extraction.result()
+
+                    ExtractHandler._finish(
+                        file_paths=file_paths, dest_path=dest_path, error=error, only=only, pending_files=pending_files,
+                        journal=journal, partial_paths=partial_paths, on_found=on_found
+                    )
+                    yield file_paths, error, file_profile
+
+    @staticmethod
+    def _plan(files: Iterator[tuple], only: list, pending_files: deque, journal: ExtractJournal, on_found: callable):
+        """
+        Queues the compressed files among a collection of files to be extracted, recording that they are planned, and
+        passes the rest of the files on
+
+        @param files: The paths to the files and their paths relative to the data directory
+        @param only: The globs that the names of the files to extract match
+        @param pending_files: The queue of compressed files to extract
+        @param journal: The journal to record the progress of each compressed file in
+        @param on_found: The function called with the paths of each file that is not extracted or None
+        """
+
+        for file_paths in files:
+            file_path, rel_path = file_paths
+
+            # A compressed-directory file kept next to its extracted directory, since some of its files were not
+            # selected, was already extracted unless the previous run was interrupted while extracting it
+            if ExtractHandler._is_kept(file_path=file_path) and \
+                    journal.get_previous_state(rel_path=rel_path) != IN_PROGRESS_STATE:
+                continue
+
+            if ExtractHandler._is_extractable(file_name=file_path, only=only):
+                journal.record(rel_path=rel_path, state=PLANNED_STATE)
+                pending_files.append(file_paths)
+            elif on_found is not None:
+                on_found(file_paths)
+
+    @staticmethod
+    def _start(pending_files: deque, journal: ExtractJournal, telemetry: Telemetry) -> tuple:
+        """
+        Takes the next compressed file to extract off of the queue, recording that it is in progress
+
+        @param pending_files: The queue of compressed files to extract
+        @param journal: The journal to record the progress of each compressed file in
+        @param telemetry: The telemetry to record the compressed file starting in
+        @return: The paths of the compressed file and whether the previous run was interrupted while extracting it
+        """
+
+        file_paths: tuple = pending_files.popleft()
+        _, rel_path = file_paths
+
+        resume: bool = journal.get_previous_state(rel_path=rel_path) == IN_PROGRESS_STATE
+        journal.record(rel_path=rel_path, state=IN_PROGRESS_STATE)
+        telemetry.extract_started(rel_path=rel_path)
+
+        return file_paths, resume
+
+    @staticmethod
+    def _finish(
+        file_paths: tuple, dest_path: str, error: Exception, only: list, pending_files: deque, journal: ExtractJournal,
+        partial_paths: set, on_found: callable
+    ):
+        """
+        Records whether a compressed file was extracted and queues the compressed files that resulted from extracting it
+
+        @param file_paths: The path to the compressed file and its path relative to the data directory
+        @param dest_path: The path to the extracted directory or decompressed file or None if nothing was extracted
+        @param error: The error that prevented extracting the compressed file or None if it was extracted
+        @param only: The globs that the names of the files to extract match
+        @param pending_files: The queue of compressed files to extract
+        @param journal: The journal to record the progress of each compressed file in
+        @param partial_paths: The relative paths of the partial extractions left behind by the previous run
+        @param on_found: The function called with the paths of each file that is not extracted or None
+        """
+
+        _, rel_path = file_paths
+        journal.record(rel_path=rel_path, state=FAILED_STATE if error is not None else COMPLETED_STATE)
+
+        ExtractHandler._plan(
+            files=ExtractHandler._find_extracted_files(
+                file_paths=file_paths, dest_path=dest_path, partial_paths=partial_paths
+            ),
+            only=only, pending_files=pending_files, journal=journal, on_found=on_found
+        )
+
+    @staticmethod
+    def _get_partial_paths(journal: ExtractJournal) -> set:
+        """
+        Gets the partial extractions that the previous run left behind when it was interrupted, which are the partial
+        paths next to the destinations of the compressed files it was extracting
+
+        @param journal: The journal of the progress of each compressed file
+        @return: The paths of the partial extractions relative to the data directory
+        """
+
+        partial_paths: set = set()
+
+        for rel_path in journal.get_interrupted_paths():
+            if is_compressed_dir(file_name=rel_path):
+                root, file_name = split(rel_path)
+                dest_rel_path: str = join(root, get_compressed_file_name(file_name=file_name))
+            else:
+                dest_rel_path: str = get_decompressed_name(file_name=rel_path)
+
+            partial_paths.add(dest_rel_path + PARTIAL_SUFFIX)
+
+        return partial_paths
+
+    @staticmethod
+    def _find_files(dir_path: str, rel_dir_path: str, partial_paths: set) -> Iterator[tuple]:
+        """
+        Yields the files in a directory and its sub directories, apart from the partial extractions left behind by the
+        previous run
+
+        @param dir_path: The path to the directory
+        @param rel_dir_path: The path of the directory relative to the data directory or None if it is the data
+        directory
+        @param partial_paths: The relative paths of the partial extractions left behind by the previous run
+        @return: Generator of tuples containing the path to a file and its path relative to the data directory
+        """
+
+        for _, file_path, rel_path in DirectoryWalker(dir_path=dir_path):
+            if rel_dir_path is not None:
+                rel_path: str = join(rel_dir_path, rel_path)
+
+            # The partial extractions left behind by an interrupted run are removed rather than extracted further, while
+            # the files of the user that merely end in the same suffix are not
+            if len(partial_paths) > 0:
+                names: list = rel_path.split(sep)
+                if any(join(*names[:i]) in partial_paths for i in range(1, len(names) + 1)):
+                    continue
+
+            yield file_path, rel_path
+
+    @staticmethod
+    def _find_extracted_files(file_paths: tuple, dest_path: str, partial_paths: set) -> Iterator[tuple]:
+        """
+        Yields the files that resulted from extracting a compressed file, which are the files in the extracted
+        directory or the decompressed file
+
+        @param file_paths: The path to the compressed file that was extracted and its path relative to the data
+        directory
+        @param dest_path: The path to the extracted directory or decompressed file or None if nothing was extracted
+        @param partial_paths: The relative paths of the partial extractions left behind by the previous run
+        @return: Generator of tuples containing the path to a file and its path relative to the data directory
+        """
+
+        if dest_path is None:
+            return
+
+        _, rel_path = file_paths
+        dest_rel_path: str = join(dirname(rel_path), basename(dest_path))
+
+        if isdir(dest_path):
+            yield from ExtractHandler._find_files(
+                dir_path=dest_path, rel_dir_path=dest_rel_path, partial_paths=partial_paths
+            )
+        else:
+            yield dest_path, dest_rel_path
 
     @staticmethod
-    def _extract_file(root: str, file_path: str):
+    def _is_kept(file_path: str) -> bool:
         """
-        Extracts a file in a directory
+        Determines whether a file is a compressed-directory file that was kept after being extracted next to it
 
-        @param root: The directory that the file is in
-        @param file_path: The path to the file to extract
+        @param file_path: The path to the file
+        @return: The truth value of the above mentioned query
         """
 
-        if file_path.endswith(TAR_GZ_EXTENSION) or file_path.endswith(TGZ_EXTENSION):
-            ExtractHandler._extract_tar_gz(file_path=file_path, dest_dir=root)
-        elif file_path.endswith(GZ_EXTENSION):
-            ExtractHandler._extract_gz(file_path=file_path)
-        elif file_path.endswith(TAR_EXTENSION):
-            ExtractHandler._extract_tar(file_path=file_path, dest_dir=root)
-        elif file_path.endswith(ZIP_EXTENSION):
-            ExtractHandler._extract_zip(file_path=file_path, dest_dir=root)
+        if not is_compressed_dir(file_name=file_path):
+            return False
+
+        root, file_name = split(file_path)
+        return isdir(join(root, get_compressed_file_name(file_name=file_name)))
 
     @staticmethod
-    def _extract_gz(file_path: str):
+    def _is_extractable(file_name: str, only: list) -> bool:
+        """
+        Determines whether a file is a compressed file that can be extracted and that contains files to extract
+
+        @param file_name: The name of or path to the file
+        @param only: The globs that the names of the files to extract match
+        @return: The truth value of the above mentioned query
         """
-        Extracts a file with a .gz extension
+
+        if is_compressed_dir(file_name=file_name):
+            return True
+
+        return file_name.endswith(GZ_EXTENSION) and ExtractHandler._is_selected(file_name=file_name, only=only)
+
+    @staticmethod
+    def _is_selected(file_name: str, only: list) -> bool:
+        """
+        Determines whether a file should be extracted, which is when its name matches any of the globs to extract,
+        ignoring case, or when it is a compressed file that might contain or decompress to such a file
+
+        @param file_name: The name of or path to the file
+        @param only: The globs that the names of the files to extract match
+        @return: The truth value of the above mentioned query
+        """
+
+        if is_compressed_dir(file_name=file_name):
+            return True
+
+        _, file_name = split(file_name)
+
+        if any(fnmatchcase(file_name.lower(), glob.lower()) for glob in only):
+            return True
+
+        if get_compression(file_name=file_name) is not None:
+            return ExtractHandler._is_selected(file_name=get_decompressed_name(file_name=file_name), only=only)
+
+        return False
+
+    @staticmethod
+    def _extract_file(file_paths: tuple, resume: bool, only: list, profile: bool) -> tuple:
+        """
+        Extracts a compressed file in its directory and removes it. Since this may run in a separate worker process,
+        the errors that prevent extracting it are returned rather than raised, along with the profile of extracting it.
+
+        @param file_paths: The path to the compressed file to extract and its path relative to the data directory
+        @param resume: Whether the previous run was interrupted while extracting the compressed file
+        @param only: The globs that the names of the files to extract match
+        @param profile: Whether to record the profile of extracting the compressed file
+        @return: The path to the resulting extracted directory or decompressed file, or None if nothing was extracted,
+        the error that prevented extracting the compressed file or None if it was extracted and its profile or None if
+        not profiling
+        """
+
+        file_path, rel_path = file_paths
+        root, _ = split(file_path)
+
+        # The compressed file is removed once extracted so its size is taken beforehand
+        file_profile: FileProfile = FileProfile(rel_path=rel_path, n_bytes=getsize(file_path)) if profile else None
+        dest_path: str = None
+        error: Exception = None
+
+        with file_profile.record() if profile else nullcontext():
+            try:
+                if file_path.endswith(TAR_GZ_EXTENSION) or file_path.endswith(TGZ_EXTENSION):
+                    dest_path: str = ExtractHandler._extract_tar(
+                        file_path=file_path, dest_dir=root, resume=resume, only=only
+                    )
+                elif file_path.endswith(GZ_EXTENSION):
+                    dest_path: str = ExtractHandler._extract_gz(file_path=file_path, resume=resume)
+                elif file_path.endswith(TAR_EXTENSION):
+                    dest_path: str = ExtractHandler._extract_tar(
+                        file_path=file_path, dest_dir=root, resume=resume, only=only
+                    )
+                elif file_path.endswith(ZIP_EXTENSION):
+                    dest_path: str = ExtractHandler._extract_zip(
+                        file_path=file_path, dest_dir=root, resume=resume, only=only
+                    )
+            except ExtractHandler.EXTRACT_ERRORS as e:
+                error: Exception = e
+
+        return dest_path, error, file_profile
+
+    @staticmethod
+    def _extract_gz(file_path: str, resume: bool) -> str:
+        """
+        Extracts a file with a .gz extension and removes it, decompressing it in this process like gunzip would rather
+        than starting gunzip for each file
 
         @param file_path: Path to the .gz file to be extracted
+        @param resume: Whether the previous run was interrupted while extracting the .gz file
+        @return: The path to the resulting decompressed file
         """
 
         assert isfile(file_path)
 
-        command: str = GZ_EXTRACT_COMMAND.format(file_path)
-        system(command)
+        dest_path: str = get_decompressed_name(file_name=file_path)
+
+        return ExtractHandler._extract_atomically(
+            file_path=file_path, dest_path=dest_path, extract=ExtractHandler._decompress_gz, resume=resume
+        )
 
     @staticmethod
-    def _extract_tar(file_path: str, dest_dir: str):
+    def _decompress_gz(file_path: str, dest_path: str) -> bool:
         """
-        Extracts a directory with a .tar extension and removes it
+        Decompresses a .gz file, which is only extracted if the file it decompresses to is selected
 
-        @param file_path: The path to the .tar file to extract and remove
-        @param dest_dir: The destination of the resulting extracted directory
+        @param file_path: The path to the .gz file
+        @param dest_path: The path to write the decompressed file to
+        @return: Whether the whole .gz file was extracted, which it always is
         """
 
-        ExtractHandler._extract_dir(file_path=file_path, dest_dir=dest_dir, extract_command=TAR_EXTRACT_COMMAND)
+        with open_decompressed(file=file_path, compression=GZ_COMPRESSION) as gz_file:
+            with open(dest_path, WRITE_BYTES_OPT) as dest_file:
+                copyfileobj(gz_file, dest_file)
+
+        # Keep the permissions and modification time of the .gz file as gunzip does
+        copystat(file_path, dest_path)
+
+        return True
 
     @staticmethod
-    def _extract_zip(file_path: str, dest_dir):
+    def _extract_tar(file_path: str, dest_dir: str, resume: bool, only: list) -> str:
         """
-        Extracts a file with a .zip extension and removes it
+        Extracts a directory with a .tar extension and removes it. Also works with the .tar.gz and .tgz extensions since
+        the compression of a tar file is detected from its contents.
 
-        @param file_path: The path to the .zip file to extract and remove
+        @param file_path: The path to the .tar file to extract and remove
         @param dest_dir: The destination of the resulting extracted directory
+        @param resume: Whether the previous run was interrupted while extracting the .tar file
+        @param only: The globs that the names of the files to extract match
+        @return: The path to the resulting extracted directory
         """
 
-        ExtractHandler._extract_dir(file_path=file_path, dest_dir=dest_dir, extract_command=ZIP_EXTRACT_COMMAND)
+        return ExtractHandler._extract_dir(
+            file_path=file_path, dest_dir=dest_dir, resume=resume,
+            extract_members=partial(ExtractHandler._extract_tar_members, only=only)
+        )
 
     @staticmethod
-    def _extract_tar_gz(file_path, dest_dir: str):
+    def _extract_zip(file_path: str, dest_dir, resume: bool, only: list) -> str:
         """
-        Extracts a file with a .tar.gz extension and removes it. Also works with a .tgz extension.
+        Extracts a file with a .zip extension and removes it
 
-        @param file_path: The path to the .tar.gz file to extract and remove
+        @param file_path: The path to the .zip file to extract and remove
         @param dest_dir: The destination of the resulting extracted directory
+        @param resume: Whether the previous run was interrupted while extracting the .zip file
+        @param only: The globs that the names of the files to extract match
+        @return: The path to the resulting extracted directory
         """
 
-        ExtractHandler._extract_dir(file_path=file_path, dest_dir=dest_dir, extract_command=TAR_GZ_EXTRACT_COMMAND)
+        return ExtractHandler._extract_dir(
+            file_path=file_path, dest_dir=dest_dir, resume=resume,
+            extract_members=partial(ExtractHandler._extract_zip_members, only=only)
+        )
 
     @staticmethod
-    def _extract_dir(file_path: str, dest_dir: str, extract_command: str):
+    def _extract_dir(file_path: str, dest_dir: str, extract_members: callable, resume: bool) -> str:
         """
         Extracts a compressed-directory and removes its corresponding compressed-directory file
 
         @param file_path: The path to the compressed-directory file to extract and remove
         @param dest_dir: The destination of the resulting extracted directory
-        @param extract_command: The terminal-command specifying the extension of the resulting compressed-directory file
+        @param extract_members: The function that extracts the files in the compressed-directory file into a directory
+        @param resume: Whether the previous run was interrupted while extracting the compressed-directory file
+        @return: The path to the resulting extracted directory
         """
 
         assert isfile(file_path)
@@ -102,13 +577,291 @@ class ExtractHandler(Handler):
         file_name: str = ExtractHandler._get_compressed_file_name(file_path=file_path)
         dest_dir: str = join(dest_dir, file_name)
 
-        assert not isdir(dest_dir)
-        mkdir(dest_dir)
+        return ExtractHandler._extract_atomically(
+            file_path=file_path, dest_path=dest_dir, resume=resume,
+            extract=partial(ExtractHandler._extract_new_dir, extract_members=extract_members)
+        )
+
+    @staticmethod
+    def _extract_new_dir(file_path: str, dest_path: str, extract_members: callable) -> bool:
+        """
+        Extracts the files in a compressed-directory file into a new directory
+
+        @param file_path: The path to the compressed-directory file
+        @param dest_path: The path to the new directory
+        @param extract_members: The function that extracts the files in the compressed-directory file into a directory
+        @return: Whether every file in the compressed-directory file was selected and extracted
+        """
+
+        mkdir(dest_path)
+        return extract_members(file_path=file_path, dest_dir=dest_path)
+
+    @staticmethod
+    def _extract_atomically(file_path: str, dest_path: str, extract: callable, resume: bool) -> str:
+        """
+        Extracts a compressed file to a partial path next to its destination, renames the partial path to the
+        destination once the extraction is complete and removes the compressed file if every file in it was extracted,
+        so that the destination never holds an incomplete extraction and no file that was not selected is lost. An
+        extraction that was interrupted is started over, unless it had already been renamed to its destination.
+
+        @param file_path: The path to the compressed file to extract and remove
+        @param dest_path: The destination of the resulting extracted directory or decompressed file
+        @param extract: The function that extracts the compressed file to a given path, returning whether every file in
+        it was extracted
+        @param resume: Whether the previous run was interrupted while extracting the compressed file
+        @return: The destination
+        """
+
+        partial_path: str = dest_path + PARTIAL_SUFFIX
+
+        if resume:
+            ExtractHandler._remove_partial(partial_path=partial_path)
+
+        # The destination is only there after being interrupted if the previous run renamed the extraction to it but
+        # did not get to remove the compressed file. Whether every file in it was extracted is no longer known, so the
+        # compressed file is kept.
+        if resume and exists(dest_path):
+            return dest_path
+
+        for path in [dest_path, partial_path]:
+            if exists(path):
+                raise FileExistsError(DEST_EXISTS_MSG.format(path))
+
+        try:
+            complete: bool = extract(file_path=file_path, dest_path=partial_path)
+        except ExtractHandler.EXTRACT_ERRORS:
+            ExtractHandler._remove_partial(partial_path=partial_path)
+            raise
+
+        rename(partial_path, dest_path)
+
+        if complete:
+            ExtractHandler._remove_file(file_path)
+
+        return dest_path
+
+    @staticmethod
+    def _extract_tar_members(file_path: str, dest_dir: str, only: list) -> bool:
+        """
+        Extracts the selected files and directories in a tar file, skipping links, special files and anything that
+        would be extracted outside of the destination directory. The files that are not selected are never written.
+
+        @param file_path: The path to the tar file
+        @param dest_dir: The directory to extract the files and directories into
+        @param only: The globs that the names of the files to extract match
+        @return: Whether every file in the tar file was selected
+        """
+
+        selected_all: bool = True
+
+        with open(file_path, READ_BYTES_OPT) as archive_file:
+            with open_tar(fileobj=archive_file, mode=TAR_READ_MODE) as tar_file:
+                # The tar file reads straight from the archive file unless it is compressed, in which case the files in
+                # it are not stored as is
+                stored: bool = tar_file.fileobj is archive_file
+
+                for member in tar_file:
+                    member_path: str = ExtractHandler._get_member_path(
+                        dest_dir=dest_dir, member_name=member.name, only=only
+                    )
+
+                    if member_path is None:
+                        if member.isfile() and not ExtractHandler._is_selected(file_name=member.name, only=only):
+                            selected_all: bool = False
+
+                        continue
+
+                    if member.isdir():
+                        makedirs(member_path, exist_ok=True)
+                    elif member.isfile():
+                        # The data of a sparse file is stored without its holes
+                        stored_range: tuple = None
+                        if stored and not member.issparse():
+                            stored_range: tuple = (member.offset_data, member.size)
+
+                        ExtractHandler._write_member(
+                            archive_file=archive_file, open_member=partial(tar_file.extractfile, member),
+                            member_path=member_path, stored_range=stored_range
+                        )
+
+                        # Keep the modification time of the file as tar does
+                        utime(member_path, (member.mtime, member.mtime))
+
+        return selected_all
+
+    @staticmethod
+    def _extract_zip_members(file_path: str, dest_dir: str, only: list) -> bool:
+        """
+        Extracts the selected files and directories in a zip file, skipping anything that would be extracted outside of
+        the destination directory. The files are selected from the table of contents of the zip file so the files that
+        are not selected are never read.
+
+        @param file_path: The path to the zip file
+        @param dest_dir: The directory to extract the files and directories into
+        @param only: The globs that the names of the files to extract match
+        @return: Whether every file in the zip file was selected
+        """
+
+        selected_all: bool = True
+
+        with open(file_path, READ_BYTES_OPT) as archive_file:
+            with ZipFile(archive_file) as zip_file:
+                for member in zip_file.infolist():
+                    member_path: str = ExtractHandler._get_member_path(
+                        dest_dir=dest_dir, member_name=member.filename, only=only
+                    )
+
+                    if member_path is None:
+                        if not member.is_dir() and \
+                                not ExtractHandler._is_selected(file_name=member.filename, only=only):
+                            selected_all: bool = False
+
+                        continue
+
+                    if member.is_dir():
+                        makedirs(member_path, exist_ok=True)
+                    else:
+                        ExtractHandler._write_member(
+                            archive_file=archive_file, open_member=partial(zip_file.open, member),
+                            member_path=member_path,
+                            stored_range=ExtractHandler._get_stored_zip_range(archive_file=archive_file, member=member)
+                        )
+
+        return selected_all
 
-        command: str = extract_command.format(file_path, dest_dir)
-        system(command)
+    @staticmethod
+    def _get_stored_zip_range(archive_file: IO, member: ZipInfo) -> tuple:
+        """
+        Finds where the data of a file that is stored in a zip file without being compressed or encrypted is
+
+        @param archive_file: The open zip file
+        @param member: The file in the zip file
+        @return: The offset of the data in the zip file and its size in bytes, or None if the file is compressed,
+        encrypted or its local header cannot be read, in which case reading it is left to the zip file
+        """
+
+        if member.compress_type != ZIP_STORED or member.flag_bits & ExtractHandler.ZIP_ENCRYPTED_FLAG:
+            return None
+
+        # The offset of the data is only known from the local header that comes before it
+        archive_file.seek(member.header_offset)
+        header: bytes = archive_file.read(sizeFileHeader)
+
+        if len(header) != sizeFileHeader:
+            return None
+
+        header_fields: tuple = unpack(structFileHeader, header)
+
+        if header_fields[0] != stringFileHeader:
+            return None
+
+        offset: int = member.header_offset + sizeFileHeader + header_fields[ExtractHandler.ZIP_NAME_LENGTH_FIELD] + \
+            header_fields[ExtractHandler.ZIP_EXTRA_LENGTH_FIELD]
+
+        return offset, member.file_size
+
+    @staticmethod
+    def _get_member_path(dest_dir: str, member_name: str, only: list) -> str:
+        """
+        Creates the path that a file or directory in a compressed-directory file is extracted to
+
+        @param dest_dir: The directory the compressed-directory file is extracted into
+        @param member_name: The name of the file or directory in the compressed-directory file
+        @param only: The globs that the names of the files to extract match
+        @return: The path or None if the file or directory is not selected or would be extracted outside of the
+        destination directory
+        """
+
+        member_name: str = get_member_name(member_name=member_name)
+
+        if member_name is None or not ExtractHandler._is_selected(file_name=member_name, only=only):
+            return None
+
+        return join(dest_dir, member_name)
+
+    @staticmethod
+    def _write_member(archive_file: IO, open_member: callable, member_path: str, stored_range: tuple = None):
+        """
+        Writes a file in a compressed-directory file to the path it is extracted to, creating its directory if needed.
+        A file that is stored as is gets copied straight from the compressed-directory file by the kernel if it can be.
+
+        @param archive_file: The open compressed-directory file
+        @param open_member: The function that opens the file in the compressed-directory file to be read through
+        @param member_path: The path to extract the file to
+        @param stored_range: The offset of the file in the compressed-directory file and its size in bytes if it is
+        stored as is, otherwise None
+        """
+
+        makedirs(dirname(member_path), exist_ok=True)
+
+        with open(member_path, WRITE_BYTES_OPT) as dest_file:
+            if stored_range is not None:
+                offset, size = stored_range
 
-        ExtractHandler._remove_file(file_path)
+                if ExtractHandler._copy_range(src_file=archive_file, dest_file=dest_file, offset=offset, size=size):
+                    return
+
+            with open_member() as member_file:
+                copyfileobj(member_file, dest_file)
+
+    @staticmethod
+    def _copy_range(src_file: IO, dest_file: IO, offset: int, size: int) -> bool:
+        """
+        Copies a range of bytes from one file to another inside the kernel, without reading them into this process,
+        using copy_file_range or else sendfile
+
+        @param src_file: The open file to copy from
+        @param dest_file: The open file to copy to, which has nothing written to it yet
+        @param offset: The offset in the file to copy from of the range to copy
+        @param size: The number of bytes to copy
+        @return: Whether the range was copied, with nothing having been written if it was not since neither is supported
+        between the files on this platform
+        """
+
+        for copy in ExtractHandler._get_kernel_copies():
+            copied: int = 0
+
+            while copied < size:
+                try:
+                    count: int = copy(src_file.fileno(), dest_file.fileno(), offset + copied, size - copied)
+                except OSError as e:
+                    # Only give up on copying this way if nothing was written yet
+                    if copied > 0 or e.errno not in ExtractHandler.COPY_UNSUPPORTED_ERRNOS:
+                        raise
+
+                    break
+
+                if count == 0:
+                    raise EOFError(MEMBER_TRUNCATED_MSG.format(dest_file.name))
+
+                copied += count
+
+            if copied == size:
+                return True
+
+        return False
+
+    @staticmethod
+    def _get_kernel_copies() -> list:
+        """
+        Gets the ways of copying a range of bytes inside the kernel that this platform has, in the order to try them
+
+        @return: The functions that copy part of a range from an offset in one file descriptor to another, returning the
+        number of bytes copied
+        """
+
+        kernel_copies: list = []
+
+        # copy_file_range is only available on Linux and can share the blocks of the files on some file systems
+        if hasattr(os, COPY_FILE_RANGE_FUNC):
+            kernel_copies.append(
+                lambda src_fd, dest_fd, offset, count: os.copy_file_range(src_fd, dest_fd, count, offset_src=offset)
+            )
+
+        if hasattr(os, SENDFILE_FUNC):
+            kernel_copies.append(lambda src_fd, dest_fd, offset, count: os.sendfile(dest_fd, src_fd, offset, count))
+
+        return kernel_copies
 
     @staticmethod
     def _get_compressed_file_name(file_path: str) -> str:
@@ -122,23 +875,20 @@ class ExtractHandler(Handler):
         assert isfile(file_path)
 
         _, file_name = split(file_path)
+        return get_compressed_file_name(file_name=file_name)
 
-        if file_path.endswith(TAR_EXTENSION):
-            extension_len: int = len(TAR_EXTENSION)
-        elif file_path.endswith(ZIP_EXTENSION):
-            extension_len: int = len(ZIP_EXTENSION)
-        elif file_path.endswith(TAR_GZ_EXTENSION):
-            extension_len: int = len(TAR_GZ_EXTENSION)
-        elif file_path.endswith(TGZ_EXTENSION):
-            extension_len: int = len(TGZ_EXTENSION)
-        else:
-            error_msg: str = FILE_EXTENSION_UNSUPPORTED_MSG.format(file_path)
-            raise ValueError(error_msg)
+    @staticmethod
+    def _remove_partial(partial_path: str):
+        """
+        Removes a partial extraction if there is one
 
-        assert extension_len > 0
+        @param partial_path: The path to the partial extracted directory or decompressed file
+        """
 
-        file_name: str = file_name[:len(file_name) - extension_len]
-        return file_name
+        if isdir(partial_path):
+            rmtree(partial_path)
+        elif exists(partial_path):
+            remove(partial_path)
 
     @staticmethod
     def _remove_file(file_path: str):
@@ -150,4 +900,4 @@ class ExtractHandler(Handler):
 
         assert isfile(file_path)
 
-        system(REMOVE_FILE_COMMAND.format(file_path))
+        remove(file_path)
@@ -0,0 +1,80 @@
+"""Module for the extract journal class"""
+
+from json import dumps, JSONDecodeError, loads
+from os import remove
+from os.path import isfile, join
+from typing import IO
+
+from strings.extract_handler import (
+    APPEND_OPT, IN_PROGRESS_STATE, JOURNAL_FILE_NAME, JOURNAL_LINE, JOURNAL_PATH_KEY, JOURNAL_STATE_KEY, READ_OPT
+)
+
+
+class ExtractJournal:
+    """
+    Records the state of each compressed file in a data directory as it is planned to be extracted, starts being
+    extracted, and finishes being extracted or fails to, so that an extract run which is interrupted can be resumed. The
+    states are appended to a file in the data directory, one json object per line, and the last state recorded for a
+    compressed file is its current state. The file is removed once a run finishes since there is nothing left to resume.
+    """
+
+    def __init__(self, data_path: str):
+        self._journal_path: str = join(data_path, JOURNAL_FILE_NAME)
+
+        # The state of each compressed file when the previous run was interrupted, mapped to by its relative path
+        self._previous_states: dict = {}
+
+        if isfile(self._journal_path):
+            with open(self._journal_path, READ_OPT) as f:
+                for line in f:
+                    # The last line is incomplete if the run was interrupted while writing it
+                    try:
+                        record: dict = loads(line)
+                    except JSONDecodeError:
+                        continue
+
+                    self._previous_states[record[JOURNAL_PATH_KEY]] = record[JOURNAL_STATE_KEY]
+
+        self._journal_file: IO = open(self._journal_path, APPEND_OPT)
+
+    def get_previous_state(self, rel_path: str) -> str:
+        """
+        Gets the state of a compressed file when the previous run was interrupted
+
+        @param rel_path: The path of the compressed file relative to the data directory
+        @return: The last state recorded for the compressed file by the previous run or None if there is none
+        """
+
+        return self._previous_states.get(rel_path)
+
+    def get_interrupted_paths(self) -> list:
+        """
+        Gets the compressed files that the previous run was interrupted while extracting
+
+        @return: The paths of the compressed files relative to the data directory
+        """
+
+        return [rel_path for rel_path, state in self._previous_states.items() if state == IN_PROGRESS_STATE]
+
+    def record(self, rel_path: str, state: str):
+        """
+        Records the new state of a compressed file, writing it out right away so that it survives the run being killed
+
+        @param rel_path: The path of the compressed file relative to the data directory
+        @param state: The new state of the compressed file
+        """
+
+        self._journal_file.write(JOURNAL_LINE.format(dumps({JOURNAL_PATH_KEY: rel_path, JOURNAL_STATE_KEY: state})))
+        self._journal_file.flush()
+
+    def close(self, finished: bool):
+        """
+        Closes the journal
+
+        @param finished: Whether the run finished, in which case the journal is removed, or was interrupted
+        """
+
+        self._journal_file.close()
+
+        if finished:
+            remove(self._journal_path)
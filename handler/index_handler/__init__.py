@@ -0,0 +1 @@
+"""Package containing modules related to the index and query handlers"""
@@ -0,0 +1,182 @@
+"""Module for the csv index class"""
+
+from hashlib import sha1
+from os import makedirs
+from os.path import dirname, expanduser, join, realpath
+from pickle import dumps, HIGHEST_PROTOCOL, loads
+from sqlite3 import connect, Connection
+
+from handler.inspect_handler.csv_object import CSVObject
+from strings.index_handler import (
+    CREATE_FILES_TABLE_SQL, CREATE_POSTINGS_TABLE_SQL, CREATE_TERMS_TABLE_SQL, DELETE_FILE_POSTINGS_SQL,
+    DELETE_FILE_SQL, DELETE_FILES_SQL, DELETE_ORPHAN_TERMS_SQL, DELETE_POSTINGS_SQL, DELETE_TERMS_SQL,
+    DROP_FILES_TABLE_SQL, DROP_POSTINGS_TABLE_SQL, DROP_TERMS_TABLE_SQL, GET_INDEX_VERSION_SQL, INDEX_FILE_NAME,
+    INSERT_FILE_SQL, INSERT_POSTING_SQL, INSERT_TERM_SQL, QUERY_CONDITION_SEPARATOR, QUERY_SQL, SELECT_SNAPSHOT_SQL,
+    SELECT_TERMS_SQL, SET_INDEX_VERSION_SQL, TERM_CONTAINS_SQL
+)
+from strings.inspect_handler import CACHE_DIR, UTF8
+
+
+class CSVIndex:
+    """
+    Persists the csv objects of the csv files in a data directory in a sqlite database, along with an inverted index of
+    the strings that key words are matched against, which are the relative paths, column names and nominal classes of
+    the csv files. Each distinct lowercase string is stored once and lists the csv files it is in, so a query only
+    scans the distinct strings and never reads the csv files. The size, modification time and inode of each csv file
+    when it was summarized are stored as well, forming a snapshot that later runs can compare the data directory to.
+    """
+
+    # Incremented whenever the tables or the pickled csv objects change in a way that makes older indexes unreadable
+    VERSION: int = 2
+
+    def __init__(self, index_path: str, rebuild: bool = False):
+        index_dir: str = dirname(index_path)
+        if index_dir:
+            makedirs(index_dir, exist_ok=True)
+
+        self._connection: Connection = connect(index_path)
+
+        # The ids of the strings in the index, only loaded once csv files are added
+        self._term_ids: None = None
+        self._removed_files: bool = False
+
+        version: int = self._connection.execute(GET_INDEX_VERSION_SQL).fetchone()[0]
+        if version != CSVIndex.VERSION:
+            for drop_table_sql in [DROP_FILES_TABLE_SQL, DROP_POSTINGS_TABLE_SQL, DROP_TERMS_TABLE_SQL]:
+                self._connection.execute(drop_table_sql)
+
+            self._connection.execute(SET_INDEX_VERSION_SQL.format(CSVIndex.VERSION))
+
+        for create_table_sql in [CREATE_FILES_TABLE_SQL, CREATE_POSTINGS_TABLE_SQL, CREATE_TERMS_TABLE_SQL]:
+            self._connection.execute(create_table_sql)
+
+        # Deleting rather than dropping the rows keeps the previous index readable until the new one is saved
+        if rebuild:
+            for delete_sql in [DELETE_FILES_SQL, DELETE_POSTINGS_SQL, DELETE_TERMS_SQL]:
+                self._connection.execute(delete_sql)
+
+    @staticmethod
+    def get_default_path(data_path: str) -> str:
+        """
+        Returns the path of the index of a data directory when none is specified, which is unique to the data directory
+
+        @param data_path: The path to the data directory
+        @return: The default index path
+        """
+
+        data_path_hash: str = sha1(realpath(data_path).encode(UTF8)).hexdigest()
+        return join(expanduser(CACHE_DIR), INDEX_FILE_NAME.format(data_path_hash))
+
+    def get_snapshot(self) -> dict:
+        """
+        Returns the state of each csv file in the index when it was summarized
+
+        @return: The id, size, modification time and inode of each csv file mapped to by its relative path
+        """
+
+        snapshot: dict = {}
+        for rel_path, file_id, size, mtime_ns, inode in self._connection.execute(SELECT_SNAPSHOT_SQL):
+            snapshot[rel_path] = (file_id, size, mtime_ns, inode)
+
+        return snapshot
+
+    def add(self, rel_path: str, csv_obj: CSVObject, file_state: tuple):
+        """
+        Adds a csv file to the index
+
+        @param rel_path: The path of the csv file relative to the data directory
+        @param csv_obj: The csv object of the csv file
+        @param file_state: The size, modification time and inode of the csv file from before it was summarized
+        """
+
+        csv_obj.load_values()
+
+        file_id: int = self._connection.execute(
+            INSERT_FILE_SQL, (rel_path, *file_state, dumps(csv_obj, protocol=HIGHEST_PROTOCOL))
+        ).lastrowid
+
+        terms: set = CSVIndex._get_terms(rel_path=rel_path, csv_obj=csv_obj)
+        postings: list = [(self._get_term_id(term=term), file_id) for term in terms]
+        self._connection.executemany(INSERT_POSTING_SQL, postings)
+
+    def remove(self, file_id: int):
+        """
+        Removes a csv file from the index
+
+        @param file_id: The id of the csv file in the snapshot of the index
+        """
+
+        self._connection.execute(DELETE_FILE_POSTINGS_SQL, (file_id,))
+        self._connection.execute(DELETE_FILE_SQL, (file_id,))
+        self._removed_files: bool = True
+
+    def query(self, key_words: list) -> dict:
+        """
+        Finds the csv files that contain any of the key words in their relative paths, column names or nominal values
+
+        @param key_words: The key words to search for
+        @return: The csv objects of the relevant csv files mapped to by their relative paths
+        """
+
+        # Remove duplicate key words while keeping them in order
+        key_words: list = list(dict.fromkeys(kw.lower() for kw in key_words))
+        condition: str = QUERY_CONDITION_SEPARATOR.join([TERM_CONTAINS_SQL] * len(key_words))
+
+        csv_objects: dict = {}
+        for rel_path, summary in self._connection.execute(QUERY_SQL.format(condition), key_words):
+            csv_objects[rel_path] = loads(summary)
+
+        return csv_objects
+
+    def close(self, save: bool = True):
+        """
+        Closes the index
+
+        @param save: Whether to save the changes made to the index or discard them
+        """
+
+        if save:
+            # Remove the strings that were only in removed csv files
+            if self._removed_files:
+                self._connection.execute(DELETE_ORPHAN_TERMS_SQL)
+
+            self._connection.commit()
+
+        self._connection.close()
+
+    def _get_term_id(self, term: str) -> int:
+        """
+        Gets the id of a string in the index, adding it to the index if it is not there yet
+
+        @param term: The lowercase string
+        @return: The id of the string
+        """
+
+        if self._term_ids is None:
+            self._term_ids: dict = dict(self._connection.execute(SELECT_TERMS_SQL))
+
+        term_id: int = self._term_ids.get(term)
+
+        if term_id is None:
+            term_id: int = self._connection.execute(INSERT_TERM_SQL, (term,)).lastrowid
+            self._term_ids[term] = term_id
+
+        return term_id
+
+    @staticmethod
+    def _get_terms(rel_path: str, csv_obj: CSVObject) -> set:
+        """
+        Collects the strings of a csv file that key words are matched against, lowercased like the key words are
+
+        @param rel_path: The path of the csv file relative to the data directory
+        @param csv_obj: The csv object of the csv file
+        @return: The distinct lowercase strings
+        """
+
+        terms: set = {rel_path.lower()}
+        terms.update(col_name.lower() for col_name in csv_obj.get_csv_col_names())
+
+        for nominal_col in csv_obj.get_nominal_cols():
+            terms.update(clazz.lower() for clazz in nominal_col.get_classes())
+
+        return terms
@@ -0,0 +1,185 @@
+"""Module for the index handler class"""
+
+from argparse import ArgumentParser, Namespace
+from functools import partial
+from os import stat, stat_result
+from typing import Iterable, Iterator
+
+from handler.handler import Handler
+from handler.index_handler.csv_index import CSVIndex
+from handler.inspect_handler.csv_object import CSVObject
+from handler.inspect_handler.inspector import Inspector
+from handler.utils import get_csv_paths, get_executor, positive_int
+from strings.args import (
+    BACKEND_ARG, BACKEND_ARG_HELP, CHUNK_ROWS_ARG, CHUNK_ROWS_ARG_HELP, INCREMENTAL_ARG, INCREMENTAL_ARG_HELP,
+    INDEX_PATH_ARG, INDEX_PATH_ARG_HELP, PROCESS_BACKEND, STORE_ACTION, STORE_TRUE_ACTION, THREAD_BACKEND, WORKERS_ARG,
+    WORKERS_ARG_HELP
+)
+from strings.index_handler import ADDED_CHANGE, CHANGE_LINE, CHANGES_MSG, DELETED_CHANGE, MODIFIED_CHANGE
+
+
+class IndexHandler(Handler):
+    """Handler for summarizing every csv file in the data directory into an index that can be queried with key words"""
+
+    _changes: dict = None
+    _n_unchanged: int = None
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the index handler
+
+        @param parser: The parser to configure
+        """
+
+        Handler.configure_parser(parser)
+
+        parser.add_argument(INDEX_PATH_ARG, type=str, action=STORE_ACTION, required=False, help=INDEX_PATH_ARG_HELP)
+        parser.add_argument(INCREMENTAL_ARG, action=STORE_TRUE_ACTION, required=False, help=INCREMENTAL_ARG_HELP)
+        parser.add_argument(
+            CHUNK_ROWS_ARG, type=positive_int, action=STORE_ACTION, required=False, help=CHUNK_ROWS_ARG_HELP
+        )
+        parser.add_argument(
+            WORKERS_ARG, type=positive_int, default=1, action=STORE_ACTION, required=False, help=WORKERS_ARG_HELP
+        )
+        parser.add_argument(
+            BACKEND_ARG, type=str, default=PROCESS_BACKEND, choices=[PROCESS_BACKEND, THREAD_BACKEND],
+            action=STORE_ACTION, required=False, help=BACKEND_ARG_HELP
+        )
+
+    @staticmethod
+    def handle(args: Namespace):
+        """
+        Summarizes every csv file in the data directory and its sub directories into an index, replacing any previous
+        index of the data directory. If incremental, only the csv files that changed since the previous index are
+        summarized again.
+
+        @param args: The arguments for the index handler
+        """
+
+        assert IndexHandler._changes is None
+        assert IndexHandler._n_unchanged is None
+
+        IndexHandler._changes = {ADDED_CHANGE: [], MODIFIED_CHANGE: [], DELETED_CHANGE: []}
+        IndexHandler._n_unchanged = 0
+
+        index_path: str = args.index_path
+        if index_path is None:
+            index_path: str = CSVIndex.get_default_path(data_path=args.data_path)
+
+        index: CSVIndex = CSVIndex(index_path=index_path, rebuild=not args.incremental)
+        summarize_file: callable = partial(IndexHandler._summarize_file, chunk_rows=args.chunk_rows)
+
+        # The snapshot is empty unless incremental, in which case every csv file is new
+        snapshot: dict = index.get_snapshot()
+        csv_paths: Iterator[tuple] = IndexHandler._get_changed_csv_paths(
+            data_path=args.data_path, index=index, snapshot=snapshot
+        )
+
+        # Only save the new index if it was completed so that the previous one is kept otherwise
+        try:
+            if args.workers > 1:
+                with get_executor(workers=args.workers, backend=args.backend) as executor:
+                    chunk_size: int = Inspector.PROCESS_CHUNK_SIZE if args.backend == PROCESS_BACKEND else 1
+                    IndexHandler._add_csv_objects(
+                        index=index, results=executor.map(summarize_file, csv_paths, chunksize=chunk_size)
+                    )
+            else:
+                IndexHandler._add_csv_objects(index=index, results=map(summarize_file, csv_paths))
+
+            # The csv files left in the snapshot were not found in the data directory
+            for rel_path, (file_id, _, _, _) in snapshot.items():
+                index.remove(file_id=file_id)
+                IndexHandler._changes[DELETED_CHANGE].append(rel_path)
+        except BaseException:
+            index.close(save=False)
+            raise
+
+        index.close()
+
+        # Report the changes, listing each changed csv file only if incremental since otherwise every csv file is new
+        info: list = IndexHandler._get_info(verbose=args.incremental)
+        for output_line in info:
+            print(output_line)
+
+    @staticmethod
+    def _get_changed_csv_paths(data_path: str, index: CSVIndex, snapshot: dict) -> Iterator[tuple]:
+        """
+        Yields the csv files in the data directory that are not in the snapshot of the index or changed since then,
+        removing the changed ones from the index. Every csv file found is removed from the snapshot, leaving only the
+        ones that were deleted.
+
+        @param data_path: The path to the data directory
+        @param index: The index to remove changed csv files from
+        @param snapshot: The state of each csv file in the index mapped to by its relative path
+        @return: Generator of tuples containing the path to a csv file, its relative path and its current state
+        """
+
+        for file_path, rel_path in get_csv_paths(data_path=data_path):
+            # Take the state of the csv file before summarizing it so that changes made meanwhile are found next time
+            file_stat: stat_result = stat(file_path)
+            file_state: tuple = (file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino)
+
+            if rel_path not in snapshot:
+                IndexHandler._changes[ADDED_CHANGE].append(rel_path)
+                yield file_path, rel_path, file_state
+                continue
+
+            file_id, *indexed_state = snapshot.pop(rel_path)
+
+            if tuple(indexed_state) == file_state:
+                IndexHandler._n_unchanged += 1
+            else:
+                index.remove(file_id=file_id)
+                IndexHandler._changes[MODIFIED_CHANGE].append(rel_path)
+                yield file_path, rel_path, file_state
+
+    @staticmethod
+    def _add_csv_objects(index: CSVIndex, results: Iterable):
+        """
+        Adds the csv objects of the csv files to the index as they become available
+
+        @param index: The index to add to
+        @param results: The relative path, csv object and state of each csv file
+        """
+
+        for rel_path, csv_obj, file_state in results:
+            index.add(rel_path=rel_path, csv_obj=csv_obj, file_state=file_state)
+
+    @staticmethod
+    def _summarize_file(csv_paths: tuple, chunk_rows: int) -> tuple:
+        """
+        Fully summarizes a csv file, which may run in a separate worker process
+
+        @param csv_paths: The path to the csv file, its path relative to the data directory and its state
+        @param chunk_rows: The number of rows to read from the csv at a time or None to read it all at once
+        @return: The relative path of the csv file, its csv object and its state
+        """
+
+        file_path, rel_path, file_state = csv_paths
+
+        csv_obj: CSVObject = CSVObject(csv_path=file_path, chunk_rows=chunk_rows)
+        csv_obj.load_values()
+        return rel_path, csv_obj, file_state
+
+    @staticmethod
+    def _get_info(verbose: bool) -> list:
+        """
+        Creates and returns the report of the changes made to the index
+
+        @param verbose: Whether to list each changed csv file rather than just the number of them
+        @return: The list of output lines
+        """
+
+        changes_info: list = []
+
+        if verbose:
+            for change in [ADDED_CHANGE, MODIFIED_CHANGE, DELETED_CHANGE]:
+                for rel_path in sorted(IndexHandler._changes[change]):
+                    changes_info.append(CHANGE_LINE.format(change, rel_path))
+
+        changes_info.append(CHANGES_MSG.format(
+            len(IndexHandler._changes[ADDED_CHANGE]), len(IndexHandler._changes[MODIFIED_CHANGE]),
+            len(IndexHandler._changes[DELETED_CHANGE]), IndexHandler._n_unchanged
+        ))
+        return changes_info
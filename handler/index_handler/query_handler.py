@@ -0,0 +1,72 @@
+"""Module for the query handler class"""
+
+from argparse import ArgumentParser, Namespace
+from os.path import isfile
+
+from handler.handler import Handler
+from handler.index_handler.csv_index import CSVIndex
+from handler.inspect_handler.inspector import Inspector
+from strings.args import (
+    INDEX_PATH_ARG, INDEX_PATH_ARG_HELP, KEY_WORDS_ARG, KEY_WORDS_ARG_HELP, STORE_ACTION, STORE_TRUE_ACTION,
+    VERBOSE_ARG, VERBOSE_ARG_HELP
+)
+from strings.index_handler import INDEX_NOT_FOUND_MSG
+
+
+class QueryHandler(Handler):
+    """Handler answering the same questions as the inspect handler from the index of the data directory alone"""
+
+    _csv_objects: dict = None
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the query handler
+
+        @param parser: The parser to configure
+        """
+
+        Handler.configure_parser(parser)
+
+        parser.add_argument(VERBOSE_ARG, action=STORE_TRUE_ACTION, required=False, help=VERBOSE_ARG_HELP)
+        parser.add_argument(KEY_WORDS_ARG, nargs='+', action=STORE_ACTION, required=True, help=KEY_WORDS_ARG_HELP)
+        parser.add_argument(INDEX_PATH_ARG, type=str, action=STORE_ACTION, required=False, help=INDEX_PATH_ARG_HELP)
+
+    @staticmethod
+    def handle(args: Namespace):
+        """
+        Looks up the csv files containing the key words in their file paths, column names or nominal values in the index
+        of the data directory, without reading the csv files themselves
+
+        @param args: The arguments for the query handler, including key words to search for
+        """
+
+        assert QueryHandler._csv_objects is None
+
+        index_path: str = args.index_path
+        if index_path is None:
+            index_path: str = CSVIndex.get_default_path(data_path=args.data_path)
+
+        if not isfile(index_path):
+            error_msg: str = INDEX_NOT_FOUND_MSG.format(index_path)
+            raise FileNotFoundError(error_msg)
+
+        index: CSVIndex = CSVIndex(index_path=index_path)
+        QueryHandler._csv_objects = index.query(key_words=args.key_words)
+        index.close()
+
+        # Print out all the info in the csv objects
+        info: list = QueryHandler._get_info(verbose=args.verbose)
+        for output_line in info:
+            print(output_line)
+
+    @staticmethod
+    def _get_info(verbose: bool) -> list:
+        """
+        Creates and returns the information for all the relevant csv files
+
+        @param verbose: Whether to print extra information about the CSV columns rather than just their names
+        @return: The list of output lines
+        """
+
+        return Inspector.get_csv_objects_info(csv_objects=QueryHandler._csv_objects, verbose=verbose)
@@ -1,14 +1,27 @@
 """Module containing the csv object class and the csv column classes that it depends on"""
 
 from collections import Counter, Iterable
-from numpy import isnan, issubdtype, ndarray, number
-from pandas import DataFrame, read_csv, Series
-from pandas.errors import ParserError
-
-from strings.general import CSV_EXTENSION, NAN
+from io import BytesIO
+from lzma import LZMAError
+from numpy import (
+    ascontiguousarray, count_nonzero, empty, floating, int64, isnan, issubdtype, maximum, minimum, ndarray, number,
+    signedinteger, sqrt
+)
+from os.path import getsize
+from pandas import DataFrame, isna, read_csv, Series, to_numeric
+from pandas.errors import EmptyDataError, ParserError
+from typing import IO, Union
+from zlib import error as ZlibError
+
+from handler.profiler import FileProfile
+from handler.utils import get_compression, is_csv, open_decompressed
+from strings.general import NAN
 from strings.inspect_handler import (
-    CSV_NOT_LOADED_MSG, INDENT, MAPPING_SYMBOL, MAX_KEY, MEAN_KEY, MIN_KEY, NUMERIC_TYPE_KEY, RANGE_KEY, STD_KEY
+    CLASSES_FIELD, COERCE, COLUMNS_FIELD, CSV_NOT_LOADED_MSG, ERROR_FIELD, INDENT, MAPPING_SYMBOL, MAX_FIELD, MAX_KEY,
+    MEAN_FIELD, MEAN_KEY, MIN_FIELD, MIN_KEY, NAME_FIELD, NEWLINE_BYTE, NOMINAL_TYPE, NUMERIC_STR_PATTERN, NUMERIC_TYPE,
+    NUMERIC_TYPE_KEY, PATH_FIELD, RANGE_FIELD, RANGE_KEY, READ_BYTES_OPT, STD_FIELD, STD_KEY, TYPE_FIELD
 )
+from strings.profiler import ERROR_TEXT, NUMERIC_COLS_NAME, READ_SECTION, SUMMARIZE_SECTION
 
 
 class CSVColumn:
@@ -21,107 +34,384 @@ class CSVColumn:
 
         raise NotImplementedError()
 
+    def get_record(self) -> dict:
+        """Returns a structured record of the information about the csv column, apart from its name"""
+
+        raise NotImplementedError()
+
 
 class CSVObject:
     """Contains necessary information about a csv file"""
 
     N_INDENTS: int = 1
 
-    def __init__(self, csv_path: str):
-        assert csv_path.endswith(CSV_EXTENSION)
-
-        self._csv_cols: dict = {}
+    # The errors that mean a csv could not be read, such as a malformed csv or a corrupt or truncated compressed csv,
+    # rather than that something is wrong with the code
+    READ_ERRORS: tuple = (EOFError, LZMAError, OSError, ParserError, UnicodeDecodeError, ZlibError)
+
+    # Csv files at least this many bytes in size are read in chunks even if no chunk size was specified
+    AUTO_CHUNK_FILE_SIZE: int = 256 * 1024 * 1024
+    DEFAULT_CHUNK_ROWS: int = 100000
+
+    # Compressed csv files are assumed to decompress to this many times their size when deciding whether to chunk them
+    COMPRESSION_RATIO: int = 8
+
+    # The memory of parsing a csv is estimated from a sample of this many bytes from its start, and parsing takes about
+    # this many times the memory of the resulting data frame
+    SAMPLE_BYTES: int = 1024 * 1024
+    PARSE_OVERHEAD: int = 2
+
+    # A csv that cannot be sampled, such as one being read from an archive, is assumed to take this many times its size
+    # in memory once parsed and to have rows of this many bytes
+    DEFAULT_EXPANSION: int = 4
+    DEFAULT_ROW_BYTES: int = 256
+
+    # The fewest rows read at a time when reading a csv in chunks to stay within a memory budget
+    MIN_CHUNK_ROWS: int = 1000
+
+    def __init__(self, csv_path: str, chunk_rows: int = None, memory_budget: int = None):
+        assert is_csv(file_name=csv_path)
+        assert chunk_rows is None or chunk_rows > 0
+        assert memory_budget is None or memory_budget > 0
+
+        # The csv is loaded lazily in stages, first only its header and then its values, as each stage is needed. A
+        # compressed csv is decompressed as it is read, at each stage.
+        self._csv_path: str = csv_path
+        self._compression: str = get_compression(file_name=csv_path)
+        self._chunk_rows: int = chunk_rows
+        self._memory_budget: int = memory_budget
+        self._col_names: None = None
+        self._csv_cols: None = None
+        self._numeric_cols: None = None
         self._read_error: None = None
 
-        try:
-            # Use the "low_memory" parameter to get rid of superfluous warnings
-            df: DataFrame = read_csv(csv_path, low_memory=False)
-        except (ParserError, UnicodeDecodeError) as e:
-            self._read_error: Exception = e
-            df: None = None
-
-        if df is not None:
-            for col_name in df.columns:
-                self._csv_cols[col_name] = CSVObject._get_col(df=df, col_name=col_name)
-
     def get_csv_col_names(self) -> Iterable:
-        """Returns the names of all the columns"""
+        """Returns the names of all the columns, only reading the header of the csv if its values are not loaded yet"""
+
+        if self._col_names is None:
+            self._load_header()
 
-        return self._csv_cols.keys()
+        return self._col_names
 
     def get_nominal_cols(self) -> set:
         """
-        Returns the csv columns that are nominal
+        Returns the csv columns that are nominal, loading the values of the csv if they are not loaded yet
 
         @return: The nominal column objects
         """
 
-        nominal_cols: set = set()
-
-        for csv_col in self._csv_cols.values():
-            if type(csv_col) is NominalColumn:
-                nominal_cols.add(csv_col)
+        self.load_values()
 
+        # The numeric columns are kept separately so every csv column object is nominal
+        nominal_cols: set = set(self._csv_cols.values())
         return nominal_cols
 
     def get_info(self, verbose: bool) -> list:
         """
         Returns a list of strings containing useful information about the csv file corresponding to this object.
-        If the csv could not be successfully read, simply returns a string message explaining this.
+        If the csv could not be successfully read, simply returns a string message explaining this. The column names
+        only need the header of the csv, so its values are only loaded if verbose.
 
         @param verbose: Whether to print extra information about the CSV columns rather than just their names
         @return: The list of information
         """
 
+        if verbose:
+            self.load_values()
+        else:
+            self.get_csv_col_names()
+
         csv_obj_info: list = []
 
-        if len(self._csv_cols) == 0:
+        if self._read_error is not None:
             csv_obj_info.append(CSV_NOT_LOADED_MSG.format(type(self._read_error), self._read_error))
             return csv_obj_info
 
         # Sort the column names to ensure determinism
-        col_names: list = sorted(self._csv_cols.keys())
+        col_names: list = sorted(self._col_names)
 
         for col_name in col_names:
             col_name_line: str = (INDENT * CSVObject.N_INDENTS) + col_name
             csv_obj_info.append(col_name_line)
 
             if verbose:
-                col: CSVColumn = self._csv_cols[col_name]
-                csv_col_info: list = col.get_info()
+                if col_name in self._csv_cols:
+                    col: CSVColumn = self._csv_cols[col_name]
+                    csv_col_info: list = col.get_info()
+                else:
+                    csv_col_info: list = self._numeric_cols.get_info(col_name=col_name)
+
                 csv_obj_info.extend(csv_col_info)
         return csv_obj_info
 
+    def get_record(self, rel_path: str) -> dict:
+        """
+        Returns a structured record of the same information as the verbose output of the csv file, for writing in a
+        machine readable format
+
+        @param rel_path: The path of the csv file relative to the data directory
+        @return: The record, with the name, type and statistics or class counts of each column sorted by name, or the
+        error that prevented reading the csv along with no columns
+        """
+
+        self.load_values()
+
+        if self._read_error is not None:
+            error: str = ERROR_TEXT.format(type(self._read_error).__name__, self._read_error)
+            return {PATH_FIELD: rel_path, ERROR_FIELD: error, COLUMNS_FIELD: []}
+
+        col_records: list = []
+
+        # Sort the column names to ensure determinism
+        for col_name in sorted(self._col_names):
+            if col_name in self._csv_cols:
+                col_record: dict = self._csv_cols[col_name].get_record()
+            else:
+                col_record: dict = self._numeric_cols.get_record(col_name=col_name)
+
+            col_records.append({NAME_FIELD: col_name, **col_record})
+
+        return {PATH_FIELD: rel_path, ERROR_FIELD: None, COLUMNS_FIELD: col_records}
+
+    def load_values(self, csv_file: IO = None, csv_size: int = None):
+        """
+        Reads the entire csv and summarizes each of its columns if this has not been done yet. Nominal columns are
+        summarized individually while the numeric columns are summarized together.
+
+        @param csv_file: The open csv to read rather than the csv path, such as a csv inside an archive, or None to read
+        the csv path
+        @param csv_size: The size of the open csv in bytes, before decompressing it if it is compressed
+        """
+
+        if self._csv_cols is not None:
+            return
+
+        self._csv_cols: dict = {}
+
+        read_path: bool = csv_file is None
+        if read_path:
+            csv_file: str = self._csv_path
+            csv_size: int = getsize(self._csv_path)
+
+        if self._compression is not None:
+            csv_size *= CSVObject.COMPRESSION_RATIO
+
+        chunk_rows: int = self._chunk_rows
+
+        # A csv that would not fit in the memory budget once parsed is read in chunks that do
+        if chunk_rows is None and self._memory_budget is not None:
+            if read_path:
+                footprint, row_footprint = CSVObject.estimate_footprint(csv_path=self._csv_path)
+            else:
+                footprint, row_footprint = CSVObject._get_default_footprint(csv_size=csv_size)
+
+            chunk_rows: int = CSVObject.get_budget_chunk_rows(
+                footprint=footprint, row_footprint=row_footprint, memory_budget=self._memory_budget
+            )
+
+        if chunk_rows is None and csv_size >= CSVObject.AUTO_CHUNK_FILE_SIZE:
+            chunk_rows: int = CSVObject.DEFAULT_CHUNK_ROWS
+
+        try:
+            if chunk_rows is None:
+                # Use the "low_memory" parameter to get rid of superfluous warnings
+                with FileProfile.section(name=READ_SECTION):
+                    df: DataFrame = read_csv(csv_file, compression=self._compression, low_memory=False)
+
+                FileProfile.add_rows(n_rows=len(df))
+
+                with FileProfile.section(name=SUMMARIZE_SECTION):
+                    self._numeric_cols: NumericColumns = CSVObject._get_numeric_cols(df=df, count_nans=False)
+                    self._csv_cols: dict = CSVObject._get_nominal_cols(df=df, numeric_cols=self._numeric_cols)
+
+                self._col_names: list = list(df.columns)
+            else:
+                self._load_chunks(csv_file=csv_file, chunk_rows=chunk_rows)
+        except CSVObject.READ_ERRORS as e:
+            self._csv_cols: dict = {}
+            self._numeric_cols: None = None
+
+            # The header may be readable even though the values are not, and its column names can still be matched,
+            # although an open csv cannot be read again. The header is only read if it was not read before the values.
+            if self._col_names is None:
+                if read_path:
+                    self._load_header()
+                else:
+                    self._col_names: list = []
+
+            self._read_error: Exception = e
+            FileProfile.add_error(error=e)
+
     @staticmethod
-    def _get_col(df: DataFrame, col_name: str) -> CSVColumn:
+    def estimate_footprint(csv_path: str) -> tuple:
         """
-        Returns the csv column info object associated with a given data frame column
+        Estimates the memory taken by parsing a csv from its size and from parsing a sample of its header and first
+        rows, without reading the rest of it
 
-        @param df: The data frame that contains the column
-        @param col_name: The name of the column
-        @return: The csv column object
+        @param csv_path: The path to the csv
+        @return: The estimated number of bytes taken by parsing the entire csv and by parsing each of its rows
         """
 
-        col: Series = df[col_name]
+        csv_size: int = getsize(csv_path)
+        compression: str = get_compression(file_name=csv_path)
 
-        if CSVObject._is_numeric(col=col):
-            col: CSVColumn = NumericColumn(col=col)
-            return col
+        if compression is None:
+            with open(csv_path, READ_BYTES_OPT) as f:
+                sample: bytes = f.read(CSVObject.SAMPLE_BYTES)
         else:
-            col: CSVColumn = NominalColumn(col=col)
-            return col
+            csv_size *= CSVObject.COMPRESSION_RATIO
+
+            # A compressed csv that cannot be decompressed is not sampled, and fails to be read once it is read
+            try:
+                with open_decompressed(file=csv_path, compression=compression) as f:
+                    sample: bytes = f.read(CSVObject.SAMPLE_BYTES)
+            except CSVObject.READ_ERRORS:
+                return CSVObject._get_default_footprint(csv_size=csv_size)
+
+        # The size of a csv that fits in the sample is known exactly, otherwise the sample ends at its last whole row
+        if len(sample) < CSVObject.SAMPLE_BYTES:
+            csv_size: int = len(sample)
+        else:
+            sample: bytes = sample[:sample.rfind(NEWLINE_BYTE) + 1]
+
+        if len(sample) == 0:
+            return CSVObject._get_default_footprint(csv_size=csv_size)
+
+        try:
+            df: DataFrame = read_csv(BytesIO(sample), low_memory=False)
+        except (EmptyDataError, ParserError, UnicodeDecodeError):
+            return CSVObject._get_default_footprint(csv_size=csv_size)
+
+        # The header is counted as a row so that a sample without any other rows still has a size per row
+        n_rows: int = len(df) + 1
+        row_bytes: float = len(sample) / n_rows
+        row_footprint: float = df.memory_usage(deep=True).sum() / n_rows * CSVObject.PARSE_OVERHEAD
+
+        return int(csv_size / row_bytes * row_footprint), int(row_footprint) + 1
 
     @staticmethod
-    def _is_numeric(col: Series) -> bool:
+    def get_budget_chunk_rows(footprint: int, row_footprint: int, memory_budget: int) -> int:
         """
-        Determines if a series contains only numerical values
+        Determines how many rows of a csv to read at a time to stay within a memory budget
 
-        @param col: The series to check
-        @return: The truth value of the above mentioned query
+        @param footprint: The estimated number of bytes taken by parsing the entire csv
+        @param row_footprint: The estimated number of bytes taken by parsing each row of the csv
+        @param memory_budget: The number of bytes that parsing the csv may take
+        @return: The number of rows to read at a time or None if the entire csv fits in the memory budget
+        """
+
+        if footprint <= memory_budget:
+            return None
+
+        return max(memory_budget // row_footprint, CSVObject.MIN_CHUNK_ROWS)
+
+    @staticmethod
+    def _get_default_footprint(csv_size: int) -> tuple:
+        """
+        Estimates the memory taken by parsing a csv that cannot be sampled from its size alone
+
+        @param csv_size: The size of the csv in bytes, once decompressed if it is compressed
+        @return: The estimated number of bytes taken by parsing the entire csv and by parsing each of its rows
+        """
+
+        expansion: int = CSVObject.DEFAULT_EXPANSION * CSVObject.PARSE_OVERHEAD
+        return csv_size * expansion, CSVObject.DEFAULT_ROW_BYTES * expansion
+
+    def _load_header(self):
+        """Reads only the header line of the csv to get its column names"""
+
+        try:
+            with FileProfile.section(name=READ_SECTION):
+                df: DataFrame = read_csv(self._csv_path, compression=self._compression, nrows=0)
+        except CSVObject.READ_ERRORS as e:
+            # The values cannot be read if the header cannot, so consider them loaded as well
+            self._read_error: Exception = e
+            FileProfile.add_error(error=e)
+            self._col_names: list = []
+            self._csv_cols: dict = {}
+            return
+
+        self._col_names: list = list(df.columns)
+
+    def _load_chunks(self, csv_file: Union[str, IO], chunk_rows: int):
+        """
+        Reads the csv a chunk of rows at a time, merging the summary of each chunk into the summaries of the previous
+        ones so that only one chunk is in memory at once
+
+        @param csv_file: The path to the csv or the open csv
+        @param chunk_rows: The number of rows in each chunk
+        """
+
+        reader = read_csv(csv_file, compression=self._compression, chunksize=chunk_rows, low_memory=False)
+
+        try:
+            for df in FileProfile.time_iterator(name=READ_SECTION, iterator=reader):
+                FileProfile.add_rows(n_rows=len(df))
+
+                with FileProfile.section(name=SUMMARIZE_SECTION):
+                    self._merge_chunk(df=df)
+        finally:
+            reader.close()
+
+    def _merge_chunk(self, df: DataFrame):
+        """
+        Summarizes a chunk of the csv and merges the summary into the summaries of the previous chunks
+
+        @param df: The data frame of the chunk
         """
 
-        is_numeric: bool = issubdtype(col.dtype, number)
-        return is_numeric
+        numeric_cols: NumericColumns = CSVObject._get_numeric_cols(df=df, count_nans=True)
+        nominal_cols: dict = CSVObject._get_nominal_cols(df=df, numeric_cols=numeric_cols)
+
+        if self._numeric_cols is None:
+            self._numeric_cols: NumericColumns = numeric_cols
+            self._csv_cols: dict = nominal_cols
+            self._col_names: list = list(df.columns)
+            return
+
+        # A column is only numeric as a whole if it is numeric in every chunk
+        self._csv_cols.update(self._numeric_cols.remove(col_names=nominal_cols.keys()))
+        nominal_cols.update(numeric_cols.remove(col_names=self._csv_cols.keys()))
+        self._numeric_cols.merge(other=numeric_cols)
+
+        for col_name, nominal_col in nominal_cols.items():
+            if col_name in self._csv_cols:
+                self._csv_cols[col_name].merge(other=nominal_col)
+            else:
+                self._csv_cols[col_name] = nominal_col
+
+    @staticmethod
+    def _get_numeric_cols(df: DataFrame, count_nans: bool):
+        """
+        Creates the summary of the numeric columns in a data frame
+
+        @param df: The data frame that contains the columns
+        @param count_nans: Whether to count the nans in each column, which is needed to merge chunks of a csv
+        @return: The numeric columns object
+        """
+
+        # The numeric columns are summarized together so they are profiled as one
+        with FileProfile.column(col_name=NUMERIC_COLS_NAME):
+            return NumericColumns(df=df, count_nans=count_nans)
+
+    @staticmethod
+    def _get_nominal_cols(df: DataFrame, numeric_cols) -> dict:
+        """
+        Creates the nominal column objects of the columns in a data frame that are not numeric
+
+        @param df: The data frame that contains the columns
+        @param numeric_cols: The summary of the numeric columns in the data frame
+        @return: The nominal column objects mapped to by the column names
+        """
+
+        nominal_cols: dict = {}
+
+        for col_name in df.columns:
+            if not numeric_cols.contains(col_name=col_name):
+                with FileProfile.column(col_name=col_name):
+                    nominal_cols[col_name] = NominalColumn(col=df[col_name])
+
+        return nominal_cols
 
 
 class NominalColumn(CSVColumn):
@@ -130,17 +420,84 @@ class NominalColumn(CSVColumn):
     def __init__(self, col: Series):
         self._class_counts: Counter = Counter()
 
-        # Get the frequency of each class in the nominal column
-        for clazz in col:
-            if type(clazz) is bool:
-                clazz: str = str(clazz)
-            elif NominalColumn._is_numeric(obj=clazz):
-                clazz: str = NUMERIC_TYPE_KEY
-            elif type(clazz) is float:
-                assert isnan(clazz)
-                clazz: str = NAN
+        # Count each distinct value at once, keeping the nans, so that only the distinct values need to be classified
+        value_counts: Series = col.value_counts(dropna=False, sort=False)
+        values: ndarray = value_counts.index.to_numpy(dtype=object)
+        counts: list = value_counts.to_numpy().tolist()
+
+        classes: ndarray = NominalColumn._classify(values=values)
 
-            self._class_counts[clazz] += 1
+        # Different values can have the same class, such as all the numeric values
+        for clazz, class_count in zip(classes, counts):
+            self._class_counts[clazz] += class_count
+
+    @staticmethod
+    def _classify(values: ndarray) -> ndarray:
+        """
+        Determines the class of each distinct value of a nominal column. Booleans are classes by their string, values
+        that are numeric or can be casted to a numeric type share the numeric class and nans share the nan class.
+
+        @param values: The distinct values
+        @return: The class of each value
+        """
+
+        types: ndarray = Series(values, dtype=object).map(type).to_numpy()
+        is_bool: ndarray = types == bool
+        is_str: ndarray = types == str
+        is_nan: ndarray = isna(values)
+
+        # Numbers are numeric unless they are nans, and strings are numeric if they can be casted to a number
+        is_numeric: ndarray = ~is_bool & ~is_str & ~is_nan
+        is_numeric[is_str] = NominalColumn._are_numeric_strs(strs=values[is_str])
+
+        classes: ndarray = values.copy()
+        classes[is_bool] = [str(value) for value in values[is_bool]]
+        classes[is_numeric] = NUMERIC_TYPE_KEY
+        classes[is_nan] = NAN
+        return classes
+
+    @staticmethod
+    def _are_numeric_strs(strs: ndarray) -> ndarray:
+        """
+        Determines which strings can be casted to a numeric type
+
+        @param strs: The strings to check
+        @return: Whether each string can be casted to a numeric type
+        """
+
+        strs: Series = Series(strs, dtype=object)
+        are_numeric: ndarray = to_numeric(strs, errors=COERCE).notna().to_numpy()
+
+        # Python accepts some numbers that pandas does not, such as nan, infinity or digits of other scripts, all of
+        # which contain a digit or one of those words, so only those few strings need to be checked individually
+        maybe_numeric: ndarray = ~are_numeric & strs.str.contains(NUMERIC_STR_PATTERN, case=False).to_numpy(dtype=bool)
+
+        for i in maybe_numeric.nonzero()[0]:
+            are_numeric[i] = NominalColumn._is_numeric(obj=strs.iat[i])
+
+        return are_numeric
+
+    def merge(self, other: CSVColumn):
+        """
+        Adds the class counts of another chunk of the nominal column to this one
+
+        @param other: The nominal column object of the other chunk
+        """
+
+        assert type(other) is NominalColumn
+
+        self._class_counts.update(other._class_counts)
+
+    def add_class_count(self, clazz: str, class_count: int):
+        """
+        Adds to the count of a class in the nominal column
+
+        @param clazz: The class to add to
+        @param class_count: The amount to add to the count of the class
+        """
+
+        if class_count > 0:
+            self._class_counts[clazz] += class_count
 
     @staticmethod
     def _is_numeric(obj) -> bool:
@@ -194,31 +551,232 @@ class NominalColumn(CSVColumn):
             csv_col_info.append(class_line)
         return csv_col_info
 
+    def get_record(self) -> dict:
+        """Returns a structured record of the class counts of a nominal csv column"""
 
-class NumericColumn(CSVColumn):
-    """Contains useful information about csv columns with numeric values"""
+        classes: list = sorted(self._class_counts.keys())
+        class_counts: dict = {clazz: int(self._class_counts[clazz]) for clazz in classes}
 
-    def __init__(self, col: Series):
-        col: ndarray = col.to_numpy()
+        return {TYPE_FIELD: NOMINAL_TYPE, CLASSES_FIELD: class_counts}
 
-        self._min: number = col.min(initial=None)
-        self._max: number = col.max(initial=None)
-        self._range: number = self._max - self._min
-        self._mean: number = col.mean()
-        self._std: number = col.std()
 
-    def get_info(self) -> list:
-        """Returns a list of strings containing information about numeric csv columns"""
+class NumericColumns:
+    """
+    Contains useful information about all the csv columns with numeric values. The statistics of all the columns are
+    computed together from the contiguous block of each type of numeric column and kept in arrays with an entry per
+    column.
+    """
+
+    def __init__(self, df: DataFrame, count_nans: bool):
+        int_df: DataFrame = df.select_dtypes(include=[signedinteger])
+        float_df: DataFrame = df.select_dtypes(include=[number], exclude=[signedinteger])
+
+        self._col_names: list = list(int_df.columns) + list(float_df.columns)
+        self._col_indices: dict = {col_name: i for i, col_name in enumerate(self._col_names)}
+        self._n_rows: int = len(df)
+
+        n_cols: int = len(self._col_names)
+        n_int_cols: int = len(int_df.columns)
+
+        # Integer columns keep their exact minimum and maximum while every column has them as floats for merging
+        self._is_int: ndarray = empty(n_cols, dtype=bool)
+        self._int_mins: ndarray = empty(n_cols, dtype=int64)
+        self._int_maxs: ndarray = empty(n_cols, dtype=int64)
+        self._mins: ndarray = empty(n_cols, dtype=float)
+        self._maxs: ndarray = empty(n_cols, dtype=float)
+        self._means: ndarray = empty(n_cols, dtype=float)
+        self._stds: ndarray = empty(n_cols, dtype=float)
+        self._n_nans: ndarray = empty(n_cols, dtype=int64)
+
+        self._is_int[:n_int_cols] = True
+        self._is_int[n_int_cols:] = False
+
+        if n_int_cols > 0:
+            block: ndarray = NumericColumns._get_block(df=int_df)
+            self._int_mins[:n_int_cols] = block.min(axis=1)
+            self._int_maxs[:n_int_cols] = block.max(axis=1)
+            self._set_stats(block=block, start=0, count_nans=False)
+
+        if n_int_cols < n_cols:
+            block: ndarray = NumericColumns._get_block(df=float_df)
+            self._set_stats(block=block, start=n_int_cols, count_nans=count_nans)
+
+    @staticmethod
+    def _get_block(df: DataFrame) -> ndarray:
+        """
+        Gets the values of a data frame whose columns are all of the same type as a contiguous block with a row per
+        column, so that reducing each row sums its values in the same order as reducing the column on its own would
+
+        @param df: The data frame
+        @return: The block of values
+        """
+
+        return ascontiguousarray(df.to_numpy().T)
+
+    def _set_stats(self, block: ndarray, start: int, count_nans: bool):
+        """
+        Computes the statistics of a block of columns
+
+        @param block: The block of values with a row per column
+        @param start: The index of the first column of the block
+        @param count_nans: Whether to count the nans in each column, which is needed to merge chunks of a csv
+        """
+
+        end: int = start + len(block)
+
+        self._mins[start:end] = block.min(axis=1)
+        self._maxs[start:end] = block.max(axis=1)
+        self._means[start:end] = block.mean(axis=1)
+        self._stds[start:end] = block.std(axis=1)
+
+        if count_nans and issubdtype(block.dtype, floating):
+            self._n_nans[start:end] = count_nonzero(isnan(block), axis=1)
+        else:
+            self._n_nans[start:end] = 0
+
+    def contains(self, col_name: str) -> bool:
+        """
+        Determines whether a column is one of the numeric columns
+
+        @param col_name: The name of the column
+        @return: The truth value of the above mentioned query
+        """
+
+        return col_name in self._col_indices
+
+    def remove(self, col_names: Iterable) -> dict:
+        """
+        Removes columns from the numeric columns, as needed when a later chunk of the columns is nominal
+
+        @param col_names: The names of the columns to remove, which need not all be numeric columns
+        @return: The nominal column objects with numeric and nan classes of the removed columns
+        """
+
+        nominal_cols: dict = {}
+        keep: ndarray = empty(len(self._col_names), dtype=bool)
+        keep[:] = True
+
+        for col_name in col_names:
+            if col_name in self._col_indices:
+                i: int = self._col_indices[col_name]
+                keep[i] = False
+
+                nominal_col: NominalColumn = NominalColumn(col=Series([], dtype=object))
+                nominal_col.add_class_count(clazz=NUMERIC_TYPE_KEY, class_count=self._n_rows - int(self._n_nans[i]))
+                nominal_col.add_class_count(clazz=NAN, class_count=int(self._n_nans[i]))
+                nominal_cols[col_name] = nominal_col
+
+        if len(nominal_cols) > 0:
+            self._col_names: list = [col_name for col_name in self._col_names if col_name not in nominal_cols]
+            self._col_indices: dict = {col_name: i for i, col_name in enumerate(self._col_names)}
+            self._is_int: ndarray = self._is_int[keep]
+            self._int_mins: ndarray = self._int_mins[keep]
+            self._int_maxs: ndarray = self._int_maxs[keep]
+            self._mins: ndarray = self._mins[keep]
+            self._maxs: ndarray = self._maxs[keep]
+            self._means: ndarray = self._means[keep]
+            self._stds: ndarray = self._stds[keep]
+            self._n_nans: ndarray = self._n_nans[keep]
+
+        return nominal_cols
+
+    def merge(self, other):
+        """
+        Merges the statistics of another chunk of the same numeric columns into these using the pairwise update of the
+        mean and variance, which stays numerically stable regardless of the number of chunks
+
+        @param other: The numeric columns object of the other chunk
+        """
+
+        assert set(self._col_names) == set(other._col_names)
+
+        # Line up the columns of the other chunk with these columns
+        order: list = [other._col_indices[col_name] for col_name in self._col_names]
+
+        n1: int = self._n_rows
+        n2: int = other._n_rows
+        n_rows: int = n1 + n2
+
+        delta: ndarray = other._means[order] - self._means
+        variances: ndarray = (n1 * self._stds ** 2 + n2 * other._stds[order] ** 2) / n_rows
+        variances: ndarray = variances + delta ** 2 * n1 * n2 / n_rows ** 2
+
+        self._means: ndarray = self._means + delta * n2 / n_rows
+        self._stds: ndarray = sqrt(variances)
+        self._n_rows: int = n_rows
+        self._n_nans: ndarray = self._n_nans + other._n_nans[order]
+
+        # The minimum and maximum propagate nans, and a column is only an integer column if it is in every chunk
+        self._mins: ndarray = minimum(self._mins, other._mins[order])
+        self._maxs: ndarray = maximum(self._maxs, other._maxs[order])
+        self._int_mins: ndarray = minimum(self._int_mins, other._int_mins[order])
+        self._int_maxs: ndarray = maximum(self._int_maxs, other._int_maxs[order])
+        self._is_int: ndarray = self._is_int & other._is_int[order]
+
+    def get_info(self, col_name: str) -> list:
+        """
+        Returns a list of strings containing information about a numeric csv column
+
+        @param col_name: The name of the column
+        @return: The list of information
+        """
+
+        i: int = self._col_indices[col_name]
+
+        if self._is_int[i]:
+            col_min: number = self._int_mins[i]
+            col_max: number = self._int_maxs[i]
+        else:
+            col_min: number = self._mins[i]
+            col_max: number = self._maxs[i]
 
         csv_col_info: list = []
-        NumericColumn._add_info_line(key=MIN_KEY, val=self._min, csv_col_info=csv_col_info)
-        NumericColumn._add_info_line(key=MAX_KEY, val=self._max, csv_col_info=csv_col_info)
-        NumericColumn._add_info_line(key=RANGE_KEY, val=self._range, csv_col_info=csv_col_info)
-        NumericColumn._add_info_line(key=MEAN_KEY, val=self._mean, csv_col_info=csv_col_info)
-        NumericColumn._add_info_line(key=STD_KEY, val=self._std, csv_col_info=csv_col_info)
+        NumericColumns._add_info_line(key=MIN_KEY, val=col_min, csv_col_info=csv_col_info)
+        NumericColumns._add_info_line(key=MAX_KEY, val=col_max, csv_col_info=csv_col_info)
+        NumericColumns._add_info_line(key=RANGE_KEY, val=col_max - col_min, csv_col_info=csv_col_info)
+        NumericColumns._add_info_line(key=MEAN_KEY, val=self._means[i], csv_col_info=csv_col_info)
+        NumericColumns._add_info_line(key=STD_KEY, val=self._stds[i], csv_col_info=csv_col_info)
 
         return csv_col_info
 
+    def get_record(self, col_name: str) -> dict:
+        """
+        Returns a structured record of the statistics of a numeric csv column
+
+        @param col_name: The name of the column
+        @return: The record, in which the minimum and maximum of an integer column are integers and any statistic that
+        is nan is None
+        """
+
+        i: int = self._col_indices[col_name]
+
+        if self._is_int[i]:
+            col_min: int = int(self._int_mins[i])
+            col_max: int = int(self._int_maxs[i])
+        else:
+            col_min: float = NumericColumns._to_record_value(val=self._mins[i])
+            col_max: float = NumericColumns._to_record_value(val=self._maxs[i])
+
+        col_range: float = None if col_min is None or col_max is None else col_max - col_min
+
+        return {
+            TYPE_FIELD: NUMERIC_TYPE, MIN_FIELD: col_min, MAX_FIELD: col_max, RANGE_FIELD: col_range,
+            MEAN_FIELD: NumericColumns._to_record_value(val=self._means[i]),
+            STD_FIELD: NumericColumns._to_record_value(val=self._stds[i])
+        }
+
+    @staticmethod
+    def _to_record_value(val: number) -> float:
+        """
+        Converts a statistic to a value that every machine readable format can represent
+
+        @param val: The statistic
+        @return: The statistic as a float or None if it is nan
+        """
+
+        val: float = float(val)
+        return None if isnan(val) else val
+
     @staticmethod
     def _add_info_line(key: str, val: number, csv_col_info: list):
         """
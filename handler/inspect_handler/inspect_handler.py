@@ -1,24 +1,31 @@
 """Module for the inspect handler class"""
 
 from argparse import ArgumentParser, Namespace
-from collections import Iterable
+from typing import Iterator
 
 from handler.handler import Handler
-from handler.inspect_handler.csv_object import CSVObject, NominalColumn
-from handler.utils import remove_root_dir
+from handler.inspect_handler.inspector import Inspector
+from handler.inspect_handler.memory_budget import MemoryBudget
+from handler.inspect_handler.result_writer import ResultWriter
+from handler.inspect_handler.summary_cache import SummaryCache
+from handler.profiler import Profiler
+from handler.telemetry import Telemetry
+from handler.utils import positive_int
 from strings.args import (
-    KEY_WORDS_ARG, KEY_WORDS_ARG_HELP, STORE_ACTION, STORE_TRUE_ACTION, VERBOSE_ARG, VERBOSE_ARG_HELP
+    ARCHIVES_ARG, ARCHIVES_ARG_HELP, BACKEND_ARG, BACKEND_ARG_HELP, CACHE_HASH_ARG, CACHE_HASH_ARG_HELP, CACHE_PATH_ARG,
+    CACHE_PATH_ARG_HELP, CACHE_SIZE_ARG, CACHE_SIZE_ARG_HELP, CHUNK_ROWS_ARG, CHUNK_ROWS_ARG_HELP, KEY_WORDS_ARG,
+    KEY_WORDS_ARG_HELP, MEMORY_BUDGET_ARG, MEMORY_BUDGET_ARG_HELP, NO_CACHE_ARG, NO_CACHE_ARG_HELP, PREFILTER_ARG,
+    PREFILTER_ARG_HELP, PROCESS_BACKEND, REBUILD_CACHE_ARG, REBUILD_CACHE_ARG_HELP, STORE_ACTION, STORE_TRUE_ACTION,
+    THREAD_BACKEND, VERBOSE_ARG, VERBOSE_ARG_HELP, WORKERS_ARG, WORKERS_ARG_HELP
 )
-from strings.general import CSV_EXTENSION
-from strings.inspect_handler import NO_OUTPUT_MSG
+from strings.profiler import OUTPUT_STAGE
 
 
 class InspectHandler(Handler):
-    """Handler fulfilling the main purpose of this repository which is inspecting csv files using key words"""
-
-    _csv_objects: dict = None
-    _key_words: list = None
-    _data_path: str = None
+    """
+    Handler fulfilling the main purpose of this repository which is inspecting csv files using key words, by making a
+    single query of an inspector of the data directory
+    """
 
     @staticmethod
     def configure_parser(parser: ArgumentParser):
@@ -28,118 +35,135 @@ class InspectHandler(Handler):
         @param parser: The parser to configure
         """
 
-        Handler.configure_parser(parser)
-
         parser.add_argument(VERBOSE_ARG, action=STORE_TRUE_ACTION, required=False, help=VERBOSE_ARG_HELP)
         parser.add_argument(KEY_WORDS_ARG, nargs='+', action=STORE_ACTION, required=True, help=KEY_WORDS_ARG_HELP)
 
+        InspectHandler.configure_inspector_parser(parser)
+        ResultWriter.configure_parser(parser)
+        Profiler.configure_parser(parser)
+        Telemetry.configure_parser(parser)
+
     @staticmethod
-    def handle(args: Namespace):
+    def configure_inspector_parser(parser: ArgumentParser):
         """
-        Recursively looks through a directory and its sub directories searching for key words in csv files and their
-        file paths
+        Configures the arguments for how an inspector of the data directory reads, caches and budgets the csv files,
+        which are shared by the handlers that inspect them
 
-        @param args: The arguments for the inspect handler, including key words to search for
+        @param parser: The parser to configure
         """
 
-        assert InspectHandler._csv_objects is None
-        assert InspectHandler._key_words is None
-        assert InspectHandler._data_path is None
-
-        InspectHandler._csv_objects = {}
-        InspectHandler._key_words = args.key_words
-        InspectHandler._data_path = args.data_path
-
-        Handler._directory_walk(dir_path=args.data_path, action=InspectHandler._inspect_file)
+        Handler.configure_parser(parser)
 
-        # Print out all the info in the csv objects
-        info: list = InspectHandler._get_info(verbose=args.verbose)
-        for output_line in info:
-            print(output_line)
+        parser.add_argument(
+            CHUNK_ROWS_ARG, type=positive_int, action=STORE_ACTION, required=False, help=CHUNK_ROWS_ARG_HELP
+        )
+        parser.add_argument(
+            WORKERS_ARG, type=positive_int, default=1, action=STORE_ACTION, required=False, help=WORKERS_ARG_HELP
+        )
+        parser.add_argument(
+            BACKEND_ARG, type=str, default=PROCESS_BACKEND, choices=[PROCESS_BACKEND, THREAD_BACKEND],
+            action=STORE_ACTION, required=False, help=BACKEND_ARG_HELP
+        )
+        parser.add_argument(PREFILTER_ARG, action=STORE_TRUE_ACTION, required=False, help=PREFILTER_ARG_HELP)
+        parser.add_argument(NO_CACHE_ARG, action=STORE_TRUE_ACTION, required=False, help=NO_CACHE_ARG_HELP)
+        parser.add_argument(REBUILD_CACHE_ARG, action=STORE_TRUE_ACTION, required=False, help=REBUILD_CACHE_ARG_HELP)
+        parser.add_argument(CACHE_PATH_ARG, type=str, action=STORE_ACTION, required=False, help=CACHE_PATH_ARG_HELP)
+        parser.add_argument(
+            CACHE_SIZE_ARG, type=positive_int, default=SummaryCache.DEFAULT_MAX_MIB, action=STORE_ACTION,
+            required=False, help=CACHE_SIZE_ARG_HELP
+        )
+        parser.add_argument(CACHE_HASH_ARG, action=STORE_TRUE_ACTION, required=False, help=CACHE_HASH_ARG_HELP)
+        parser.add_argument(ARCHIVES_ARG, action=STORE_TRUE_ACTION, required=False, help=ARCHIVES_ARG_HELP)
+        parser.add_argument(
+            MEMORY_BUDGET_ARG, type=positive_int, action=STORE_ACTION, required=False, help=MEMORY_BUDGET_ARG_HELP
+        )
 
     @staticmethod
-    def _inspect_file(*args):
+    def get_memory_budget(args: Namespace) -> MemoryBudget:
         """
-        Inspects a file in a directory and collects information about it if it's a csv, else ignores it
+        Creates the memory budget of inspecting the csv files from the arguments configured for an inspector
 
-        @param args: Contains the file path that may be a csv
+        @param args: The arguments
+        @return: The memory budget or None if there is none
         """
 
-        _, file_path = args
-
-        if file_path.endswith(CSV_EXTENSION):
-            csv_obj: CSVObject = CSVObject(csv_path=file_path)
-
-            # Remove the root directory from the file path before looking for matches, it being arbitrary and irrelevant
-            file_path: str = remove_root_dir(file_path=file_path, root=InspectHandler._data_path)
+        if args.memory_budget is None:
+            return None
 
-            assert file_path not in InspectHandler._csv_objects
-
-            # Check for key word matches in the file path
-            relevant: bool = InspectHandler._check_matches(potential_matches={file_path})
-
-            # If a key word wasn't in the file path, check the column names
-            if not relevant:
-                col_names: Iterable = csv_obj.get_csv_col_names()
-                relevant: bool = InspectHandler._check_matches(potential_matches=col_names)
-
-            # If a key word wasn't in the column names, check the values of nominal columns
-            if not relevant:
-                nominal_cols: set = csv_obj.get_nominal_cols()
-                for nominal_col in nominal_cols:
-                    assert type(nominal_col) is NominalColumn
-
-                    classes: set = nominal_col.get_classes()
-                    relevant: bool = InspectHandler._check_matches(potential_matches=classes)
-
-                    if relevant:
-                        break
-
-            if relevant:
-                InspectHandler._csv_objects[file_path] = csv_obj
+        return MemoryBudget(max_bytes=args.memory_budget * MemoryBudget.BYTES_PER_MIB)
 
     @staticmethod
-    def _check_matches(potential_matches: Iterable) -> bool:
+    def get_cache(args: Namespace) -> SummaryCache:
         """
-        Checks for matches with the key words and a collection of strings
+        Opens the cache of the summaries of the csv files from the arguments configured for an inspector
 
-        @param potential_matches: The collection of strings that might contain one of the key words
-        @return: Whether there is a match or not
+        @param args: The arguments
+        @return: The cache, which the caller closes, or None if not caching
         """
 
-        for kw in InspectHandler._key_words:
-            assert type(kw) is str
-            kw: str = kw.lower()
-
-            for potential_match in potential_matches:
-                assert type(potential_match) is str
-                potential_match: str = potential_match.lower()
+        if args.no_cache:
+            return None
 
-                if kw in potential_match:
-                    return True
-        return False
+        return SummaryCache(
+            cache_path=args.cache_path, max_bytes=args.cache_size * SummaryCache.BYTES_PER_MIB,
+            use_hash=args.cache_hash, rebuild=args.rebuild_cache
+        )
 
     @staticmethod
-    def _get_info(verbose: bool) -> list:
+    def handle(args: Namespace, csv_paths: Iterator[tuple] = None, telemetry: Telemetry = None):
         """
-        Creates and returns the information for all the relevant csv files
+        Recursively looks through a directory and its sub directories searching for key words in csv files and their
+        file paths
 
-        @param verbose: Whether to print extra information about the CSV columns rather than just their names
-        @return: The list of output lines
+        @param args: The arguments for the inspect handler, including key words to search for
+        @param csv_paths: The paths to the csv files to inspect and their paths relative to the data directory, which
+        may still be arriving while they are inspected, or None to walk the data directory for them
+        @param telemetry: The telemetry to record the events of the inspection in, which is closed before the output is
+        printed, or None to record them in telemetry of its own
         """
 
-        # If there are no relevant CSVs, return the no output message
-        if len(InspectHandler._csv_objects) == 0:
-            return [NO_OUTPUT_MSG]
-
-        inspect_handler_info: list = []
-
-        # Sort the file paths when collecting the csv info to ensure determinism
-        file_paths: list = sorted(InspectHandler._csv_objects.keys())
-
-        for file_path in file_paths:
-            csv_obj: CSVObject = InspectHandler._csv_objects[file_path]
-            csv_obj_info: list = csv_obj.get_info(verbose=verbose)
-            inspect_handler_info.append(file_path)
-            inspect_handler_info.extend(csv_obj_info)
-        return inspect_handler_info
+        profiler: Profiler = Profiler(enabled=args.profile, top=args.profile_top, pstats_path=args.profile_pstats)
+        if telemetry is None:
+            telemetry: Telemetry = Telemetry(
+                metrics_path=args.metrics_file, progress=args.progress, interval=args.metrics_interval
+            )
+
+        result_writer: ResultWriter = ResultWriter(output_format=args.format, output_path=args.output)
+        memory_budget: MemoryBudget = InspectHandler.get_memory_budget(args=args)
+        cache: SummaryCache = InspectHandler.get_cache(args=args)
+
+        # A single query has no use for keeping the summaries warm, so it only reads as much of each csv file as
+        # matching requires unless caching it
+        inspector: Inspector = Inspector(
+            data_path=args.data_path, chunk_rows=args.chunk_rows, workers=args.workers, backend=args.backend,
+            prefilter=args.prefilter, archives=args.archives, cache=cache, memory_budget=memory_budget,
+            keep_warm=False
+        )
+
+        # The relevant csv files are only collected for the text format, which is written once they are all found. Only
+        # the records and the verbose text need the values of the relevant csv files rather than just their headers.
+        on_relevant: callable = result_writer.write_record if result_writer.is_streaming() else None
+
+        try:
+            csv_objects: dict = inspector.match(
+                key_words=args.key_words, csv_paths=csv_paths, on_relevant=on_relevant, profiler=profiler,
+                telemetry=telemetry, summarize_relevant=args.verbose or result_writer.is_streaming()
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+
+            telemetry.close()
+
+        # Print out all the info in the csv objects, unless each relevant csv file was already written as it was found
+        with profiler.stage(name=OUTPUT_STAGE):
+            if not result_writer.is_streaming():
+                info: list = Inspector.get_csv_objects_info(csv_objects=csv_objects, verbose=args.verbose)
+                result_writer.write_lines(lines=info)
+
+            result_writer.close()
+
+        profiler.report()
+
+        if memory_budget is not None:
+            memory_budget.report()
@@ -0,0 +1,579 @@
+"""Module for the inspector class"""
+
+import sys
+from collections import Iterable
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, wait
+from contextlib import nullcontext
+from functools import partial
+from os import stat, stat_result
+from os.path import getsize
+from threading import Lock
+from typing import Iterator
+
+from handler.archive_walker import ArchiveWalker
+from handler.inspect_handler.csv_object import CSVObject, NominalColumn
+from handler.inspect_handler.key_word_matcher import KeyWordMatcher
+from handler.inspect_handler.memory_budget import MemoryBudget
+from handler.inspect_handler.summary_cache import SummaryCache
+from handler.profiler import FileProfile, Profiler
+from handler.telemetry import Telemetry
+from handler.utils import get_compression, get_csv_paths, get_decompressed_name, get_executor, is_compressed_dir, is_csv
+from strings.args import PROCESS_BACKEND
+from strings.inspect_handler import DUPLICATE_CSV_MSG, NO_OUTPUT_MSG
+from strings.profiler import INSPECT_STAGE, WALK_STAGE
+
+
+class Inspector:
+    """
+    A session of inspecting the csv files in a data directory using key words, which can answer any number of queries
+    with different key words. When keeping summaries warm, every csv file that is read is fully summarized and kept in
+    memory along with its size and modification time, so that later queries only read the csv files that were added or
+    modified since then and forget those that were removed. Otherwise only as much of each csv file is read as matching
+    requires, as suits a single query. Queries can be made from several threads at once. The csv files inside archives
+    are not kept warm and are read again by every query.
+    """
+
+    # The number of csv files sent to a worker process at once, amortizing the cost of communicating with it
+    PROCESS_CHUNK_SIZE: int = 8
+
+    def __init__(
+        self, data_path: str, chunk_rows: int = None, workers: int = 1, backend: str = PROCESS_BACKEND,
+        prefilter: bool = False, archives: bool = False, cache: SummaryCache = None, memory_budget: MemoryBudget = None,
+        keep_warm: bool = True
+    ):
+        assert chunk_rows is None or chunk_rows > 0
+        assert workers > 0
+
+        self._data_path: str = data_path
+        self._chunk_rows: int = chunk_rows
+        self._workers: int = workers
+        self._backend: str = backend
+        self._prefilter: bool = prefilter
+        self._archives: bool = archives
+        self._cache: SummaryCache = cache
+        self._memory_budget: MemoryBudget = memory_budget
+        self._keep_warm: bool = keep_warm
+
+        # The size, modification time and fully loaded csv object of each csv file mapped to by its path, which the
+        # queries made from different threads share along with the cache
+        self._warm_summaries: dict = {}
+        self._lock: Lock = Lock()
+
+    def get_data_path(self) -> str:
+        """
+        Gets the path to the data directory that is inspected
+
+        @return: The path
+        """
+
+        return self._data_path
+
+    def inspect(self, key_words: list, verbose: bool = False) -> list:
+        """
+        Creates the same output as the inspect handler prints for the csv files containing any of the key words
+
+        @param key_words: The key words to search for
+        @param verbose: Whether to include extra information about the CSV columns rather than just their names
+        @return: The list of output lines
+        """
+
+        csv_objects: dict = self.match(key_words=key_words, summarize_relevant=verbose)
+        return Inspector.get_csv_objects_info(csv_objects=csv_objects, verbose=verbose)
+
+    def refresh(self):
+        """
+        Summarizes the csv files that were added or modified since they were last kept warm and forgets the csv files
+        that were removed, without searching for any key words, so that the next query reads nothing new
+        """
+
+        assert self._keep_warm
+
+        self._run(
+            matcher=None, csv_paths=None, on_relevant=None, profiler=Profiler(enabled=False), telemetry=Telemetry(),
+            summarize_relevant=False
+        )
+
+    def match(
+        self, key_words: list, csv_paths: Iterator[tuple] = None, on_relevant: callable = None,
+        profiler: Profiler = None, telemetry: Telemetry = None, summarize_relevant: bool = True
+    ) -> dict:
+        """
+        Searches for key words in the paths, column names and nominal values of csv files. Each csv file is only read as
+        far as matching it requires, reading its values only if no key word is in its path or column names, unless it is
+        kept warm or cached.
+
+        @param key_words: The key words to search for
+        @param csv_paths: The paths to the csv files to inspect and their paths relative to the data directory, which
+        may still be arriving while they are inspected, or None to walk the data directory for them
+        @param on_relevant: The function called with the relative path and csv object of each relevant csv file as soon
+        as it is found rather than collecting them, or None to collect them
+        @param profiler: The profiler to time the query and add the profile of each csv file to, or None to not profile
+        @param telemetry: The telemetry to record the events of the query in, which is left open, or None to not record
+        them
+        @param summarize_relevant: Whether to fully summarize the relevant csv files, which the verbose output and the
+        records need, rather than leaving those matched by their path or column names with only their header read
+        @return: The csv objects of the relevant csv files mapped to by their relative paths, which is empty if each was
+        passed on as it was found
+        """
+
+        return self._run(
+            matcher=KeyWordMatcher(key_words=key_words), csv_paths=csv_paths, on_relevant=on_relevant,
+            profiler=Profiler(enabled=False) if profiler is None else profiler,
+            telemetry=Telemetry() if telemetry is None else telemetry, summarize_relevant=summarize_relevant
+        )
+
+    def _run(
+        self, matcher: KeyWordMatcher, csv_paths: Iterator[tuple], on_relevant: callable, profiler: Profiler,
+        telemetry: Telemetry, summarize_relevant: bool
+    ) -> dict:
+        """
+        Inspects the csv files that are not kept warm or cached and matches the key words against all of them
+
+        @param matcher: The matcher of the key words to search for or None to only summarize the csv files
+        @param csv_paths: The paths to the csv files to inspect and their paths relative to the data directory or None
+        to walk the data directory for them
+        @param on_relevant: The function called with each relevant csv file as soon as it is found or None to collect
+        them
+        @param profiler: The profiler to time the query and add the profile of each csv file to
+        @param telemetry: The telemetry to record the events of the query in
+        @param summarize_relevant: Whether to fully summarize the relevant csv files
+        @return: The csv objects of the relevant csv files mapped to by their relative paths
+        """
+
+        # The state of a query is its own so that queries can be made at the same time
+        csv_objects: dict = {}
+        add_relevant_csv: callable = partial(
+            Inspector._add_relevant_csv, csv_objects=csv_objects, relevant_paths=set(), on_relevant=on_relevant
+        )
+
+        # The stat of each csv file that is read, taken before it is read so that a csv file modified while being read
+        # is read again by the next query
+        stats: dict = {}
+
+        # Only the csv files found by walking the whole data directory tell which of the warm csv files were removed
+        walk: bool = csv_paths is None
+        seen_paths: set = set()
+
+        # The prefilter is skipped if some key word could match a csv without being in its raw bytes. Every csv that is
+        # read is fully summarized when keeping it warm or caching it so that it can be matched against any key words in
+        # later queries. The telemetry and the memory budget take the size, rows, duration, error and peak memory of
+        # each csv from its profile.
+        memory_budget: MemoryBudget = self._memory_budget
+        inspect_path: callable = partial(
+            Inspector._inspect_path, matcher=matcher, chunk_rows=self._chunk_rows,
+            prefilter=self._prefilter and matcher is not None and matcher.can_prefilter(),
+            summarize=self._keep_warm or self._cache is not None, summarize_relevant=summarize_relevant,
+            profile=profiler.is_enabled() or telemetry.is_enabled() or memory_budget is not None,
+            memory_budget=None if memory_budget is None else memory_budget.get_max_bytes()
+        )
+
+        if walk:
+            # The csv files inside archives cannot be kept warm so they are not summarized without key words
+            include_archives: bool = self._archives and matcher is not None
+            csv_paths: Iterator[tuple] = get_csv_paths(data_path=self._data_path, include_archives=include_archives)
+
+        # The csv files are found as they are inspected, so the time spent walking is also part of inspecting
+        csv_paths: Iterator[tuple] = profiler.time_iterator(name=WALK_STAGE, iterator=csv_paths)
+        csv_paths: Iterator[tuple] = self._match_summaries(
+            csv_paths=csv_paths, matcher=matcher, add_relevant_csv=add_relevant_csv, stats=stats, seen_paths=seen_paths
+        )
+
+        # Only the csv files that were not matched from memory or the cache are inspected and recorded in the telemetry
+        csv_paths: Iterator[tuple] = telemetry.walk(files=csv_paths)
+
+        collect_csv_objects: callable = partial(
+            self._collect_csv_objects, matcher=matcher, profiler=profiler, telemetry=telemetry,
+            add_relevant_csv=add_relevant_csv, stats=stats
+        )
+
+        with profiler.stage(name=INSPECT_STAGE):
+            if self._workers > 1:
+                with get_executor(workers=self._workers, backend=self._backend) as executor:
+                    if memory_budget is not None:
+                        collect_csv_objects(results=self._inspect_within_budget(
+                            inspect_path=inspect_path, csv_paths=csv_paths, executor=executor
+                        ))
+                    else:
+                        chunk_size: int = Inspector.PROCESS_CHUNK_SIZE if self._backend == PROCESS_BACKEND else 1
+                        collect_csv_objects(results=executor.map(inspect_path, csv_paths, chunksize=chunk_size))
+            elif memory_budget is not None:
+                collect_csv_objects(results=self._inspect_within_budget(
+                    inspect_path=inspect_path, csv_paths=csv_paths, executor=None
+                ))
+            else:
+                collect_csv_objects(results=map(inspect_path, csv_paths))
+
+        if walk and self._keep_warm:
+            with self._lock:
+                for csv_path in set(self._warm_summaries.keys()) - seen_paths:
+                    del self._warm_summaries[csv_path]
+
+        return csv_objects
+
+    def _match_summaries(
+        self, csv_paths: Iterator[tuple], matcher: KeyWordMatcher, add_relevant_csv: callable, stats: dict,
+        seen_paths: set
+    ) -> Iterator[tuple]:
+        """
+        Matches the key words against the csv objects of the csv files that are kept warm or cached, collecting the
+        relevant ones, and yields the other csv files so that they get inspected
+
+        @param csv_paths: The paths to the csv files and their paths relative to the data directory
+        @param matcher: The matcher of the key words to search for or None to only summarize the csv files
+        @param add_relevant_csv: The function that collects a relevant csv file
+        @param stats: The dictionary to add the stat of each csv file that is yielded to, mapped to by its path
+        @param seen_paths: The set to add the path of each csv file to
+        @return: Generator of the paths to the csv files that are not kept warm or cached and their relative paths
+        """
+
+        for file_path, rel_path in csv_paths:
+            # The csv files inside archives are neither kept warm nor cached
+            if is_compressed_dir(file_name=file_path):
+                yield file_path, rel_path
+                continue
+
+            seen_paths.add(file_path)
+            csv_obj: CSVObject = None
+
+            if self._keep_warm:
+                csv_stat: stat_result = stat(file_path)
+
+                with self._lock:
+                    size, mtime_ns, warm_csv_obj = self._warm_summaries.get(file_path, (None, None, None))
+
+                if size == csv_stat.st_size and mtime_ns == csv_stat.st_mtime_ns:
+                    csv_obj: CSVObject = warm_csv_obj
+                else:
+                    stats[file_path] = csv_stat
+
+            if csv_obj is None and self._cache is not None:
+                with self._lock:
+                    csv_obj: CSVObject = self._cache.get(csv_path=file_path)
+
+                if csv_obj is not None:
+                    self._keep_summary(csv_path=file_path, csv_obj=csv_obj, stats=stats)
+
+            if csv_obj is None:
+                yield file_path, rel_path
+            elif matcher is not None and Inspector._is_relevant(csv_obj=csv_obj, rel_path=rel_path, matcher=matcher):
+                add_relevant_csv(rel_path=rel_path, csv_obj=csv_obj)
+
+    def _collect_csv_objects(
+        self, results: Iterable, matcher: KeyWordMatcher, profiler: Profiler, telemetry: Telemetry,
+        add_relevant_csv: callable, stats: dict
+    ):
+        """
+        Collects the csv objects of the relevant csv files as the results of inspecting them become available, keeping
+        warm and caching every csv object that was fully summarized
+
+        @param results: The results of inspecting each csv file or archive, which are a list of the paths of each csv
+        file, its csv object if it was relevant or summarized, whether it was relevant and its profile if profiling
+        @param matcher: The matcher of the key words to search for or None if only summarizing the csv files
+        @param profiler: The profiler to add the profile of each csv file to
+        @param telemetry: The telemetry to record each csv file finishing in
+        @param add_relevant_csv: The function that collects a relevant csv file
+        @param stats: The stat of each csv file taken before it was read, mapped to by its path
+        """
+
+        for path_results in results:
+            for (file_path, rel_path), csv_obj, relevant, file_profile in path_results:
+                profiler.add_file(file_profile=file_profile)
+                telemetry.file_finished(file_profile=file_profile, relevant=relevant)
+
+                if self._memory_budget is not None:
+                    self._memory_budget.add_file(file_profile=file_profile)
+
+                # The csv files inside archives have no path of their own
+                if csv_obj is not None and file_path is not None:
+                    self._keep_summary(csv_path=file_path, csv_obj=csv_obj, stats=stats)
+
+                # A csv file that was rejected by the prefilter without being read has no csv object to cache
+                if self._cache is not None and file_path is not None:
+                    with self._lock:
+                        if csv_obj is None:
+                            self._cache.discard(csv_path=file_path)
+                        else:
+                            self._cache.put(csv_path=file_path, csv_obj=csv_obj)
+
+                if relevant:
+                    add_relevant_csv(rel_path=rel_path, csv_obj=csv_obj)
+
+            telemetry.path_finished()
+
+    def _keep_summary(self, csv_path: str, csv_obj: CSVObject, stats: dict):
+        """
+        Keeps the fully loaded csv object of a csv file warm if keeping summaries warm
+
+        @param csv_path: The path to the csv file
+        @param csv_obj: The csv object
+        @param stats: The stat of each csv file taken before it was read, mapped to by its path
+        """
+
+        if self._keep_warm and csv_path in stats:
+            csv_stat: stat_result = stats.pop(csv_path)
+
+            with self._lock:
+                self._warm_summaries[csv_path] = (csv_stat.st_size, csv_stat.st_mtime_ns, csv_obj)
+
+    @staticmethod
+    def _add_relevant_csv(
+        rel_path: str, csv_obj: CSVObject, csv_objects: dict, relevant_paths: set, on_relevant: callable
+    ):
+        """
+        Collects the csv object of a relevant csv file, or passes it on right away if asked to. Only the first of the
+        csv files that are inspected under the same relative path, such as compressed csv files inside an archive that
+        decompress to the same path, is kept.
+
+        @param rel_path: The path of the csv file relative to the data directory
+        @param csv_obj: The csv object of the csv file
+        @param csv_objects: The csv objects of the relevant csv files collected so far
+        @param relevant_paths: The relative paths of the relevant csv files collected or passed on so far
+        @param on_relevant: The function to pass the relevant csv file on to or None to collect it
+        """
+
+        if rel_path in relevant_paths:
+            print(DUPLICATE_CSV_MSG.format(rel_path), file=sys.stderr)
+            return
+
+        relevant_paths.add(rel_path)
+
+        if on_relevant is None:
+            csv_objects[rel_path] = csv_obj
+        else:
+            on_relevant(rel_path, csv_obj)
+
+    def _inspect_within_budget(
+        self, inspect_path: callable, csv_paths: Iterator[tuple], executor: Executor
+    ) -> Iterator[list]:
+        """
+        Inspects csv files and archives within the memory budget, planning how to read each one before it is inspected.
+        With a pool of workers, a csv file or archive is only handed to a worker once the estimated memory of those
+        already being inspected leaves room for it in the budget, although one is always handed to a worker if none
+        are being inspected.
+
+        @param inspect_path: The function that inspects a csv file or archive
+        @param csv_paths: The paths to the csv files and archives and their paths relative to the data directory
+        @param executor: The pool of workers or None to inspect them in this process one at a time
+        @return: Generator of the results of inspecting each csv file or archive as they become available
+        """
+
+        memory_budget: MemoryBudget = self._memory_budget
+
+        # The estimated memory of each csv file or archive being inspected, mapped to by its inspection
+        inspections: dict = {}
+
+        for paths in csv_paths:
+            footprint, path_chunk_rows = memory_budget.plan(csv_paths=paths, chunk_rows=self._chunk_rows)
+
+            if executor is None:
+                yield inspect_path(paths, chunk_rows=path_chunk_rows)
+                continue
+
+            while not memory_budget.reserve(footprint=footprint, force=len(inspections) == 0):
+                done, _ = wait(inspections, return_when=FIRST_COMPLETED)
+
+                for inspection in done:
+                    memory_budget.release(footprint=inspections.pop(inspection))
+                    yield inspection.result()
+
+            inspection: Future = executor.submit(inspect_path, paths, chunk_rows=path_chunk_rows)
+            inspections[inspection] = footprint
+
+        while len(inspections) > 0:
+            done, _ = wait(inspections, return_when=FIRST_COMPLETED)
+
+            for inspection in done:
+                memory_budget.release(footprint=inspections.pop(inspection))
+                yield inspection.result()
+
+    @staticmethod
+    def _inspect_path(
+        csv_paths: tuple, matcher: KeyWordMatcher, chunk_rows: int, prefilter: bool, summarize: bool,
+        summarize_relevant: bool, profile: bool, memory_budget: int
+    ) -> list:
+        """
+        Inspects a csv file, or each csv file inside an archive
+
+        @param csv_paths: The path to the csv file or archive and its path relative to the data directory
+        @param matcher: The matcher of the key words to search for or None to only summarize the csv file
+        @param chunk_rows: The number of rows to read from the csv at a time or None to read it all at once
+        @param prefilter: Whether to reject a csv file without parsing it if none of the key words are in its raw bytes
+        @param summarize: Whether to fully summarize a csv file even if it is irrelevant
+        @param summarize_relevant: Whether to fully summarize a csv file if it is relevant
+        @param profile: Whether to record the profile of inspecting each csv file
+        @param memory_budget: The number of bytes that parsing a csv file inside an archive may take, which is planned
+        beforehand for a csv file on its own, or None if there is no memory budget. The peak memory of inspecting each
+        csv file is measured when there is one.
+        @return: The results of inspecting each csv file, along with its profile or None if not profiling
+        """
+
+        file_path, rel_path = csv_paths
+        measure_memory: bool = memory_budget is not None
+
+        if is_compressed_dir(file_name=file_path):
+            return Inspector._inspect_archive(
+                archive_paths=csv_paths, matcher=matcher, chunk_rows=chunk_rows, profile=profile,
+                memory_budget=memory_budget
+            )
+
+        file_profile: FileProfile = FileProfile(rel_path=rel_path, n_bytes=getsize(file_path)) if profile else None
+
+        with file_profile.record(measure_memory=measure_memory) if profile else nullcontext():
+            result: tuple = Inspector._inspect_file(
+                csv_paths=csv_paths, matcher=matcher, chunk_rows=chunk_rows, prefilter=prefilter, summarize=summarize,
+                summarize_relevant=summarize_relevant
+            )
+
+        return [result + (file_profile,)]
+
+    @staticmethod
+    def _inspect_archive(
+        archive_paths: tuple, matcher: KeyWordMatcher, chunk_rows: int, profile: bool, memory_budget: int
+    ) -> list:
+        """
+        Inspects the csv files inside an archive and the archives nested in it by reading them straight from the
+        archives. Since each csv file can only be read once, it is fully summarized before being matched.
+
+        @param archive_paths: The path to the archive and its path relative to the data directory
+        @param matcher: The matcher of the key words to search for
+        @param chunk_rows: The number of rows to read from each csv at a time or None to read it all at once
+        @param profile: Whether to record the profile of inspecting each csv file
+        @param memory_budget: The number of bytes that parsing each csv file may take or None if there is no memory
+        budget. The peak memory of inspecting each csv file is measured when there is one.
+        @return: The results of inspecting each csv file, whose path is None since it only exists inside the archive,
+        along with its profile or None if not profiling
+        """
+
+        archive_path, archive_rel_path = archive_paths
+
+        # The csv objects are given the path each csv file would have if the archive were extracted
+        data_path: str = archive_path[:len(archive_path) - len(archive_rel_path)]
+        results: list = []
+
+        for rel_path, csv_file, csv_size in ArchiveWalker(archive_path=archive_path, rel_path=archive_rel_path):
+            if not is_csv(file_name=rel_path):
+                continue
+
+            # A compressed csv file is decompressed as it is read, and given the path it would have once decompressed
+            csv_obj: CSVObject = CSVObject(
+                csv_path=data_path + rel_path, chunk_rows=chunk_rows, memory_budget=memory_budget
+            )
+
+            if get_compression(file_name=rel_path) is not None:
+                rel_path: str = get_decompressed_name(file_name=rel_path)
+
+            file_profile: FileProfile = FileProfile(rel_path=rel_path, n_bytes=csv_size) if profile else None
+
+            with file_profile.record(measure_memory=memory_budget is not None) if profile else nullcontext():
+                csv_obj.load_values(csv_file=csv_file, csv_size=csv_size)
+                relevant: bool = Inspector._is_relevant(csv_obj=csv_obj, rel_path=rel_path, matcher=matcher)
+
+            results.append(((None, rel_path), csv_obj if relevant else None, relevant, file_profile))
+
+        return results
+
+    @staticmethod
+    def _inspect_file(
+        csv_paths: tuple, matcher: KeyWordMatcher, chunk_rows: int, prefilter: bool, summarize: bool,
+        summarize_relevant: bool
+    ) -> tuple:
+        """
+        Inspects a csv file and collects information about it if it is relevant. Since this may run in a separate
+        worker process, the relevant information is summarized here as far as it is needed and everything it needs is
+        passed to it.
+
+        @param csv_paths: The path to the csv file and its path relative to the data directory
+        @param matcher: The matcher of the key words to search for or None to only summarize the csv file
+        @param chunk_rows: The number of rows to read from the csv at a time or None to read it all at once
+        @param prefilter: Whether to reject the csv without parsing it if none of the key words are in its raw bytes
+        @param summarize: Whether to fully summarize the csv even if it is irrelevant
+        @param summarize_relevant: Whether to fully summarize the csv if it is relevant rather than only reading as much
+        of it as matching required
+        @return: The paths of the csv file, its csv object or None if it is irrelevant and not summarized, and whether
+        it is relevant
+        """
+
+        file_path, rel_path = csv_paths
+
+        # The csv object only reads as much of the csv as the stage of matching requires, unless summarizing it
+        csv_obj: CSVObject = CSVObject(csv_path=file_path, chunk_rows=chunk_rows)
+
+        # The raw bytes of a compressed csv are not its contents so it cannot be prefiltered
+        prefilter: bool = prefilter and get_compression(file_name=file_path) is None
+
+        if prefilter and not matcher.matches(potential_matches=[rel_path]):
+            if not matcher.may_match_file(file_path=file_path):
+                return csv_paths, None, False
+
+        if summarize:
+            csv_obj.load_values()
+
+        if matcher is None or not Inspector._is_relevant(csv_obj=csv_obj, rel_path=rel_path, matcher=matcher):
+            return csv_paths, csv_obj if summarize else None, False
+
+        if summarize_relevant:
+            csv_obj.load_values()
+
+        return csv_paths, csv_obj, True
+
+    @staticmethod
+    def _is_relevant(csv_obj: CSVObject, rel_path: str, matcher: KeyWordMatcher) -> bool:
+        """
+        Determines whether a csv file contains any of the key words in its relative path, column names or nominal
+        values, only reading as much of the csv as is needed
+
+        @param csv_obj: The csv object of the csv file
+        @param rel_path: The path of the csv file relative to the data directory
+        @param matcher: The matcher of the key words to search for or None if there are no key words
+        @return: The truth value of the above mentioned query
+        """
+
+        if matcher is None:
+            return False
+
+        # Look for matches in the relative path since the root directory is arbitrary and irrelevant
+        if matcher.matches(potential_matches=[rel_path]):
+            return True
+
+        # If a key word wasn't in the file path, check the column names which only requires reading the header
+        col_names: Iterable = csv_obj.get_csv_col_names()
+        if matcher.matches(potential_matches=col_names):
+            return True
+
+        # If a key word wasn't in the column names, check the values of nominal columns which requires reading the
+        # entire csv
+        nominal_cols: set = csv_obj.get_nominal_cols()
+        for nominal_col in nominal_cols:
+            assert type(nominal_col) is NominalColumn
+
+            classes: set = nominal_col.get_classes()
+            if matcher.matches(potential_matches=classes):
+                return True
+
+        return False
+
+    @staticmethod
+    def get_csv_objects_info(csv_objects: dict, verbose: bool) -> list:
+        """
+        Creates and returns the information for a collection of relevant csv files
+
+        @param csv_objects: The csv objects of the relevant csv files mapped to by their relative paths
+        @param verbose: Whether to print extra information about the CSV columns rather than just their names
+        @return: The list of output lines
+        """
+
+        # If there are no relevant CSVs, return the no output message
+        if len(csv_objects) == 0:
+            return [NO_OUTPUT_MSG]
+
+        inspect_handler_info: list = []
+
+        # Sort the file paths when collecting the csv info to ensure determinism
+        file_paths: list = sorted(csv_objects.keys())
+
+        for file_path in file_paths:
+            csv_obj: CSVObject = csv_objects[file_path]
+            csv_obj_info: list = csv_obj.get_info(verbose=verbose)
+            inspect_handler_info.append(file_path)
+            inspect_handler_info.extend(csv_obj_info)
+        return inspect_handler_info
@@ -0,0 +1,146 @@
+"""Module for the key word matcher class"""
+
+from mmap import ACCESS_READ, mmap
+from os import fstat
+from re import compile as compile_regex, escape, IGNORECASE
+from string import digits
+from typing import Iterable, Pattern
+
+from handler.profiler import FileProfile
+from strings.general import NAN
+from strings.inspect_handler import (
+    ASCII, CASE_FOLDED_ASCII_CHARS, DUPLICATE_COL_SEPARATOR, KEY_WORD_SEPARATOR, MATCH_SEPARATOR, NUMERIC_TYPE_KEY,
+    QUOTE_CHAR, READ_BYTES_OPT, SEPARATOR_IN_KEY_WORD_MSG, UNNAMED_COL_PREFIX, UTF8
+)
+from strings.profiler import MATCH_SECTION
+
+
+class KeyWordMatcher:
+    """
+    Finds case-insensitive matches of any of a list of key words in collections of strings. The key words are compiled
+    once into a single pattern so each collection is lowercased and scanned a single time regardless of the number of
+    key words, rather than once per key word.
+    """
+
+    def __init__(self, key_words: list):
+        assert len(key_words) > 0
+
+        # Map the lowercase key words back to the key words as they were given, the first one winning on duplicates
+        self._key_words: dict = {}
+        for kw in key_words:
+            assert type(kw) is str
+
+            # A key word containing the separator could match across the joined strings rather than within one of them
+            if MATCH_SEPARATOR in kw:
+                raise ValueError(SEPARATOR_IN_KEY_WORD_MSG.format(kw))
+
+            self._key_words.setdefault(kw.lower(), kw)
+
+        self._pattern: Pattern = compile_regex(KEY_WORD_SEPARATOR.join(escape(kw) for kw in self._key_words))
+        self._bytes_pattern: Pattern = KeyWordMatcher._get_bytes_pattern(key_words=self._key_words)
+
+    @staticmethod
+    def _get_bytes_pattern(key_words: Iterable) -> Pattern:
+        """
+        Compiles the pattern which searches for the key words in the raw bytes of a file, if a file without any of them
+        in its bytes is sure to not have any of them in its column names or nominal values either
+
+        @param key_words: The lowercase key words
+        @return: The compiled pattern or None if the key words cannot be searched for in the raw bytes of a file
+        """
+
+        bytes_key_words: list = []
+
+        for kw in key_words:
+            if not KeyWordMatcher._can_prefilter(key_word=kw):
+                return None
+
+            bytes_key_words.append(escape(kw.encode(ASCII)))
+
+        # Lowercasing the few non-ascii characters whose lowercase contains an ascii character can produce a match
+        bytes_key_words.extend(escape(char.encode(UTF8)) for char in CASE_FOLDED_ASCII_CHARS)
+
+        return compile_regex(KEY_WORD_SEPARATOR.encode(ASCII).join(bytes_key_words), IGNORECASE)
+
+    @staticmethod
+    def _can_prefilter(key_word: str) -> bool:
+        """
+        Determines whether a key word can only be in the column names or nominal values of a csv if it is in its raw
+        bytes. Otherwise it could match a string that pandas or the nominal columns make up rather than read, such as
+        the nan and numeric classes, the names of unnamed and duplicate columns or values whose quotes were unescaped.
+
+        @param key_word: The lowercase key word
+        @return: The truth value of the above mentioned query
+        """
+
+        try:
+            key_word.encode(ASCII)
+        except UnicodeEncodeError:
+            return False
+
+        if QUOTE_CHAR in key_word:
+            return False
+
+        made_up_strs: list = [NAN, NUMERIC_TYPE_KEY.lower(), UNNAMED_COL_PREFIX.lower()]
+        if any(key_word in made_up_str for made_up_str in made_up_strs):
+            return False
+
+        # The names pandas gives to unnamed and duplicate columns end in a number, such as "Unnamed: 3" and "name.1"
+        key_word: str = key_word.rstrip(digits)
+        return not key_word.endswith(DUPLICATE_COL_SEPARATOR) and not UNNAMED_COL_PREFIX.lower().endswith(key_word)
+
+    def can_prefilter(self) -> bool:
+        """
+        Determines whether files can be rejected by searching for the key words in their raw bytes
+
+        @return: The truth value of the above mentioned query
+        """
+
+        return self._bytes_pattern is not None
+
+    def may_match_file(self, file_path: str) -> bool:
+        """
+        Memory maps a file and searches for the key words in its raw bytes, without decoding or parsing it
+
+        @param file_path: The path to the file
+        @return: Whether any of the key words can be in the file
+        """
+
+        assert self.can_prefilter()
+
+        with FileProfile.section(name=MATCH_SECTION), open(file_path, READ_BYTES_OPT) as f:
+            # Empty files cannot be memory mapped and contain nothing to match anyway
+            if fstat(f.fileno()).st_size == 0:
+                return False
+
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as mapped_file:
+                return self._bytes_pattern.search(mapped_file) is not None
+
+    def matches(self, potential_matches: Iterable) -> bool:
+        """
+        Checks for matches with the key words and a collection of strings
+
+        @param potential_matches: The collection of strings that might contain one of the key words
+        @return: Whether there is a match or not
+        """
+
+        return self.search(potential_matches=potential_matches) is not None
+
+    def search(self, potential_matches: Iterable) -> str:
+        """
+        Finds a key word contained in a collection of strings
+
+        @param potential_matches: The collection of strings that might contain one of the key words
+        @return: The key word that matched, as it was given, or None if there is no match
+        """
+
+        # The strings are scanned all at once, joined by a character that none of the key words contain and therefore
+        # cannot be part of a match
+        with FileProfile.section(name=MATCH_SECTION):
+            text: str = MATCH_SEPARATOR.join(potential_matches).lower()
+            match = self._pattern.search(text)
+
+        if match is None:
+            return None
+
+        return self._key_words[match.group()]
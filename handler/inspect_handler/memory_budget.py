@@ -0,0 +1,121 @@
+"""Module for the memory budget class"""
+
+import sys
+from threading import Lock
+
+from handler.inspect_handler.csv_object import CSVObject
+from handler.profiler import FileProfile
+from handler.utils import is_compressed_dir
+from strings.inspect_handler import MEMORY_REPORT_LINE
+
+
+class MemoryBudget:
+    """
+    Keeps the estimated memory of parsing the csv files that are inspected at once within a budget. Each csv file is
+    estimated from its size and a sample of its header and first rows before it is handed to a worker. A csv file that
+    would not fit in the budget on its own is read in chunks that do, and a worker is only handed another csv file once
+    the csv files already being inspected leave room for it. The csv files inside an archive are only found as it is
+    read, so an archive reserves the whole budget and each csv file inside it is chunked by its size alone. The budget
+    can be shared by queries made from different threads at the same time.
+    """
+
+    BYTES_PER_MIB: int = 1024 * 1024
+    BYTES_PER_MB: int = 1000 * 1000
+
+    def __init__(self, max_bytes: int):
+        assert max_bytes > 0
+
+        self._max_bytes: int = max_bytes
+        self._reserved_bytes: int = 0
+        self._largest_peak: FileProfile = None
+        self._lock: Lock = Lock()
+
+    def get_max_bytes(self) -> int:
+        """
+        Gets the size of the budget
+
+        @return: The number of bytes that the csv files inspected at once may take to parse
+        """
+
+        return self._max_bytes
+
+    def plan(self, csv_paths: tuple, chunk_rows: int) -> tuple:
+        """
+        Plans how to parse a csv file or the csv files inside an archive within the budget
+
+        @param csv_paths: The path to the csv file or archive and its path relative to the data directory
+        @param chunk_rows: The number of rows to read from the csv at a time or None to read it all at once if it fits
+        @return: The estimated number of bytes that parsing the csv file takes, which is reserved while it is inspected,
+        and the number of rows to read from it at a time or None to read it all at once
+        """
+
+        file_path, _ = csv_paths
+
+        if is_compressed_dir(file_name=file_path):
+            return self._max_bytes, chunk_rows
+
+        footprint, row_footprint = CSVObject.estimate_footprint(csv_path=file_path)
+
+        if chunk_rows is None:
+            chunk_rows: int = CSVObject.get_budget_chunk_rows(
+                footprint=footprint, row_footprint=row_footprint, memory_budget=self._max_bytes
+            )
+
+        if chunk_rows is not None:
+            footprint: int = min(footprint, chunk_rows * row_footprint)
+
+        return footprint, chunk_rows
+
+    def reserve(self, footprint: int, force: bool = False) -> bool:
+        """
+        Reserves part of the budget for a csv file while it is inspected if it fits in what is left of the budget, which
+        is checked and reserved at once so that no other thread can take what is left in between
+
+        @param footprint: The estimated number of bytes that parsing the csv file takes
+        @param force: Whether to reserve it even if it does not fit
+        @return: Whether it was reserved
+        """
+
+        with self._lock:
+            if not force and self._reserved_bytes + footprint > self._max_bytes:
+                return False
+
+            self._reserved_bytes += footprint
+            return True
+
+    def release(self, footprint: int):
+        """
+        Releases the part of the budget that was reserved for a csv file once it has been inspected
+
+        @param footprint: The estimated number of bytes that parsing the csv file takes
+        """
+
+        with self._lock:
+            assert footprint <= self._reserved_bytes
+            self._reserved_bytes -= footprint
+
+    def add_file(self, file_profile: FileProfile):
+        """
+        Adds the profile of an inspected csv file, which includes the peak memory allocated while inspecting it
+
+        @param file_profile: The profile of the csv file
+        """
+
+        peak_bytes: int = file_profile.get_peak_bytes()
+
+        with self._lock:
+            if peak_bytes is not None and (
+                self._largest_peak is None or peak_bytes > self._largest_peak.get_peak_bytes()
+            ):
+                self._largest_peak: FileProfile = file_profile
+
+    def report(self):
+        """Prints the largest peak memory allocated while inspecting a csv file to standard error"""
+
+        if self._largest_peak is None:
+            return
+
+        peak_mb: float = self._largest_peak.get_peak_bytes() / MemoryBudget.BYTES_PER_MB
+        print(MEMORY_REPORT_LINE.format(
+            self._max_bytes / MemoryBudget.BYTES_PER_MB, peak_mb, self._largest_peak.get_rel_path()
+        ), file=sys.stderr)
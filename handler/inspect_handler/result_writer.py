@@ -0,0 +1,172 @@
+"""Module for the result writer class"""
+
+import sys
+from argparse import ArgumentParser
+from json import dumps
+from typing import IO
+
+from handler.inspect_handler.csv_object import CSVObject
+from strings.args import FORMAT_ARG, FORMAT_ARG_HELP, OUTPUT_ARG, OUTPUT_ARG_HELP, STORE_ACTION
+from strings.inspect_handler import (
+    CLASSES_FIELD, COLUMNS_FIELD, ERROR_FIELD, MAX_FIELD, MEAN_FIELD, MIN_FIELD, NAME_FIELD, PATH_FIELD, RANGE_FIELD,
+    STD_FIELD, TYPE_FIELD
+)
+from strings.result_writer import *
+
+
+class ResultWriter:
+    """
+    Writes the results of inspecting csv files to standard output or a file. The text format is written once every csv
+    file has been inspected so that it can be sorted by path. The machine readable formats write a record of each
+    relevant csv file as soon as it is found in the order they are found, so the relevant csv files never need to be
+    kept in memory. Json lines are written a record at a time while parquet is written a row group at a time.
+    """
+
+    FORMATS: list = [TEXT_FORMAT, JSONL_FORMAT, PARQUET_FORMAT]
+
+    # The number of records in each row group of a parquet file
+    PARQUET_ROW_GROUP_RECORDS: int = 1000
+
+    def __init__(self, output_format: str = TEXT_FORMAT, output_path: str = None):
+        assert output_format in ResultWriter.FORMATS
+
+        self._format: str = output_format
+        self._output_path: str = output_path
+        self._parquet_writer: 'pyarrow.parquet.ParquetWriter' = None
+        self._parquet_rows: list = []
+
+        if output_format == PARQUET_FORMAT:
+            # Pyarrow is an optional dependency that is only imported when writing parquet
+            try:
+                from pyarrow.parquet import ParquetWriter
+            except ImportError:
+                raise ImportError(PARQUET_NOT_INSTALLED_MSG)
+
+            self._output: IO = sys.stdout.buffer if output_path is None else open(output_path, WRITE_BYTES_OPT)
+            self._parquet_writer: ParquetWriter = ParquetWriter(
+                self._output, schema=ResultWriter._get_parquet_schema()
+            )
+        else:
+            self._output: IO = sys.stdout if output_path is None else open(output_path, WRITE_OPT)
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the format and destination of the results of a handler
+
+        @param parser: The parser of the handler
+        """
+
+        parser.add_argument(
+            FORMAT_ARG, type=str, default=TEXT_FORMAT, choices=ResultWriter.FORMATS, action=STORE_ACTION,
+            required=False, help=FORMAT_ARG_HELP
+        )
+        parser.add_argument(OUTPUT_ARG, type=str, action=STORE_ACTION, required=False, help=OUTPUT_ARG_HELP)
+
+    def is_streaming(self) -> bool:
+        """
+        Determines whether each relevant csv file is written as soon as it is found rather than once all are found
+
+        @return: The truth value of the above mentioned query
+        """
+
+        return self._format != TEXT_FORMAT
+
+    def write_record(self, rel_path: str, csv_obj: CSVObject):
+        """
+        Writes the record of a relevant csv file
+
+        @param rel_path: The path of the csv file relative to the data directory
+        @param csv_obj: The csv object of the csv file
+        """
+
+        assert self.is_streaming()
+
+        record: dict = csv_obj.get_record(rel_path=rel_path)
+
+        if self._format == JSONL_FORMAT:
+            self._output.write(RECORD_LINE.format(dumps(record)))
+            self._output.flush()
+        else:
+            self._parquet_rows.append(ResultWriter._get_parquet_row(record=record))
+
+            if len(self._parquet_rows) == ResultWriter.PARQUET_ROW_GROUP_RECORDS:
+                self._write_row_group()
+
+    def write_lines(self, lines: list):
+        """
+        Writes the lines of the text format
+
+        @param lines: The lines
+        """
+
+        assert not self.is_streaming()
+
+        for line in lines:
+            print(line, file=self._output)
+
+    def close(self):
+        """Writes any records that are left and closes the output if it is a file"""
+
+        if self._parquet_writer is not None:
+            self._write_row_group()
+            self._parquet_writer.close()
+
+        self._output.flush()
+
+        if self._output_path is not None:
+            self._output.close()
+
+    def _write_row_group(self):
+        """Writes the records that have not been written yet as a row group of the parquet file"""
+
+        if len(self._parquet_rows) == 0:
+            return
+
+        import pyarrow
+
+        table: pyarrow.Table = pyarrow.Table.from_pylist(self._parquet_rows, schema=self._parquet_writer.schema)
+        self._parquet_writer.write_table(table)
+        self._parquet_rows: list = []
+
+    @staticmethod
+    def _get_parquet_row(record: dict) -> dict:
+        """
+        Converts the record of a csv file to a row of the parquet file, whose class counts are lists of pairs
+
+        @param record: The record
+        @return: The row
+        """
+
+        col_records: list = []
+
+        for col_record in record[COLUMNS_FIELD]:
+            col_record: dict = dict(col_record)
+
+            if CLASSES_FIELD in col_record:
+                col_record[CLASSES_FIELD] = list(col_record[CLASSES_FIELD].items())
+
+            col_records.append(col_record)
+
+        return {**record, COLUMNS_FIELD: col_records}
+
+    @staticmethod
+    def _get_parquet_schema() -> 'pyarrow.Schema':
+        """
+        Creates the schema of the parquet file, with a row per csv file and a nested list of its columns. The
+        statistics are floats even for integer columns, and each column has either statistics or class counts.
+
+        @return: The schema
+        """
+
+        import pyarrow
+
+        col_type: pyarrow.DataType = pyarrow.struct([
+            (NAME_FIELD, pyarrow.string()), (TYPE_FIELD, pyarrow.string()), (MIN_FIELD, pyarrow.float64()),
+            (MAX_FIELD, pyarrow.float64()), (RANGE_FIELD, pyarrow.float64()), (MEAN_FIELD, pyarrow.float64()),
+            (STD_FIELD, pyarrow.float64()), (CLASSES_FIELD, pyarrow.map_(pyarrow.string(), pyarrow.int64()))
+        ])
+
+        return pyarrow.schema([
+            (PATH_FIELD, pyarrow.string()), (ERROR_FIELD, pyarrow.string()), (COLUMNS_FIELD, pyarrow.list_(col_type))
+        ])
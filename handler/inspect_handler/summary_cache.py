@@ -0,0 +1,172 @@
+"""Module for the summary cache class"""
+
+from hashlib import blake2b
+from os import makedirs, stat, stat_result
+from os.path import dirname, expanduser, join, realpath
+from pickle import dumps, HIGHEST_PROTOCOL, loads, UnpicklingError
+from sqlite3 import connect, Connection
+from time import time
+
+from handler.inspect_handler.csv_object import CSVObject
+from strings.inspect_handler import (
+    CACHE_DIR, CACHE_FILE_NAME, CACHE_HASH_KEY_PREFIX, CREATE_CACHE_INDEX_SQL, CREATE_CACHE_TABLE_SQL,
+    DELETE_CACHE_ENTRY_SQL, DELETE_CACHE_SQL, DROP_CACHE_TABLE_SQL, GET_CACHE_VERSION_SQL, INSERT_CACHE_ENTRY_SQL,
+    READ_BYTES_OPT, SELECT_CACHE_ENTRY_SQL, SELECT_CACHE_SIZE_SQL, SELECT_LRU_CACHE_ENTRY_SQL,
+    SET_CACHE_JOURNAL_MODE_SQL, SET_CACHE_VERSION_SQL, UPDATE_CACHE_LAST_USED_SQL
+)
+
+
+class SummaryCache:
+    """
+    Persists the fully loaded csv objects of csv files between runs in a sqlite database so that inspecting unchanged
+    csv files with different key words does not read them again. An entry is only used while the size and modification
+    time of its csv file are unchanged or, if hashing, while the contents of its csv file are unchanged. The least
+    recently used entries are evicted once the entries exceed the maximum size. Every change is committed as soon as it
+    is made so that runs sharing the cache, such as a server and an inspect run, only wait for each other's writes.
+    """
+
+    # Incremented whenever the pickled csv objects change in a way that makes older entries unreadable
+    VERSION: int = 1
+
+    BYTES_PER_MIB: int = 1024 * 1024
+    DEFAULT_MAX_MIB: int = 1024
+    HASH_BLOCK_SIZE: int = BYTES_PER_MIB
+    # How long to wait for another run writing to the cache before giving up
+    BUSY_TIMEOUT_SECONDS: float = 30.0
+
+    def __init__(self, cache_path: str = None, max_bytes: int = DEFAULT_MAX_MIB * BYTES_PER_MIB,
+                 use_hash: bool = False, rebuild: bool = False):
+        assert max_bytes > 0
+
+        if cache_path is None:
+            cache_path: str = SummaryCache.get_default_path()
+
+        cache_dir: str = dirname(cache_path)
+        if cache_dir:
+            makedirs(cache_dir, exist_ok=True)
+
+        self._max_bytes: int = max_bytes
+        self._use_hash: bool = use_hash
+        # The inspector that uses the cache lets only one thread use it at a time, but not always the same thread
+        self._connection: Connection = connect(
+            cache_path, timeout=SummaryCache.BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+
+        # Readers of the write-ahead log neither block nor are blocked by the run writing to the cache
+        self._connection.execute(SET_CACHE_JOURNAL_MODE_SQL)
+
+        # The key and stat of each csv file that missed, taken before it was read so that a csv file modified while
+        # being read is summarized again next time
+        self._pending_entries: dict = {}
+
+        version: int = self._connection.execute(GET_CACHE_VERSION_SQL).fetchone()[0]
+        if version != SummaryCache.VERSION:
+            self._connection.execute(DROP_CACHE_TABLE_SQL)
+            self._connection.execute(SET_CACHE_VERSION_SQL.format(SummaryCache.VERSION))
+
+        self._connection.execute(CREATE_CACHE_TABLE_SQL)
+        self._connection.execute(CREATE_CACHE_INDEX_SQL)
+
+        if rebuild:
+            self._connection.execute(DELETE_CACHE_SQL)
+
+        self._connection.commit()
+
+    @staticmethod
+    def get_default_path() -> str:
+        """
+        Returns the path of the cache shared by every run that does not specify one
+
+        @return: The default cache path
+        """
+
+        return join(expanduser(CACHE_DIR), CACHE_FILE_NAME)
+
+    def get(self, csv_path: str) -> CSVObject:
+        """
+        Looks up the csv object of a csv file, remembering the csv file if it missed so that its csv object can be put
+
+        @param csv_path: The path to the csv file
+        @return: The fully loaded csv object or None if the csv file is not cached or it has changed since it was
+        """
+
+        csv_stat: stat_result = stat(csv_path)
+        key: str = self._get_key(csv_path=csv_path)
+        row: tuple = self._connection.execute(SELECT_CACHE_ENTRY_SQL, (key,)).fetchone()
+
+        if row is not None:
+            size, mtime_ns, summary = row
+
+            if size == csv_stat.st_size and (self._use_hash or mtime_ns == csv_stat.st_mtime_ns):
+                try:
+                    csv_obj: CSVObject = loads(summary)
+                except (AttributeError, EOFError, ImportError, UnpicklingError):
+                    csv_obj: None = None
+
+                if csv_obj is not None:
+                    self._connection.execute(UPDATE_CACHE_LAST_USED_SQL, (time(), key))
+                    self._connection.commit()
+                    return csv_obj
+
+        self._pending_entries[csv_path] = (key, csv_stat)
+        return None
+
+    def put(self, csv_path: str, csv_obj: CSVObject):
+        """
+        Caches the csv object of a csv file that missed, evicting the least recently used entries if needed
+
+        @param csv_path: The path to the csv file
+        @param csv_obj: The fully loaded csv object
+        """
+
+        key, csv_stat = self._pending_entries.pop(csv_path)
+
+        csv_obj.load_values()
+        summary: bytes = dumps(csv_obj, protocol=HIGHEST_PROTOCOL)
+
+        self._connection.execute(
+            INSERT_CACHE_ENTRY_SQL, (key, csv_stat.st_size, csv_stat.st_mtime_ns, time(), len(summary), summary)
+        )
+
+        # The size is read within the same transaction as the insert since other runs may have changed the cache
+        n_bytes: int = self._connection.execute(SELECT_CACHE_SIZE_SQL).fetchone()[0]
+
+        while n_bytes > self._max_bytes:
+            lru_key, lru_n_bytes = self._connection.execute(SELECT_LRU_CACHE_ENTRY_SQL).fetchone()
+            self._connection.execute(DELETE_CACHE_ENTRY_SQL, (lru_key,))
+            n_bytes -= lru_n_bytes
+
+        self._connection.commit()
+
+    def discard(self, csv_path: str):
+        """
+        Forgets a csv file that missed but whose csv object will not be put, such as one that was rejected without
+        being read
+
+        @param csv_path: The path to the csv file
+        """
+
+        self._pending_entries.pop(csv_path, None)
+
+    def close(self):
+        """Closes the cache, whose changes are already saved"""
+
+        self._connection.close()
+
+    def _get_key(self, csv_path: str) -> str:
+        """
+        Creates the key of the entry of a csv file, which is either its real path or the hash of its contents
+
+        @param csv_path: The path to the csv file
+        @return: The key
+        """
+
+        if not self._use_hash:
+            return realpath(csv_path)
+
+        content_hash = blake2b()
+        with open(csv_path, READ_BYTES_OPT) as f:
+            for block in iter(lambda: f.read(SummaryCache.HASH_BLOCK_SIZE), b''):
+                content_hash.update(block)
+
+        return CACHE_HASH_KEY_PREFIX + content_hash.hexdigest()
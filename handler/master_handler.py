@@ -3,8 +3,16 @@
 from argparse import ArgumentParser, Namespace
 
 from handler.extract_handler import ExtractHandler
+from handler.index_handler.index_handler import IndexHandler
+from handler.index_handler.query_handler import QueryHandler
 from handler.inspect_handler.inspect_handler import InspectHandler
-from strings.args import EXTRACT_HANDLER_NAME, INSPECT_HANDLER_NAME, SUB_PARSER
+from handler.scan_handler import ScanHandler
+from handler.serve_handler.client_handler import ClientHandler
+from handler.serve_handler.serve_handler import ServeHandler
+from strings.args import (
+    CLIENT_HANDLER_NAME, EXTRACT_HANDLER_NAME, INDEX_HANDLER_NAME, INSPECT_HANDLER_NAME, QUERY_HANDLER_NAME,
+    SCAN_HANDLER_NAME, SERVE_HANDLER_NAME, SUB_PARSER
+)
 
 
 class MasterHandler:
@@ -22,6 +30,21 @@ class MasterHandler:
         inspect_parser: ArgumentParser = subparsers.add_parser(INSPECT_HANDLER_NAME)
         InspectHandler.configure_parser(inspect_parser)
 
+        scan_parser: ArgumentParser = subparsers.add_parser(SCAN_HANDLER_NAME)
+        ScanHandler.configure_parser(scan_parser)
+
+        index_parser: ArgumentParser = subparsers.add_parser(INDEX_HANDLER_NAME)
+        IndexHandler.configure_parser(index_parser)
+
+        query_parser: ArgumentParser = subparsers.add_parser(QUERY_HANDLER_NAME)
+        QueryHandler.configure_parser(query_parser)
+
+        serve_parser: ArgumentParser = subparsers.add_parser(SERVE_HANDLER_NAME)
+        ServeHandler.configure_parser(serve_parser)
+
+        client_parser: ArgumentParser = subparsers.add_parser(CLIENT_HANDLER_NAME)
+        ClientHandler.configure_parser(client_parser)
+
         self.args: Namespace = parser.parse_args(argv)
 
     def handle(self):
@@ -33,3 +56,13 @@ class MasterHandler:
             ExtractHandler.handle(self.args)
         elif handler_type == INSPECT_HANDLER_NAME:
             InspectHandler.handle(self.args)
+        elif handler_type == SCAN_HANDLER_NAME:
+            ScanHandler.handle(self.args)
+        elif handler_type == INDEX_HANDLER_NAME:
+            IndexHandler.handle(self.args)
+        elif handler_type == QUERY_HANDLER_NAME:
+            QueryHandler.handle(self.args)
+        elif handler_type == SERVE_HANDLER_NAME:
+            ServeHandler.handle(self.args)
+        elif handler_type == CLIENT_HANDLER_NAME:
+            ClientHandler.handle(self.args)
@@ -0,0 +1,420 @@
+"""Module for the profiler and file profile classes"""
+
+import sys
+from argparse import ArgumentParser
+from collections import defaultdict
+from contextlib import contextmanager
+from cProfile import Profile
+from threading import local
+from time import perf_counter, process_time, thread_time
+import tracemalloc
+from typing import Iterator
+
+from handler.utils import positive_int
+from strings.args import (
+    PROFILE_ARG, PROFILE_ARG_HELP, PROFILE_PSTATS_ARG, PROFILE_PSTATS_ARG_HELP, PROFILE_TOP_ARG, PROFILE_TOP_ARG_HELP,
+    STORE_ACTION, STORE_TRUE_ACTION
+)
+from strings.profiler import (
+    COLUMN_LINE, ERROR_TEXT, FILE_LINE, LARGEST_PEAKS_LINE, PEAK_LINE, PROFILE_HEADER, PSTATS_LINE, RESET_PEAK_FUNC,
+    SECTION_LINE, SLOWEST_COLUMNS_LINE, SLOWEST_FILES_LINE, STAGE_LINE, THROUGHPUT_LINE
+)
+
+
+class _ActiveProfile(local):
+    """The profile of the file that each thread is handling, or None if it is not being profiled"""
+
+    def __init__(self):
+        self.profile: FileProfile = None
+
+
+_active: _ActiveProfile = _ActiveProfile()
+
+
+class FileProfile:
+    """
+    Records the time spent handling a single file, along with the time spent in each section of handling it, such as
+    reading or summarizing it, and the time spent on each of its columns. The file is handled by whichever worker
+    process or thread it was sent to, so the profile is recorded there and sent back with the results.
+    """
+
+    def __init__(self, rel_path: str, n_bytes: int):
+        self._rel_path: str = rel_path
+        self._n_bytes: int = n_bytes
+        self._n_rows: int = 0
+        self._error: str = None
+        self._peak_bytes: int = None
+        self._wall_seconds: float = 0
+        self._cpu_seconds: float = 0
+        self._section_seconds: defaultdict = defaultdict(float)
+        self._col_seconds: defaultdict = defaultdict(float)
+
+    def get_rel_path(self) -> str:
+        """
+        Gets the path of the file relative to the data directory
+
+        @return: The relative path
+        """
+
+        return self._rel_path
+
+    def get_n_bytes(self) -> int:
+        """
+        Gets the size of the file
+
+        @return: The number of bytes in the file
+        """
+
+        return self._n_bytes
+
+    def get_n_rows(self) -> int:
+        """
+        Gets the number of rows parsed from the file
+
+        @return: The number of rows
+        """
+
+        return self._n_rows
+
+    def get_error(self) -> str:
+        """
+        Gets the error that prevented reading the file
+
+        @return: The type and message of the error or None if there was no error
+        """
+
+        return self._error
+
+    def get_peak_bytes(self) -> int:
+        """
+        Gets the peak memory allocated while handling the file
+
+        @return: The number of bytes or None if it was not measured
+        """
+
+        return self._peak_bytes
+
+    def get_wall_seconds(self) -> float:
+        """
+        Gets the wall time spent handling the file
+
+        @return: The number of seconds
+        """
+
+        return self._wall_seconds
+
+    @contextmanager
+    def record(self, measure_memory: bool = False):
+        """
+        Records the time spent handling the file, which is handled by the current thread within this context
+
+        @param measure_memory: Whether to also measure the peak memory allocated while handling the file with
+        tracemalloc, which counts the allocations of every thread in the process
+        """
+
+        previous: FileProfile = _active.profile
+        _active.profile = self
+
+        if measure_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            # Before Python 3.9 the peak can only be reset along with the traces, which only counts the memory
+            # allocated from here on and so still measures the peak of handling the file
+            if hasattr(tracemalloc, RESET_PEAK_FUNC):
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.clear_traces()
+
+            memory_start, _ = tracemalloc.get_traced_memory()
+
+        wall_start: float = perf_counter()
+        cpu_start: float = thread_time()
+
+        try:
+            yield
+        finally:
+            self._wall_seconds += perf_counter() - wall_start
+            self._cpu_seconds += thread_time() - cpu_start
+            _active.profile = previous
+
+            if measure_memory:
+                _, memory_peak = tracemalloc.get_traced_memory()
+                self._peak_bytes = max(self._peak_bytes or 0, memory_peak - memory_start)
+
+    @staticmethod
+    @contextmanager
+    def section(name: str):
+        """
+        Records the time spent in a section of handling the file that the current thread is handling, if it is being
+        profiled
+
+        @param name: The name of the section
+        """
+
+        profile: FileProfile = _active.profile
+
+        if profile is None:
+            yield
+            return
+
+        start: float = perf_counter()
+
+        try:
+            yield
+        finally:
+            profile._section_seconds[name] += perf_counter() - start
+
+    @staticmethod
+    def time_iterator(name: str, iterator: Iterator) -> Iterator:
+        """
+        Records the time spent producing each item of an iterator as a section of handling the file that the current
+        thread is handling, if it is being profiled
+
+        @param name: The name of the section
+        @param iterator: The iterator
+        @return: Generator of the items of the iterator
+        """
+
+        iterator: Iterator = iter(iterator)
+
+        while True:
+            with FileProfile.section(name=name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+
+            yield item
+
+    @staticmethod
+    @contextmanager
+    def column(col_name: str):
+        """
+        Records the time spent on a column of the file that the current thread is handling, if it is being profiled
+
+        @param col_name: The name of the column
+        """
+
+        profile: FileProfile = _active.profile
+
+        if profile is None:
+            yield
+            return
+
+        start: float = perf_counter()
+
+        try:
+            yield
+        finally:
+            profile._col_seconds[col_name] += perf_counter() - start
+
+    @staticmethod
+    def add_rows(n_rows: int):
+        """
+        Counts rows parsed from the file that the current thread is handling, if it is being profiled
+
+        @param n_rows: The number of rows
+        """
+
+        profile: FileProfile = _active.profile
+
+        if profile is not None:
+            profile._n_rows += n_rows
+
+    @staticmethod
+    def add_error(error: Exception):
+        """
+        Records the error that prevented reading the file that the current thread is handling, if it is being profiled.
+        The error is kept as text so that the profile can be sent back from a worker process whatever the error is.
+
+        @param error: The error
+        """
+
+        profile: FileProfile = _active.profile
+
+        if profile is not None:
+            profile._error = ERROR_TEXT.format(type(error).__name__, error)
+
+
+class Profiler:
+    """
+    Records the wall and CPU time of each stage of a run and the profiles of the files handled in it, and reports them
+    at the end along with the throughput and the slowest files and columns. The whole run in this process can also be
+    profiled with cProfile and its statistics saved for pstats. A profiler that is not enabled records nothing, so the
+    handlers can use one either way.
+    """
+
+    DEFAULT_TOP: int = 10
+    BYTES_PER_MB: int = 1000 * 1000
+
+    def __init__(self, enabled: bool, top: int = DEFAULT_TOP, pstats_path: str = None):
+        assert top > 0
+
+        self._enabled: bool = enabled
+        self._top: int = top
+        self._pstats_path: str = pstats_path
+        self._stage_seconds: dict = {}
+        self._file_profiles: list = []
+        self._start: float = perf_counter()
+        self._cprofile: Profile = None
+
+        if enabled and pstats_path is not None:
+            self._cprofile: Profile = Profile()
+            self._cprofile.enable()
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for profiling a handler
+
+        @param parser: The parser of the handler
+        """
+
+        parser.add_argument(PROFILE_ARG, action=STORE_TRUE_ACTION, required=False, help=PROFILE_ARG_HELP)
+        parser.add_argument(
+            PROFILE_TOP_ARG, type=positive_int, default=Profiler.DEFAULT_TOP, action=STORE_ACTION, required=False,
+            help=PROFILE_TOP_ARG_HELP
+        )
+        parser.add_argument(
+            PROFILE_PSTATS_ARG, type=str, action=STORE_ACTION, required=False, help=PROFILE_PSTATS_ARG_HELP
+        )
+
+    def is_enabled(self) -> bool:
+        """
+        Determines whether the profiler records anything
+
+        @return: The truth value of the above mentioned query
+        """
+
+        return self._enabled
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Records the wall and CPU time of a stage of the run in this process, adding to any time spent in the stage
+        before
+
+        @param name: The name of the stage
+        """
+
+        if not self._enabled:
+            yield
+            return
+
+        wall_start: float = perf_counter()
+        cpu_start: float = process_time()
+
+        try:
+            yield
+        finally:
+            wall_seconds, cpu_seconds = self._stage_seconds.get(name, (0, 0))
+            self._stage_seconds[name] = (
+                wall_seconds + perf_counter() - wall_start, cpu_seconds + process_time() - cpu_start
+            )
+
+    def time_iterator(self, name: str, iterator: Iterator) -> Iterator:
+        """
+        Records the time spent producing each item of an iterator as a stage of the run, such as walking a directory
+        which happens as its files are handled
+
+        @param name: The name of the stage
+        @param iterator: The iterator
+        @return: Generator of the items of the iterator
+        """
+
+        iterator: Iterator = iter(iterator)
+
+        while True:
+            with self.stage(name=name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+
+            yield item
+
+    def add_file(self, file_profile: FileProfile):
+        """
+        Adds the profile of a file handled in the run
+
+        @param file_profile: The profile of the file or None if it was not profiled
+        """
+
+        if self._enabled and file_profile is not None:
+            self._file_profiles.append(file_profile)
+
+    def report(self):
+        """Prints the report of the run to standard error, saving the cProfile statistics first if profiling with it"""
+
+        if not self._enabled:
+            return
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self._pstats_path)
+
+        for line in self.get_report():
+            print(line, file=sys.stderr)
+
+    def get_report(self) -> list:
+        """
+        Creates the lines of the report of the run
+
+        @return: The lines of the report
+        """
+
+        wall_seconds: float = perf_counter() - self._start
+        report: list = [PROFILE_HEADER]
+
+        for name, (stage_wall_seconds, stage_cpu_seconds) in self._stage_seconds.items():
+            report.append(STAGE_LINE.format(name, stage_wall_seconds, stage_cpu_seconds))
+
+        section_seconds: defaultdict = defaultdict(float)
+        for file_profile in self._file_profiles:
+            for name, seconds in file_profile._section_seconds.items():
+                section_seconds[name] += seconds
+
+        for name, seconds in section_seconds.items():
+            report.append(SECTION_LINE.format(name, seconds))
+
+        n_files: int = len(self._file_profiles)
+        n_mb: float = sum(file_profile._n_bytes for file_profile in self._file_profiles) / Profiler.BYTES_PER_MB
+        n_rows: int = sum(file_profile._n_rows for file_profile in self._file_profiles)
+        report.append(THROUGHPUT_LINE.format(
+            n_files, wall_seconds, n_files / wall_seconds, n_mb, n_mb / wall_seconds, n_rows
+        ))
+
+        report.append(SLOWEST_FILES_LINE)
+        slowest_files: list = sorted(self._file_profiles, key=lambda profile: profile._wall_seconds, reverse=True)
+        for file_profile in slowest_files[:self._top]:
+            report.append(FILE_LINE.format(
+                file_profile._rel_path, file_profile._wall_seconds, file_profile._cpu_seconds,
+                file_profile._n_bytes / Profiler.BYTES_PER_MB, file_profile._n_rows
+            ))
+
+        col_seconds: list = [
+            (seconds, file_profile._rel_path, col_name) for file_profile in self._file_profiles
+            for col_name, seconds in file_profile._col_seconds.items()
+        ]
+
+        if len(col_seconds) > 0:
+            report.append(SLOWEST_COLUMNS_LINE)
+            for seconds, rel_path, col_name in sorted(col_seconds, key=lambda item: item[0], reverse=True)[:self._top]:
+                report.append(COLUMN_LINE.format(rel_path, col_name, seconds))
+
+        peak_profiles: list = [
+            file_profile for file_profile in self._file_profiles if file_profile._peak_bytes is not None
+        ]
+
+        if len(peak_profiles) > 0:
+            report.append(LARGEST_PEAKS_LINE)
+            largest_peaks: list = sorted(peak_profiles, key=lambda profile: profile._peak_bytes, reverse=True)
+            for file_profile in largest_peaks[:self._top]:
+                peak_mb: float = file_profile._peak_bytes / Profiler.BYTES_PER_MB
+                report.append(PEAK_LINE.format(file_profile._rel_path, peak_mb))
+
+        if self._cprofile is not None:
+            report.append(PSTATS_LINE.format(self._pstats_path))
+
+        return report
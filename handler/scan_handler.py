@@ -0,0 +1,136 @@
+"""Module for the scan handler class"""
+
+from argparse import ArgumentParser, Namespace
+from functools import partial
+from queue import Queue
+from threading import Thread
+from typing import Iterator
+
+from handler.extract_handler import ExtractHandler
+from handler.handler import Handler
+from handler.inspect_handler.inspect_handler import InspectHandler
+from handler.telemetry import Telemetry
+from handler.utils import get_csv_rel_path, positive_int
+from strings.args import (
+    EXTRACT_WORKERS_ARG, EXTRACT_WORKERS_ARG_HELP, ONLY_ARG, ONLY_ARG_HELP, STORE_ACTION, THREAD_BACKEND
+)
+from strings.extract_handler import CSV_GLOB
+
+
+class ScanHandler(Handler):
+    """
+    Handler for extracting all the compressed files in the data directory and inspecting the csv files in it at the
+    same time. The csv files are passed from the extraction to the inspection through a bounded queue as soon as they
+    are found, so csv files are inspected while compressed files are still being extracted, and the data directory and
+    the extracted directories are only walked once. The output is the same as extracting and then inspecting.
+    """
+
+    # The number of csv files that can wait to be inspected before the extraction waits for the inspection to catch up
+    QUEUE_SIZE: int = 1024
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the scan handler, which are those of the inspect handler along with those for
+        extracting
+
+        @param parser: The parser to configure
+        """
+
+        InspectHandler.configure_parser(parser)
+
+        parser.add_argument(
+            EXTRACT_WORKERS_ARG, type=positive_int, default=1, action=STORE_ACTION, required=False,
+            help=EXTRACT_WORKERS_ARG_HELP
+        )
+        parser.add_argument(
+            ONLY_ARG, nargs='+', default=[CSV_GLOB], action=STORE_ACTION, required=False, help=ONLY_ARG_HELP
+        )
+
+    @staticmethod
+    def handle(args: Namespace):
+        """
+        Extracts all the compressed files in the data directory in a separate thread while inspecting the csv files
+        that are found along the way
+
+        @param args: The arguments for the scan handler
+        """
+
+        csv_queue: Queue = Queue(maxsize=ScanHandler.QUEUE_SIZE)
+
+        # The error that stopped the extraction, if any, is raised by the inspection so that nothing is output for an
+        # incomplete scan
+        errors: list = []
+
+        # The extraction and the inspection record their events in the same telemetry, in which the csv files waiting in
+        # the queue count towards the queue depth
+        telemetry: Telemetry = Telemetry(
+            metrics_path=args.metrics_file, progress=args.progress, interval=args.metrics_interval
+        )
+        telemetry.watch_queue(queue=csv_queue)
+
+        # If the inspection fails, the extraction is abandoned along with the process and resumed by the next run
+        extractor: Thread = Thread(
+            target=ScanHandler._extract,
+            kwargs={'args': args, 'csv_queue': csv_queue, 'errors': errors, 'telemetry': telemetry}, daemon=True
+        )
+        extractor.start()
+
+        # The extraction has recorded all of its events by the time the queue is ended, so the inspection closes the
+        # telemetry once done
+        InspectHandler.handle(
+            args, csv_paths=ScanHandler._get_queued_csv_paths(csv_queue=csv_queue, errors=errors), telemetry=telemetry
+        )
+        extractor.join()
+
+    @staticmethod
+    def _extract(args: Namespace, csv_queue: Queue, errors: list, telemetry: Telemetry):
+        """
+        Extracts all the compressed files in the data directory, queueing the csv files that are found along the way
+
+        @param args: The arguments for the scan handler
+        @param csv_queue: The queue of csv files to inspect, which is ended with None once the extraction is done
+        @param errors: The list to add the error that stopped the extraction to
+        @param telemetry: The telemetry to record each compressed file starting and finishing in
+        """
+
+        try:
+            ExtractHandler.extract(
+                data_path=args.data_path, workers=args.extract_workers, backend=THREAD_BACKEND, only=args.only,
+                on_found=partial(ScanHandler._queue_csv, csv_queue=csv_queue), telemetry=telemetry
+            )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            csv_queue.put(None)
+
+    @staticmethod
+    def _queue_csv(file_paths: tuple, csv_queue: Queue):
+        """
+        Queues a file to be inspected if it is a csv file, waiting for room in the queue if it is full
+
+        @param file_paths: The path to the file and its path relative to the data directory
+        @param csv_queue: The queue of csv files to inspect
+        """
+
+        file_path, rel_path = file_paths
+        csv_rel_path: str = get_csv_rel_path(file_path=file_path, rel_path=rel_path)
+
+        if csv_rel_path is not None:
+            csv_queue.put((file_path, csv_rel_path))
+
+    @staticmethod
+    def _get_queued_csv_paths(csv_queue: Queue, errors: list) -> Iterator[tuple]:
+        """
+        Yields the csv files from the queue as they arrive until the extraction is done
+
+        @param csv_queue: The queue of csv files to inspect
+        @param errors: The list of errors that stopped the extraction
+        @return: Generator of tuples containing the path to a csv file and its path relative to the data directory
+        """
+
+        for csv_paths in iter(csv_queue.get, None):
+            yield csv_paths
+
+        if len(errors) > 0:
+            raise errors[0]
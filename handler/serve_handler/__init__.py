@@ -0,0 +1 @@
+"""Package containing modules related to the serve and client handlers"""
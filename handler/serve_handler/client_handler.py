@@ -0,0 +1,41 @@
+"""Module for the client handler class"""
+
+from argparse import ArgumentParser, Namespace
+
+from handler.handler import Handler
+from handler.serve_handler.inspect_client import InspectClient
+from handler.serve_handler.serve_handler import ServeHandler
+from strings.args import (
+    KEY_WORDS_ARG, KEY_WORDS_ARG_HELP, STORE_ACTION, STORE_TRUE_ACTION, VERBOSE_ARG, VERBOSE_ARG_HELP
+)
+
+
+class ClientHandler(Handler):
+    """Handler answering the same questions as the inspect handler by querying a server started by the serve handler"""
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the client handler, which has no data path since the server has its own
+
+        @param parser: The parser to configure
+        """
+
+        parser.add_argument(VERBOSE_ARG, action=STORE_TRUE_ACTION, required=False, help=VERBOSE_ARG_HELP)
+        parser.add_argument(KEY_WORDS_ARG, nargs='+', action=STORE_ACTION, required=True, help=KEY_WORDS_ARG_HELP)
+
+        ServeHandler.configure_address_parser(parser)
+
+    @staticmethod
+    def handle(args: Namespace):
+        """
+        Queries the server for the csv files containing the key words in their file paths, column names or nominal
+        values and prints the same output as the inspect handler
+
+        @param args: The arguments for the client handler, including key words to search for
+        """
+
+        client: InspectClient = InspectClient(port=args.port, socket_path=args.socket_path)
+
+        for output_line in client.inspect(key_words=args.key_words, verbose=args.verbose):
+            print(output_line)
@@ -0,0 +1,83 @@
+"""Module for the inspect client class"""
+
+from http import HTTPStatus
+from http.client import HTTPConnection, HTTPResponse
+from json import loads
+from socket import AF_UNIX, SOCK_STREAM, socket
+from urllib.parse import urlencode
+
+from handler.serve_handler.inspect_server import InspectServer
+from strings.inspect_handler import ERROR_FIELD
+from strings.serve_handler import (
+    CONNECTION_FAILED_MSG, GET_METHOD, INSPECT_ROUTE, KEY_WORDS_PARAM, LINES_FIELD, LOCALHOST, QUERY_FAILED_MSG,
+    ROUTE_QUERY, SOCKET_URL, TCP_URL, TRUE_PARAM, VERBOSE_PARAM
+)
+
+
+class InspectClient:
+    """Makes inspect queries of an inspect server over HTTP on localhost or a Unix domain socket"""
+
+    def __init__(self, port: int = InspectServer.DEFAULT_PORT, socket_path: str = None):
+        self._port: int = port
+        self._socket_path: str = socket_path
+
+    def inspect(self, key_words: list, verbose: bool = False) -> list:
+        """
+        Creates the same output as the inspect handler prints for the csv files containing any of the key words
+
+        @param key_words: The key words to search for
+        @param verbose: Whether to include extra information about the CSV columns rather than just their names
+        @return: The list of output lines
+        """
+
+        return self.query(key_words=key_words, verbose=verbose)[LINES_FIELD]
+
+    def query(self, key_words: list, verbose: bool = False) -> dict:
+        """
+        Makes an inspect query
+
+        @param key_words: The key words to search for
+        @param verbose: Whether to include extra information about the CSV columns in the output lines
+        @return: The response of the server, which has the output lines and the record of each relevant csv file
+        """
+
+        params: dict = {KEY_WORDS_PARAM: key_words}
+        if verbose:
+            params[VERBOSE_PARAM] = TRUE_PARAM
+
+        if self._socket_path is None:
+            connection: HTTPConnection = HTTPConnection(LOCALHOST, self._port)
+            url: str = TCP_URL.format(LOCALHOST, self._port)
+        else:
+            connection: HTTPConnection = _UnixHTTPConnection(socket_path=self._socket_path)
+            url: str = SOCKET_URL.format(self._socket_path)
+
+        try:
+            connection.request(GET_METHOD, ROUTE_QUERY.format(INSPECT_ROUTE, urlencode(params, doseq=True)))
+            response: HTTPResponse = connection.getresponse()
+            body: dict = loads(response.read())
+        except (ConnectionRefusedError, FileNotFoundError):
+            raise ConnectionError(CONNECTION_FAILED_MSG.format(url))
+        finally:
+            connection.close()
+
+        if response.status != HTTPStatus.OK:
+            raise RuntimeError(QUERY_FAILED_MSG.format(response.status, body[ERROR_FIELD]))
+
+        return body
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """A connection that makes HTTP requests over a Unix domain socket rather than to a host and port"""
+
+    def __init__(self, socket_path: str):
+        # The host is only sent in the headers of the requests
+        super().__init__(LOCALHOST)
+
+        self._socket_path: str = socket_path
+
+    def connect(self):
+        """Connects to the Unix domain socket"""
+
+        self.sock: socket = socket(AF_UNIX, SOCK_STREAM)
+        self.sock.connect(self._socket_path)
@@ -0,0 +1,211 @@
+"""Module for the inspect server class"""
+
+import sys
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from os import chmod, remove
+from os.path import exists
+from socketserver import BaseServer, ThreadingUnixStreamServer
+from threading import Event, Thread
+from urllib.parse import parse_qs, SplitResult, urlsplit
+
+from handler.inspect_handler.inspector import Inspector
+from strings.general import EMPTY_STRING
+from strings.inspect_handler import ERROR_FIELD, MATCH_SEPARATOR, SEPARATOR_IN_KEY_WORD_MSG, UTF8
+from strings.serve_handler import (
+    CONTENT_LENGTH_HEADER, CONTENT_TYPE_HEADER, INSPECT_ROUTE, JSON_CONTENT_TYPE, KEY_WORDS_PARAM, LINES_FIELD,
+    LOCALHOST, NO_KEY_WORDS_MSG, RECORDS_FIELD, REFRESH_FAILED_MSG, ROUTE_NOT_FOUND_MSG, SOCKET_EXISTS_MSG, SOCKET_URL,
+    TCP_URL, TRUE_PARAM, VERBOSE_PARAM
+)
+
+
+class InspectServer:
+    """
+    Answers inspect queries of a data directory over HTTP on localhost or a Unix domain socket, from an inspector that
+    keeps the summaries of its csv files warm in memory so that a query only reads the csv files that changed since.
+    Every client is answered in a thread of its own while a background thread periodically refreshes the summaries.
+    """
+
+    DEFAULT_PORT: int = 8765
+    DEFAULT_REFRESH_SECONDS: float = 60.0
+    # Only the user running the server may connect to its Unix domain socket
+    SOCKET_MODE: int = 0o600
+
+    def __init__(
+        self, inspector: Inspector, port: int = DEFAULT_PORT, socket_path: str = None,
+        refresh_seconds: float = DEFAULT_REFRESH_SECONDS
+    ):
+        assert refresh_seconds > 0
+
+        self._inspector: Inspector = inspector
+        self._socket_path: str = socket_path
+        self._refresh_seconds: float = refresh_seconds
+        self._stopped: Event = Event()
+
+        # The server listens as soon as it is created so that clients connecting before it is serving wait to be
+        # answered rather than being refused
+        request_handler: callable = partial(_InspectRequestHandler, inspect_server=self)
+
+        if socket_path is None:
+            self._http_server: BaseServer = ThreadingHTTPServer((LOCALHOST, port), request_handler)
+        else:
+            if exists(socket_path):
+                raise FileExistsError(SOCKET_EXISTS_MSG.format(socket_path))
+
+            # The socket is made private before it listens so that no other user can connect in between
+            self._http_server: BaseServer = ThreadingUnixStreamServer(
+                socket_path, request_handler, bind_and_activate=False
+            )
+            self._http_server.daemon_threads = True
+
+            try:
+                self._http_server.server_bind()
+            except OSError:
+                self._http_server.server_close()
+                raise
+
+            try:
+                chmod(socket_path, InspectServer.SOCKET_MODE)
+                self._http_server.server_activate()
+            except OSError:
+                self.close()
+                raise
+
+    def get_port(self) -> int:
+        """
+        Gets the port on localhost that the server listens on, which is chosen by the operating system if it was 0
+
+        @return: The port or None if listening on a Unix domain socket
+        """
+
+        return None if self._socket_path is not None else self._http_server.server_address[1]
+
+    def get_url(self) -> str:
+        """
+        Gets where the server listens
+
+        @return: The URL of the server on localhost or the path to its Unix domain socket
+        """
+
+        if self._socket_path is not None:
+            return SOCKET_URL.format(self._socket_path)
+
+        return TCP_URL.format(LOCALHOST, self.get_port())
+
+    def load(self):
+        """Summarizes every csv file in the data directory so that the first queries read nothing new"""
+
+        self._inspector.refresh()
+
+    def query(self, key_words: list, verbose: bool = False) -> dict:
+        """
+        Answers an inspect query
+
+        @param key_words: The key words to search for
+        @param verbose: Whether to include extra information about the CSV columns in the output lines
+        @return: The same output lines as the inspect handler prints along with the record of each relevant csv file
+        sorted by its path
+        """
+
+        csv_objects: dict = self._inspector.match(key_words=key_words)
+        lines: list = Inspector.get_csv_objects_info(csv_objects=csv_objects, verbose=verbose)
+        records: list = [csv_objects[rel_path].get_record(rel_path=rel_path) for rel_path in sorted(csv_objects)]
+
+        return {LINES_FIELD: lines, RECORDS_FIELD: records}
+
+    def serve_forever(self):
+        """Answers queries and refreshes the summaries in the background until shut down from another thread"""
+
+        refresh_thread: Thread = Thread(target=self._refresh_periodically, daemon=True)
+        refresh_thread.start()
+
+        try:
+            self._http_server.serve_forever()
+        finally:
+            self._stopped.set()
+            refresh_thread.join()
+
+    def shutdown(self):
+        """Stops serving, waiting for the server to stop if it is serving in another thread"""
+
+        self._http_server.shutdown()
+
+    def close(self):
+        """Stops listening, removing the Unix domain socket if there is one"""
+
+        self._http_server.server_close()
+
+        if self._socket_path is not None and exists(self._socket_path):
+            remove(self._socket_path)
+
+    def _refresh_periodically(self):
+        """Refreshes the summaries of the csv files every so often until the server stops"""
+
+        while not self._stopped.wait(timeout=self._refresh_seconds):
+            # A csv file removed while refreshing is forgotten by the next refresh
+            try:
+                self._inspector.refresh()
+            except OSError as e:
+                print(REFRESH_FAILED_MSG.format(e), file=sys.stderr)
+
+
+class _InspectRequestHandler(BaseHTTPRequestHandler):
+    """Answers a single HTTP request made to the inspect server with a JSON response"""
+
+    def __init__(self, *args, inspect_server: InspectServer, **kwargs):
+        # The request is handled while initializing so the inspect server must be set beforehand
+        self._inspect_server: InspectServer = inspect_server
+
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        """Answers an inspect query, whose key words and verbosity are parameters of its URL"""
+
+        url: SplitResult = urlsplit(self.path)
+
+        if url.path != INSPECT_ROUTE:
+            self._send_json(status=HTTPStatus.NOT_FOUND, body={ERROR_FIELD: ROUTE_NOT_FOUND_MSG.format(url.path)})
+            return
+
+        params: dict = parse_qs(url.query)
+        key_words: list = params.get(KEY_WORDS_PARAM, [])
+        verbose: bool = params.get(VERBOSE_PARAM, [EMPTY_STRING])[-1] == TRUE_PARAM
+
+        if len(key_words) == 0:
+            self._send_json(status=HTTPStatus.BAD_REQUEST, body={ERROR_FIELD: NO_KEY_WORDS_MSG})
+            return
+
+        for kw in key_words:
+            if MATCH_SEPARATOR in kw:
+                self._send_json(status=HTTPStatus.BAD_REQUEST, body={ERROR_FIELD: SEPARATOR_IN_KEY_WORD_MSG.format(kw)})
+                return
+
+        # The server keeps answering other queries if one of them fails
+        try:
+            body: dict = self._inspect_server.query(key_words=key_words, verbose=verbose)
+        except Exception as e:
+            self._send_json(status=HTTPStatus.INTERNAL_SERVER_ERROR, body={ERROR_FIELD: repr(e)})
+            return
+
+        self._send_json(status=HTTPStatus.OK, body=body)
+
+    def log_message(self, *args):
+        """Logs nothing, since every query would be logged and clients of a Unix domain socket have no address"""
+
+    def _send_json(self, status: HTTPStatus, body: dict):
+        """
+        Sends a JSON response
+
+        @param status: The status of the response
+        @param body: The body of the response
+        """
+
+        content: bytes = dumps(body).encode(UTF8)
+
+        self.send_response(status)
+        self.send_header(CONTENT_TYPE_HEADER, JSON_CONTENT_TYPE)
+        self.send_header(CONTENT_LENGTH_HEADER, str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
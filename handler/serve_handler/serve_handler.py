@@ -0,0 +1,84 @@
+"""Module for the serve handler class"""
+
+from argparse import ArgumentParser, Namespace
+
+from handler.handler import Handler
+from handler.inspect_handler.inspect_handler import InspectHandler
+from handler.inspect_handler.inspector import Inspector
+from handler.inspect_handler.memory_budget import MemoryBudget
+from handler.inspect_handler.summary_cache import SummaryCache
+from handler.serve_handler.inspect_server import InspectServer
+from strings.args import (
+    PORT_ARG, PORT_ARG_HELP, REFRESH_INTERVAL_ARG, REFRESH_INTERVAL_ARG_HELP, SOCKET_PATH_ARG, SOCKET_PATH_ARG_HELP,
+    STORE_ACTION
+)
+from strings.serve_handler import SERVING_MSG
+
+
+class ServeHandler(Handler):
+    """
+    Handler keeping the summaries of the csv files in the data directory in memory and answering inspect queries of it
+    from clients until interrupted
+    """
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the serve handler
+
+        @param parser: The parser to configure
+        """
+
+        InspectHandler.configure_inspector_parser(parser)
+        ServeHandler.configure_address_parser(parser)
+
+        parser.add_argument(
+            REFRESH_INTERVAL_ARG, type=float, default=InspectServer.DEFAULT_REFRESH_SECONDS, action=STORE_ACTION,
+            required=False, help=REFRESH_INTERVAL_ARG_HELP
+        )
+
+    @staticmethod
+    def configure_address_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for where the server of inspect queries listens, which are shared with its clients
+
+        @param parser: The parser to configure
+        """
+
+        parser.add_argument(
+            PORT_ARG, type=int, default=InspectServer.DEFAULT_PORT, action=STORE_ACTION, required=False,
+            help=PORT_ARG_HELP
+        )
+        parser.add_argument(SOCKET_PATH_ARG, type=str, action=STORE_ACTION, required=False, help=SOCKET_PATH_ARG_HELP)
+
+    @staticmethod
+    def handle(args: Namespace):
+        """
+        Summarizes every csv file in the data directory and then answers inspect queries of it until interrupted
+
+        @param args: The arguments for the serve handler
+        """
+
+        memory_budget: MemoryBudget = InspectHandler.get_memory_budget(args=args)
+        cache: SummaryCache = InspectHandler.get_cache(args=args)
+
+        inspector: Inspector = Inspector(
+            data_path=args.data_path, chunk_rows=args.chunk_rows, workers=args.workers, backend=args.backend,
+            prefilter=args.prefilter, archives=args.archives, cache=cache, memory_budget=memory_budget
+        )
+
+        server: InspectServer = InspectServer(
+            inspector=inspector, port=args.port, socket_path=args.socket_path, refresh_seconds=args.refresh_interval
+        )
+
+        try:
+            server.load()
+            print(SERVING_MSG.format(args.data_path, server.get_url()), flush=True)
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+
+            if cache is not None:
+                cache.close()
@@ -0,0 +1,295 @@
+"""Module for the telemetry class"""
+
+import sys
+from argparse import ArgumentParser
+from json import dumps
+from os import sysconf
+from queue import Queue
+from threading import Event, Lock, Thread
+from time import perf_counter, time
+from typing import IO, Iterator
+
+from handler.profiler import FileProfile
+from handler.utils import positive_float
+from strings.args import (
+    METRICS_FILE_ARG, METRICS_FILE_ARG_HELP, METRICS_INTERVAL_ARG, METRICS_INTERVAL_ARG_HELP, PROGRESS_ARG,
+    PROGRESS_ARG_HELP, STORE_ACTION, STORE_TRUE_ACTION
+)
+from strings.profiler import ERROR_TEXT
+from strings.telemetry import *
+
+
+class Telemetry:
+    """
+    Records the events of a run, such as a file starting or finishing, and periodically the counters of its progress,
+    as JSON lines in a metrics file. The progress line shown on standard error is drawn from the same counters events,
+    so it shows what the metrics file records. The counters are recorded by a background thread so that they keep
+    coming even while a single large file is being handled. Telemetry that is not enabled records nothing, so the
+    handlers can use it either way.
+    """
+
+    DEFAULT_INTERVAL: float = 1.0
+    BYTES_PER_MB: int = 1000 * 1000
+
+    # The number of files found between each event of the progress of the walk
+    WALK_EVENT_FILES: int = 100
+
+    def __init__(self, metrics_path: str = None, progress: bool = False, interval: float = DEFAULT_INTERVAL):
+        assert interval > 0
+
+        self._metrics_file: IO = None if metrics_path is None else open(metrics_path, WRITE_OPT)
+        self._progress: bool = progress
+        self._interval: float = interval
+        self._start: float = perf_counter()
+
+        # Events are recorded by the threads handling the run as well as the thread recording the counters
+        self._lock: Lock = Lock()
+        self._queue: Queue = None
+        self._files_found: int = 0
+        self._files_finished: int = 0
+        self._archives_extracted: int = 0
+        self._n_errors: int = 0
+        self._n_bytes: int = 0
+        self._n_rows: int = 0
+        self._n_in_flight: int = 0
+
+        self._stopped: Event = Event()
+        self._counter: Thread = None
+
+        if self.is_enabled():
+            self._record(event={EVENT_KEY: RUN_STARTED_EVENT})
+            self._counter: Thread = Thread(target=self._record_counters_periodically, daemon=True)
+            self._counter.start()
+
+    @staticmethod
+    def configure_parser(parser: ArgumentParser):
+        """
+        Configures the arguments for the telemetry of a handler
+
+        @param parser: The parser of the handler
+        """
+
+        parser.add_argument(METRICS_FILE_ARG, type=str, action=STORE_ACTION, required=False, help=METRICS_FILE_ARG_HELP)
+        parser.add_argument(
+            METRICS_INTERVAL_ARG, type=positive_float, default=Telemetry.DEFAULT_INTERVAL, action=STORE_ACTION,
+            required=False, help=METRICS_INTERVAL_ARG_HELP
+        )
+        parser.add_argument(PROGRESS_ARG, action=STORE_TRUE_ACTION, required=False, help=PROGRESS_ARG_HELP)
+
+    def is_enabled(self) -> bool:
+        """
+        Determines whether the telemetry records anything
+
+        @return: The truth value of the above mentioned query
+        """
+
+        return self._metrics_file is not None or self._progress
+
+    def watch_queue(self, queue: Queue):
+        """
+        Counts the files waiting in a queue to be handled as part of the queue depth
+
+        @param queue: The queue
+        """
+
+        self._queue: Queue = queue
+
+    def walk(self, files: Iterator[tuple]) -> Iterator[tuple]:
+        """
+        Records the progress of walking a data directory as its files are found, and each file starting as it is
+        handed on to be handled
+
+        @param files: The paths to the files and their paths relative to the data directory
+        @return: Generator of the paths to the files and their paths relative to the data directory
+        """
+
+        if not self.is_enabled():
+            yield from files
+            return
+
+        for file_paths in files:
+            _, rel_path = file_paths
+
+            with self._lock:
+                self._files_found += 1
+                self._n_in_flight += 1
+                files_found: int = self._files_found
+
+            if files_found % Telemetry.WALK_EVENT_FILES == 0:
+                self._record(event={EVENT_KEY: WALK_EVENT, FILES_FOUND_KEY: files_found})
+
+            self._record(event={EVENT_KEY: FILE_STARTED_EVENT, PATH_KEY: rel_path})
+            yield file_paths
+
+        self._record(event={EVENT_KEY: WALK_FINISHED_EVENT, FILES_FOUND_KEY: self._files_found})
+
+    def file_finished(self, file_profile: FileProfile, relevant: bool):
+        """
+        Records a csv file finishing being inspected
+
+        @param file_profile: The profile of inspecting the csv file
+        @param relevant: Whether the csv file is relevant
+        """
+
+        if not self.is_enabled():
+            return
+
+        error: str = file_profile.get_error()
+
+        with self._lock:
+            self._files_finished += 1
+            self._n_errors += error is not None
+            self._n_bytes += file_profile.get_n_bytes()
+            self._n_rows += file_profile.get_n_rows()
+
+        self._record(event={
+            EVENT_KEY: FILE_FINISHED_EVENT, PATH_KEY: file_profile.get_rel_path(),
+            BYTES_KEY: file_profile.get_n_bytes(), ROWS_KEY: file_profile.get_n_rows(),
+            SECONDS_KEY: file_profile.get_wall_seconds(), PEAK_BYTES_KEY: file_profile.get_peak_bytes(),
+            RELEVANT_KEY: relevant, ERROR_KEY: error
+        })
+
+    def path_finished(self):
+        """
+        Records that a file that was started has finished, along with the csv files inside it if it is an archive,
+        which no longer counts towards the queue depth
+        """
+
+        if self.is_enabled():
+            with self._lock:
+                self._n_in_flight -= 1
+
+    def extract_started(self, rel_path: str):
+        """
+        Records a compressed file starting being extracted
+
+        @param rel_path: The path of the compressed file relative to the data directory
+        """
+
+        if not self.is_enabled():
+            return
+
+        with self._lock:
+            self._n_in_flight += 1
+
+        self._record(event={EVENT_KEY: EXTRACT_STARTED_EVENT, PATH_KEY: rel_path})
+
+    def extract_finished(self, file_profile: FileProfile, error: Exception):
+        """
+        Records a compressed file finishing being extracted
+
+        @param file_profile: The profile of extracting the compressed file
+        @param error: The error that prevented extracting the compressed file or None if it was extracted
+        """
+
+        if not self.is_enabled():
+            return
+
+        with self._lock:
+            self._archives_extracted += error is None
+            self._n_errors += error is not None
+            self._n_bytes += file_profile.get_n_bytes()
+            self._n_in_flight -= 1
+
+        self._record(event={
+            EVENT_KEY: EXTRACT_FINISHED_EVENT, PATH_KEY: file_profile.get_rel_path(),
+            BYTES_KEY: file_profile.get_n_bytes(), SECONDS_KEY: file_profile.get_wall_seconds(),
+            ERROR_KEY: None if error is None else ERROR_TEXT.format(type(error).__name__, error)
+        })
+
+    def close(self):
+        """Records the final counters and the end of the run, and closes the metrics file"""
+
+        if not self.is_enabled():
+            return
+
+        self._stopped.set()
+        self._counter.join()
+
+        self._record(event=self._get_counters())
+        self._record(event={EVENT_KEY: RUN_FINISHED_EVENT})
+
+        if self._progress:
+            print(file=sys.stderr)
+
+        if self._metrics_file is not None:
+            self._metrics_file.close()
+
+    def _record_counters_periodically(self):
+        """Records the counters of the progress of the run every interval until the run is done"""
+
+        while not self._stopped.wait(timeout=self._interval):
+            self._record(event=self._get_counters())
+
+    def _get_counters(self) -> dict:
+        """
+        Creates the event of the counters of the progress of the run so far
+
+        @return: The event
+        """
+
+        elapsed_seconds: float = perf_counter() - self._start
+
+        with self._lock:
+            counters: dict = {
+                EVENT_KEY: COUNTERS_EVENT, ELAPSED_SECONDS_KEY: elapsed_seconds, FILES_FOUND_KEY: self._files_found,
+                FILES_FINISHED_KEY: self._files_finished, ARCHIVES_EXTRACTED_KEY: self._archives_extracted,
+                ERRORS_KEY: self._n_errors, BYTES_KEY: self._n_bytes, ROWS_KEY: self._n_rows,
+                FILES_PER_SECOND_KEY: (self._files_finished + self._archives_extracted) / elapsed_seconds,
+                MB_PER_SECOND_KEY: self._n_bytes / Telemetry.BYTES_PER_MB / elapsed_seconds,
+                QUEUE_DEPTH_KEY: self._n_in_flight + (0 if self._queue is None else self._queue.qsize()),
+                RSS_BYTES_KEY: Telemetry._get_rss_bytes()
+            }
+
+        return counters
+
+    def _record(self, event: dict):
+        """
+        Records an event in the metrics file, and shows the progress line if the event is of the counters
+
+        @param event: The event, which is given the time it was recorded
+        """
+
+        event[TIME_KEY] = time()
+
+        with self._lock:
+            if self._metrics_file is not None:
+                self._metrics_file.write(EVENT_LINE.format(dumps(event)))
+                self._metrics_file.flush()
+
+            if self._progress and event[EVENT_KEY] == COUNTERS_EVENT:
+                print(Telemetry._get_progress_line(counters=event), end='', file=sys.stderr, flush=True)
+
+    @staticmethod
+    def _get_progress_line(counters: dict) -> str:
+        """
+        Creates the progress line from the event of the counters of the progress of the run
+
+        @param counters: The event
+        @return: The progress line, which starts by returning to the start of the line so it replaces the last one
+        """
+
+        rss_bytes: int = counters[RSS_BYTES_KEY]
+        rss: str = RSS_UNKNOWN if rss_bytes is None else RSS_MB.format(rss_bytes / Telemetry.BYTES_PER_MB)
+
+        return PROGRESS_LINE.format(
+            counters[FILES_FOUND_KEY], counters[FILES_FINISHED_KEY], counters[ERRORS_KEY],
+            counters[ARCHIVES_EXTRACTED_KEY], counters[FILES_PER_SECOND_KEY], counters[MB_PER_SECOND_KEY],
+            counters[QUEUE_DEPTH_KEY], rss
+        )
+
+    @staticmethod
+    def _get_rss_bytes() -> int:
+        """
+        Gets the resident memory of this process, which does not include any worker processes
+
+        @return: The number of bytes or None if it cannot be found on this platform
+        """
+
+        try:
+            with open(PROC_STATM_PATH, READ_OPT) as f:
+                n_pages: int = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+
+        return n_pages * sysconf(SC_PAGE_SIZE)
@@ -1,8 +1,33 @@
 """Module containing functionality used across the repository"""
 
-from os.path import isdir, join, split
+from argparse import ArgumentTypeError
+from bz2 import open as open_bz2
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from gzip import open as open_gz
+from lzma import open as open_xz
+from math import isfinite
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from os.path import isdir, isfile, join, split, splitext
+from posixpath import normpath
+from typing import IO, Iterator, Union
 
-from strings.general import EMPTY_STRING
+from handler.directory_walker import DirectoryWalker
+from strings.args import NOT_POSITIVE_FLOAT_MSG, NOT_POSITIVE_INT_MSG, PROCESS_BACKEND, THREAD_BACKEND
+from strings.extract_handler import (
+    ARCHIVE_PATH_SEPARATOR, BZ2_COMPRESSION, BZ2_EXTENSION, CURRENT_DIR, FILE_EXTENSION_UNSUPPORTED_MSG, GZ_COMPRESSION,
+    GZ_EXTENSION, PARENT_DIR, TAR_EXTENSION, TAR_GZ_EXTENSION, TGZ_EXTENSION, XZ_COMPRESSION, XZ_EXTENSION,
+    ZIP_EXTENSION
+)
+from strings.general import CSV_EXTENSION, EMPTY_STRING, FORKSERVER_START_METHOD, WORKER_MODULES
+from strings.inspect_handler import READ_BYTES_OPT
+
+
+# Process workers are started from a fork server rather than forked from this process, whose other threads, such as the
+# one extracting compressed files while scanning, could hold locks that a forked worker would never see released. The
+# fork server imports what the workers need once when it starts so that each worker starts with it.
+_PROCESS_CONTEXT: BaseContext = get_context(FORKSERVER_START_METHOD)
+_PROCESS_CONTEXT.set_forkserver_preload(WORKER_MODULES)
 
 
 def add_trailing_slash(dir_path: str) -> str:
@@ -18,27 +43,224 @@ def add_trailing_slash(dir_path: str) -> str:
     return join(dir_path, EMPTY_STRING)
 
 
-def remove_root_dir(file_path: str, root: str) -> str:
+def positive_int(arg: str) -> int:
+    """
+    Parses the value of a numeric argument that counts something, such as rows or workers, and so must be positive
+
+    @param arg: The value of the argument
+    @return: The positive integer that the value is
+    """
+
+    try:
+        value: int = int(arg)
+    except ValueError:
+        value: int = 0
+
+    if value < 1:
+        raise ArgumentTypeError(NOT_POSITIVE_INT_MSG.format(arg))
+
+    return value
+
+
+def positive_float(arg: str) -> float:
+    """
+    Parses the value of a numeric argument that measures something, such as seconds, and so must be positive and finite
+
+    @param arg: The value of the argument
+    @return: The positive number that the value is
+    """
+
+    try:
+        value: float = float(arg)
+    except ValueError:
+        value: float = 0.0
+
+    if not (value > 0 and isfinite(value)):
+        raise ArgumentTypeError(NOT_POSITIVE_FLOAT_MSG.format(arg))
+
+    return value
+
+
+def get_executor(workers: int, backend: str) -> Executor:
+    """
+    Creates a pool of workers that process files in parallel
+
+    @param workers: The number of workers in the pool
+    @param backend: Whether the workers are processes or threads
+    @return: The pool of workers
+    """
+
+    if backend == PROCESS_BACKEND:
+        return ProcessPoolExecutor(max_workers=workers, mp_context=_PROCESS_CONTEXT)
+
+    assert backend == THREAD_BACKEND
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def get_csv_paths(data_path: str, include_archives: bool = False) -> Iterator[tuple]:
     """
-    Removes the root directory from a file path
+    Yields the csv files in a data directory and its sub directories, including compressed csv files unless they were
+    already decompressed. A compressed csv file is given the relative path it would have once decompressed.
 
-    @param file_path: The file path to remove the root directory from
-    @param root: The root directory in the path to remove
-    @return: The modified file path
+    @param data_path: The path to the data directory
+    @param include_archives: Whether to yield the compressed-directory files as well, unless they were already extracted
+    @return: Generator of tuples containing the path to a csv file and its path relative to the data directory
     """
 
-    assert file_path.startswith(root)
+    for root, file_path, rel_path in DirectoryWalker(dir_path=data_path):
+        csv_rel_path: str = get_csv_rel_path(file_path=file_path, rel_path=rel_path)
+
+        if csv_rel_path is not None:
+            yield file_path, csv_rel_path
+        elif include_archives and is_compressed_dir(file_name=file_path):
+            _, file_name = split(file_path)
+
+            if not isdir(join(root, get_compressed_file_name(file_name=file_name))):
+                yield file_path, rel_path
+
+
+def get_csv_rel_path(file_path: str, rel_path: str) -> str:
+    """
+    Gets the relative path that a file is inspected under if it is a csv file. A compressed csv file is given the
+    relative path it would have once decompressed, unless it was already decompressed or another compressed file would
+    decompress to the same path, in which case it keeps its own path.
+
+    @param file_path: The path to the file
+    @param rel_path: The path of the file relative to the data directory
+    @return: The relative path of the csv file or None if the file is not a csv file to inspect
+    """
+
+    if file_path.endswith(CSV_EXTENSION):
+        return rel_path
+
+    if not is_csv(file_name=file_path):
+        return None
+
+    decompressed_path: str = get_decompressed_name(file_name=file_path)
+    if isfile(decompressed_path):
+        return None
+
+    for extension in [BZ2_EXTENSION, GZ_EXTENSION, XZ_EXTENSION]:
+        if decompressed_path + extension != file_path and isfile(decompressed_path + extension):
+            return rel_path
+
+    return get_decompressed_name(file_name=rel_path)
+
+
+def get_compressed_file_name(file_name: str) -> str:
+    """
+    Gets the name of a compressed-directory file without its extension, which is the name of the directory it extracts
+    to
+
+    @param file_name: The name of the compressed-directory file
+    @return: The name of the compressed-directory file without its extension
+    """
 
-    remaining_path, end_of_path = split(file_path)
-    path_components: list = [end_of_path]
+    if file_name.endswith(TAR_EXTENSION):
+        extension_len: int = len(TAR_EXTENSION)
+    elif file_name.endswith(ZIP_EXTENSION):
+        extension_len: int = len(ZIP_EXTENSION)
+    elif file_name.endswith(TAR_GZ_EXTENSION):
+        extension_len: int = len(TAR_GZ_EXTENSION)
+    elif file_name.endswith(TGZ_EXTENSION):
+        extension_len: int = len(TGZ_EXTENSION)
+    else:
+        error_msg: str = FILE_EXTENSION_UNSUPPORTED_MSG.format(file_name)
+        raise ValueError(error_msg)
 
-    # While the remaining path is not the root directory nor the root directory with a trailing slash
-    while remaining_path != root and root != add_trailing_slash(dir_path=remaining_path):
-        assert remaining_path != EMPTY_STRING
+    assert extension_len > 0
 
-        remaining_path, end_of_path = split(remaining_path)
-        path_components.insert(0, end_of_path)
+    file_name: str = file_name[:len(file_name) - extension_len]
+    return file_name
 
-    file_path: str = join(*path_components)
-    return file_path
 
+def is_compressed_dir(file_name: str) -> bool:
+    """
+    Determines whether a file is a compressed-directory file, which is an archive of files and directories
+
+    @param file_name: The name of or path to the file
+    @return: The truth value of the above mentioned query
+    """
+
+    compressed_dir_extensions: list = [TAR_EXTENSION, TAR_GZ_EXTENSION, TGZ_EXTENSION, ZIP_EXTENSION]
+    return any(file_name.endswith(extension) for extension in compressed_dir_extensions)
+
+
+def get_member_name(member_name: str) -> str:
+    """
+    Normalizes the name of a file or directory in a compressed-directory file, which is its path relative to the
+    directory the compressed-directory file extracts to
+
+    @param member_name: The name of the file or directory in the compressed-directory file
+    @return: The normalized name or None if the file or directory would be extracted outside of the directory or would
+    be the directory itself
+    """
+
+    member_name: str = normpath(member_name.lstrip(ARCHIVE_PATH_SEPARATOR))
+
+    if member_name == CURRENT_DIR or member_name == PARENT_DIR:
+        return None
+
+    if member_name.startswith(PARENT_DIR + ARCHIVE_PATH_SEPARATOR):
+        return None
+
+    return member_name
+
+
+def is_csv(file_name: str) -> bool:
+    """
+    Determines whether a file is a csv file, which may be compressed on its own with gzip, bzip2 or xz
+
+    @param file_name: The name of or path to the file
+    @return: The truth value of the above mentioned query
+    """
+
+    if get_compression(file_name=file_name) is not None:
+        file_name: str = get_decompressed_name(file_name=file_name)
+
+    return file_name.endswith(CSV_EXTENSION)
+
+
+def get_compression(file_name: str) -> str:
+    """
+    Gets the compression of a file compressed on its own from its extension
+
+    @param file_name: The name of or path to the file
+    @return: The name of the compression, as pandas refers to it, or None if the file is not compressed on its own
+    """
+
+    compressions: dict = {BZ2_EXTENSION: BZ2_COMPRESSION, GZ_EXTENSION: GZ_COMPRESSION, XZ_EXTENSION: XZ_COMPRESSION}
+
+    for extension, compression in compressions.items():
+        if file_name.endswith(extension):
+            return compression
+
+    return None
+
+
+def get_decompressed_name(file_name: str) -> str:
+    """
+    Gets the name of a file compressed on its own without its compression extension, which is the name it decompresses
+    to
+
+    @param file_name: The name of or path to the compressed file
+    @return: The name of or path to the compressed file without its compression extension
+    """
+
+    assert get_compression(file_name=file_name) is not None
+
+    file_name, _ = splitext(file_name)
+    return file_name
+
+
+def open_decompressed(file: Union[str, IO], compression: str) -> IO:
+    """
+    Opens a file compressed on its own, decompressing it as it is read rather than all at once
+
+    @param file: The path to the compressed file or the open compressed file
+    @param compression: The name of the compression of the file
+    @return: The open decompressed file
+    """
+
+    decompressors: dict = {BZ2_COMPRESSION: open_bz2, GZ_COMPRESSION: open_gz, XZ_COMPRESSION: open_xz}
+    return decompressors[compression](file, READ_BYTES_OPT)
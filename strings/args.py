@@ -1,17 +1,102 @@
 """Module containing the strings used for command line argument parsing"""
 
+ARCHIVES_ARG: str = '--archives'
+ARCHIVES_ARG_HELP: str = 'If specified, also inspects the CSVs inside .zip, .tar, .tar.gz and .tgz files without ' \
+                          'extracting them, as if they were extracted'
+BACKEND_ARG: str = '--backend'
+BACKEND_ARG_HELP: str = 'Whether the workers are processes or threads'
+CACHE_HASH_ARG: str = '--cache-hash'
+CACHE_HASH_ARG_HELP: str = 'If specified, validates cached CSV summaries by a hash of the CSV contents rather than ' \
+                            'by its size and modification time'
+CACHE_PATH_ARG: str = '--cache-path'
+CACHE_PATH_ARG_HELP: str = 'The path to the file caching the summaries of CSVs between runs'
+CACHE_SIZE_ARG: str = '--cache-size'
+CACHE_SIZE_ARG_HELP: str = 'The maximum size in MiB of the cached CSV summaries, beyond which the least recently ' \
+                            'used are evicted'
+CHUNK_ROWS_ARG: str = '--chunk-rows'
+CHUNK_ROWS_ARG_HELP: str = 'If specified, reads each CSV this many rows at a time to bound memory usage. Very large ' \
+                           'CSVs are read in chunks regardless'
+CLIENT_HANDLER_NAME: str = 'client'
 DATA_PATH_ARG: str = '--data-path'
 DATA_PATH_ARG_HELP: str = 'The path to the data to query'
 EXTRACT_HANDLER_NAME: str = 'extract'
+EXTRACT_WORKERS_ARG: str = '--extract-workers'
+EXTRACT_WORKERS_ARG_HELP: str = 'The number of workers that extract compressed files in parallel'
+FORMAT_ARG: str = '--format'
+FORMAT_ARG_HELP: str = 'The format to write the results in. The text format is printed once every CSV has been ' \
+                       'inspected while jsonl and parquet write a record of the path, columns, statistics and class ' \
+                       'counts of each relevant CSV as soon as it is found, regardless of --verbose'
+INCREMENTAL_ARG: str = '--incremental'
+INCREMENTAL_ARG_HELP: str = 'If specified, only summarizes the CSVs added or modified since the index was last built ' \
+                             'and removes the deleted ones, reporting each change'
+INDEX_HANDLER_NAME: str = 'index'
+INDEX_PATH_ARG: str = '--index-path'
+INDEX_PATH_ARG_HELP: str = 'The path to the index of the CSVs in the data directory, which is in the cache directory ' \
+                            'by default'
 INSPECT_HANDLER_NAME: str = 'inspect'
 KEY_WORDS_ARG: str = '--key-words'
 KEY_WORDS_ARG_HELP: str = 'The list of key words to search for, usage: --key-words keyword1 keyword2 ...'
+MEMORY_BUDGET_ARG: str = '--memory-budget'
+MEMORY_BUDGET_ARG_HELP: str = 'If specified, the MiB of memory that the CSVs inspected at once may take to parse, ' \
+                              'estimated from their sizes and sampled rows. A CSV that would not fit is read in ' \
+                              'chunks and workers wait for room in the budget before inspecting another CSV'
+METRICS_FILE_ARG: str = '--metrics-file'
+METRICS_FILE_ARG_HELP: str = 'The path to write a JSON line to for each event of the run, such as a file starting or ' \
+                             'finishing, along with periodic counters of its progress'
+METRICS_INTERVAL_ARG: str = '--metrics-interval'
+METRICS_INTERVAL_ARG_HELP: str = 'The number of seconds between the counters of the progress of the run'
+NOT_POSITIVE_FLOAT_MSG: str = '{} is not a positive number'
+NOT_POSITIVE_INT_MSG: str = '{} is not a positive integer'
+NO_CACHE_ARG: str = '--no-cache'
+NO_CACHE_ARG_HELP: str = 'If specified, neither reads nor writes the cache of CSV summaries'
+ONLY_ARG: str = '--only'
+ONLY_ARG_HELP: str = 'The globs that the names of the files to extract match, ignoring case, which defaults to CSVs. ' \
+                     'The compressed files that may contain such files are always extracted'
+OUTPUT_ARG: str = '--output'
+OUTPUT_ARG_HELP: str = 'The path of the file to write the results to, which is standard output by default'
+PORT_ARG: str = '--port'
+PORT_ARG_HELP: str = 'The port on localhost that the server of inspect queries listens on for HTTP requests'
+PREFILTER_ARG: str = '--prefilter'
+PREFILTER_ARG_HELP: str = 'If specified, skips parsing CSVs whose raw bytes contain none of the key words when it is ' \
+                          'certain that they cannot match'
+PROCESS_BACKEND: str = 'process'
+PROFILE_ARG: str = '--profile'
+PROFILE_ARG_HELP: str = 'If specified, reports the time of each stage, the throughput and the slowest files and ' \
+                        'columns to standard error once done'
+PROFILE_PSTATS_ARG: str = '--profile-pstats'
+PROFILE_PSTATS_ARG_HELP: str = 'The path to save the cProfile statistics of the main process to when profiling, to ' \
+                               'be read with pstats'
+PROFILE_TOP_ARG: str = '--profile-top'
+PROFILE_TOP_ARG_HELP: str = 'The number of the slowest files and columns to report when profiling'
+PROGRESS_ARG: str = '--progress'
+PROGRESS_ARG_HELP: str = 'If specified, shows a line of the progress of the run on standard error that is updated ' \
+                         'with each of its counters'
+QUERY_HANDLER_NAME: str = 'query'
+REBUILD_CACHE_ARG: str = '--rebuild-cache'
+REBUILD_CACHE_ARG_HELP: str = 'If specified, discards the cached CSV summaries and summarizes every CSV again'
+REFRESH_INTERVAL_ARG: str = '--refresh-interval'
+REFRESH_INTERVAL_ARG_HELP: str = 'The number of seconds between refreshing the summaries that the server keeps ' \
+                                 'of the CSVs that were added, modified or removed since'
+SCAN_HANDLER_NAME: str = 'scan'
+SERVE_HANDLER_NAME: str = 'serve'
+SOCKET_PATH_ARG: str = '--socket-path'
+SOCKET_PATH_ARG_HELP: str = 'If specified, the path to the Unix domain socket that the server of inspect queries ' \
+                            'listens on for HTTP requests rather than a port on localhost'
 STORE_ACTION: str = 'store'
 STORE_TRUE_ACTION: str = 'store_true'
 SUB_PARSER: str = 'handler_type'
+TEST_CHUNK_ROWS: str = '2'
 TEST_KEY_WORD1: str = 'numeric'
 TEST_KEY_WORD2: str = 'Nominal'
 TEST_KEY_WORD3: str = 'may'
 TEST_KEY_WORD4: str = 'adas.txt'
+TEST_MEMORY_BUDGET: str = '1'
+TEST_NOT_POSITIVE_FLOATS: tuple = ('0', '-0.5', 'nan', 'inf', 'two')
+TEST_NOT_POSITIVE_INTS: tuple = ('0', '-2', 'two')
+TEST_ONLY_GLOB: str = '*'
+TEST_WORKERS: str = '2'
+THREAD_BACKEND: str = 'thread'
 VERBOSE_ARG: str = '--verbose'
 VERBOSE_ARG_HELP: str = 'If specified, will output information in addition to CSV file paths and column names'
+WORKERS_ARG: str = '--workers'
+WORKERS_ARG_HELP: str = 'The number of workers that inspect CSVs in parallel'
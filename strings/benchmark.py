@@ -0,0 +1,67 @@
+"""Module containing strings used by the benchmarks"""
+
+ADNI_COL_NAMES: list = [
+    'RID', 'VISCODE', 'DX', 'PTGENDER', 'MMSE', 'CDRSB', 'ADAS13', 'APOE4', 'AGE', 'PTEDUCAT', 'FDG', 'AV45',
+    'Hippocampus', 'WholeBrain', 'Entorhinal', 'Fusiform', 'MidTemp', 'ICV'
+]
+ADNI_NOMINAL_VALUES: list = ['bl', 'm06', 'm12', 'CN', 'EMCI', 'LMCI', 'AD', 'Male', 'Female', 'Yes', 'No']
+ARCHIVE_LEVELS_ARG: str = '--archive-levels'
+ARCHIVE_LEVELS_ARG_HELP: str = 'The number of archives each top level directory is nested in, zero for none'
+ARG_PREFIX: str = '-'
+BASELINE_ARG: str = '--baseline'
+BASELINE_ARG_HELP: str = 'The path to the json results of a previous run to compare the time of each stage against'
+BASELINE_SECONDS_KEY: str = 'baseline_seconds'
+BENCHMARK_DATA_PATH: str = 'benchmark_data'
+BENCHMARK_KEY_WORDS_ARG_HELP: str = 'The key words to match against the generated CSVs'
+BYTES_KEY: str = 'bytes'
+CARDINALITY_ARG: str = '--cardinality'
+CARDINALITY_ARG_HELP: str = 'The number of distinct values in each nominal column'
+COLS_ARG: str = '--cols'
+COLS_ARG_HELP: str = 'The number of columns in each CSV'
+COL_NAME: str = '{}_{}'
+CSV_NAME: str = 'table{}.csv'
+DEFAULT_KEY_WORDS: list = ['DX', 'm12']
+DEPTH_ARG: str = '--depth'
+DEPTH_ARG_HELP: str = 'The maximum depth of the directories below the data directory'
+DIRS_ARG: str = '--dirs'
+DIRS_ARG_HELP: str = 'The number of directories to spread the CSVs across'
+DIR_NAME: str = 'visit{}'
+ERRORS_KEY: str = 'errors'
+EXTRACT_ALL_GLOB: str = '*'
+EXTRACT_STAGE: str = 'extract'
+FILES_ARG: str = '--files'
+FILES_ARG_HELP: str = 'The number of readable CSVs'
+FILES_KEY: str = 'files'
+MATCH_STAGE: str = 'match'
+NOMINAL_FRACTION_ARG: str = '--nominal-fraction'
+NOMINAL_FRACTION_ARG_HELP: str = 'The fraction of the columns in each CSV that are nominal rather than numeric'
+NOMINAL_VALUE: str = '{}{}'
+OUTPUT_ARG: str = '--output'
+OUTPUT_ARG_HELP: str = 'The path to write the json results to rather than printing them'
+PARAMS_KEY: str = 'params'
+PARAM_MISMATCH_LINE: str = 'Not compared against the baseline since its {} parameter was {!r} rather than {!r}'
+PARSE_STAGE: str = 'parse'
+PRINT_STAGE: str = 'print'
+REGRESSED_KEY: str = 'regressed'
+REGRESSION_LINE: str = 'Regression in the {} stage: {:.3f} seconds against a baseline of {:.3f} seconds'
+REPEAT_ARG: str = '--repeat'
+REPEAT_ARG_HELP: str = 'The number of times to run the benchmarks, keeping the fastest time of each stage'
+ROWS_ARG: str = '--rows'
+ROWS_ARG_HELP: str = 'The number of rows in each CSV'
+ROWS_KEY: str = 'rows'
+SECONDS_KEY: str = 'seconds'
+SEED_ARG: str = '--seed'
+SEED_ARG_HELP: str = 'The seed of the random generation of the data, which is the same for the same seed'
+STAGES_KEY: str = 'stages'
+SUMMARIZE_STAGE: str = 'summarize'
+THRESHOLD_ARG: str = '--threshold'
+THRESHOLD_ARG_HELP: str = 'The fraction by which a stage can be slower than in the baseline before it is a regression'
+THRESHOLD_KEY: str = 'threshold'
+UNREADABLE_ARG: str = '--unreadable'
+UNREADABLE_ARG_HELP: str = 'The number of CSVs that cannot be parsed, in addition to the readable ones'
+UNREADABLE_CSV_BYTES: bytes = b'\x96'
+UNREADABLE_CSV_NAME: str = 'unreadable{}.csv'
+UNREADABLE_CSV_ROWS: str = 'a,b\n1,2\n1,2,3,4\n'
+WALK_STAGE: str = 'walk'
+WRITE_BYTES_OPT: str = 'wb'
+WRITE_OPT: str = 'w'
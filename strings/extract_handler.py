@@ -1,13 +1,38 @@
 """Module containing strings used by the extract handler"""
 
+APPEND_OPT: str = 'a'
+ARCHIVE_PATH_SEPARATOR: str = '/'
+BZ2_COMPRESSION: str = 'bz2'
+BZ2_EXTENSION: str = '.bz2'
+COMPLETED_STATE: str = 'completed'
+COPY_FILE_RANGE_FUNC: str = 'copy_file_range'
+CSV_GLOB: str = '*.csv'
+CURRENT_DIR: str = '.'
+DEST_EXISTS_MSG: str = 'The destination {} already exists'
+EXTRACTED_LINE: str = 'Extracted: {}'
+EXTRACT_FAILED_LINE: str = 'Failed to extract: {} due to an error of type: {} and with message: {}'
+EXTRACT_SUMMARY_MSG: str = 'Extracted {} compressed files and failed to extract {} compressed files'
+FAILED_STATE: str = 'failed'
 FILE_EXTENSION_UNSUPPORTED_MSG: str = 'The file extension of the file {} cannot be extracted'
-GZ_EXTRACT_COMMAND: str = 'gunzip {}'
+GZ_COMPRESSION: str = 'gzip'
 GZ_EXTENSION: str = '.gz'
-REMOVE_FILE_COMMAND: str = 'rm {}'
-TAR_EXTRACT_COMMAND: str = 'tar -xf {} -C {}'
+IN_PROGRESS_STATE: str = 'in progress'
+JOURNAL_FILE_NAME: str = '.extract-journal.jsonl'
+JOURNAL_LINE: str = '{}\n'
+JOURNAL_PATH_KEY: str = 'path'
+JOURNAL_STATE_KEY: str = 'state'
+MEMBER_TRUNCATED_MSG: str = 'The compressed-directory file ended before all of {} was copied'
+PARENT_DIR: str = '..'
+PARTIAL_SUFFIX: str = '.partial'
+PLANNED_STATE: str = 'planned'
+READ_BYTES_OPT: str = 'rb'
+READ_OPT: str = 'r'
+SENDFILE_FUNC: str = 'sendfile'
 TAR_EXTENSION: str = '.tar'
 TAR_GZ_EXTENSION: str = '.tar.gz'
-TAR_GZ_EXTRACT_COMMAND: str = 'tar -xzf {} -C {}'
+TAR_READ_MODE: str = 'r:*'
 TGZ_EXTENSION: str = '.tgz'
+WRITE_BYTES_OPT: str = 'wb'
+XZ_COMPRESSION: str = 'xz'
+XZ_EXTENSION: str = '.xz'
 ZIP_EXTENSION: str = '.zip'
-ZIP_EXTRACT_COMMAND: str = 'unzip {} -d {} > /dev/null'
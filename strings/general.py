@@ -2,6 +2,10 @@
 
 CSV_EXTENSION: str = '.csv'
 EMPTY_STRING: str = ''
+FORKSERVER_START_METHOD: str = 'forkserver'
 MAIN_NAME: str = '__main__'
 NAN: str = 'nan'
 TEST_DIR: str = 'test'
+WORKER_MODULES: list = [
+    'handler.extract_handler', 'handler.index_handler.index_handler', 'handler.inspect_handler.inspector'
+]
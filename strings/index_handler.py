@@ -0,0 +1,34 @@
+"""Module containing strings for the index and query handlers"""
+
+ADDED_CHANGE: str = 'Added'
+CHANGES_MSG: str = 'Indexed {} added and {} modified CSVs, removed {} deleted CSVs and kept {} unchanged CSVs'
+CHANGE_LINE: str = '{}: {}'
+CREATE_FILES_TABLE_SQL: str = 'CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, rel_path TEXT UNIQUE, ' \
+                              'size INTEGER, mtime_ns INTEGER, inode INTEGER, summary BLOB)'
+CREATE_POSTINGS_TABLE_SQL: str = 'CREATE TABLE IF NOT EXISTS postings (term_id INTEGER, file_id INTEGER, ' \
+                                 'PRIMARY KEY (term_id, file_id)) WITHOUT ROWID'
+CREATE_TERMS_TABLE_SQL: str = 'CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, term TEXT UNIQUE)'
+DELETED_CHANGE: str = 'Deleted'
+DELETE_FILES_SQL: str = 'DELETE FROM files'
+DELETE_FILE_POSTINGS_SQL: str = 'DELETE FROM postings WHERE file_id = ?'
+DELETE_FILE_SQL: str = 'DELETE FROM files WHERE id = ?'
+DELETE_ORPHAN_TERMS_SQL: str = 'DELETE FROM terms WHERE id NOT IN (SELECT term_id FROM postings)'
+DELETE_POSTINGS_SQL: str = 'DELETE FROM postings'
+DELETE_TERMS_SQL: str = 'DELETE FROM terms'
+DROP_FILES_TABLE_SQL: str = 'DROP TABLE IF EXISTS files'
+DROP_POSTINGS_TABLE_SQL: str = 'DROP TABLE IF EXISTS postings'
+DROP_TERMS_TABLE_SQL: str = 'DROP TABLE IF EXISTS terms'
+GET_INDEX_VERSION_SQL: str = 'PRAGMA user_version'
+INDEX_FILE_NAME: str = 'index-{}.sqlite'
+INDEX_NOT_FOUND_MSG: str = 'There is no index at {}, create it with the index command first'
+INSERT_FILE_SQL: str = 'INSERT INTO files (rel_path, size, mtime_ns, inode, summary) VALUES (?, ?, ?, ?, ?)'
+INSERT_POSTING_SQL: str = 'INSERT INTO postings VALUES (?, ?)'
+INSERT_TERM_SQL: str = 'INSERT INTO terms (term) VALUES (?)'
+MODIFIED_CHANGE: str = 'Modified'
+QUERY_CONDITION_SEPARATOR: str = ' OR '
+QUERY_SQL: str = 'SELECT rel_path, summary FROM files WHERE id IN (SELECT postings.file_id FROM terms JOIN postings ' \
+                 'ON postings.term_id = terms.id WHERE {})'
+SELECT_SNAPSHOT_SQL: str = 'SELECT rel_path, id, size, mtime_ns, inode FROM files'
+SELECT_TERMS_SQL: str = 'SELECT term, id FROM terms'
+SET_INDEX_VERSION_SQL: str = 'PRAGMA user_version = {}'
+TERM_CONTAINS_SQL: str = 'instr(terms.term, ?) > 0'
@@ -1,12 +1,57 @@
 """Module containing strings for the inspect handler"""
 
+ASCII: str = 'ascii'
+CACHE_DIR: str = '~/.cache/RecursiveCSVInspector'
+CACHE_FILE_NAME: str = 'summaries.sqlite'
+CACHE_HASH_KEY_PREFIX: str = 'blake2b:'
+CASE_FOLDED_ASCII_CHARS: str = '\u0130\u212a'
+CLASSES_FIELD: str = 'classes'
+COERCE: str = 'coerce'
+COLUMNS_FIELD: str = 'columns'
+CREATE_CACHE_INDEX_SQL: str = 'CREATE INDEX IF NOT EXISTS summaries_last_used ON summaries (last_used)'
+CREATE_CACHE_TABLE_SQL: str = 'CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, size INTEGER, ' \
+                              'mtime_ns INTEGER, last_used REAL, n_bytes INTEGER, summary BLOB)'
 CSV_NOT_LOADED_MSG: str = '\tThe CSV for this path could not be loaded due to an error of type: {} and with message: {}'
+DELETE_CACHE_ENTRY_SQL: str = 'DELETE FROM summaries WHERE key = ?'
+DELETE_CACHE_SQL: str = 'DELETE FROM summaries'
+DROP_CACHE_TABLE_SQL: str = 'DROP TABLE IF EXISTS summaries'
+DUPLICATE_COL_SEPARATOR: str = '.'
+DUPLICATE_CSV_MSG: str = 'Skipping a csv file inspected under {} since another csv file already was'
+ERROR_FIELD: str = 'error'
+GET_CACHE_VERSION_SQL: str = 'PRAGMA user_version'
 INDENT: str = '\t'
+INSERT_CACHE_ENTRY_SQL: str = 'INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?, ?)'
+KEY_WORD_SEPARATOR: str = '|'
 MAPPING_SYMBOL: str = ': '
+MATCH_SEPARATOR: str = '\0'
+MAX_FIELD: str = 'max'
 MAX_KEY: str = 'Max'
+MEAN_FIELD: str = 'mean'
 MEAN_KEY: str = 'Mean'
+MEMORY_REPORT_LINE: str = 'Memory budget of {:.3f} MB: the largest peak memory was {:.3f} MB while inspecting {}'
+MIN_FIELD: str = 'min'
 MIN_KEY: str = 'Min'
+NAME_FIELD: str = 'name'
+NEWLINE_BYTE: bytes = b'\n'
+NOMINAL_TYPE: str = 'nominal'
 NO_OUTPUT_MSG: str = 'There were no CSVs containing any of the provided key words'
+NUMERIC_STR_PATTERN: str = r'\d|inf|nan'
+NUMERIC_TYPE: str = 'numeric'
 NUMERIC_TYPE_KEY: str = '__n-u-m-b-e-r-s__'
+PATH_FIELD: str = 'path'
+QUOTE_CHAR: str = '"'
+RANGE_FIELD: str = 'range'
 RANGE_KEY: str = 'Range'
+READ_BYTES_OPT: str = 'rb'
+SELECT_CACHE_ENTRY_SQL: str = 'SELECT size, mtime_ns, summary FROM summaries WHERE key = ?'
+SELECT_CACHE_SIZE_SQL: str = 'SELECT COALESCE(SUM(n_bytes), 0) FROM summaries'
+SELECT_LRU_CACHE_ENTRY_SQL: str = 'SELECT key, n_bytes FROM summaries ORDER BY last_used LIMIT 1'
+SEPARATOR_IN_KEY_WORD_MSG: str = 'The key word {!r} contains a NUL character, which no column name or nominal value can'
+SET_CACHE_JOURNAL_MODE_SQL: str = 'PRAGMA journal_mode = WAL'
+SET_CACHE_VERSION_SQL: str = 'PRAGMA user_version = {}'
+STD_FIELD: str = 'std'
 STD_KEY: str = 'Std'
+TYPE_FIELD: str = 'type'
+UNNAMED_COL_PREFIX: str = 'Unnamed: '
+UPDATE_CACHE_LAST_USED_SQL: str = 'UPDATE summaries SET last_used = ? WHERE key = ?'
+UTF8: str = 'utf-8'
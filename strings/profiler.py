@@ -0,0 +1,23 @@
+"""Module containing strings used by the profiler"""
+
+COLUMN_LINE: str = '\t\t{}: {}: {:.3f} s'
+ERROR_TEXT: str = '{}: {}'
+EXTRACT_STAGE: str = 'extract'
+FILE_LINE: str = '\t\t{}: {:.3f} s wall, {:.3f} s CPU, {:.3f} MB, {} rows'
+INSPECT_STAGE: str = 'inspect'
+LARGEST_PEAKS_LINE: str = '\tLargest peak memory:'
+MATCH_SECTION: str = 'match'
+NUMERIC_COLS_NAME: str = '(numeric columns)'
+OUTPUT_STAGE: str = 'output'
+PEAK_LINE: str = '\t\t{}: {:.3f} MB'
+PROFILE_HEADER: str = 'Profile:'
+PSTATS_LINE: str = '\tSaved the cProfile statistics of this process to: {}'
+READ_SECTION: str = 'read'
+RESET_PEAK_FUNC: str = 'reset_peak'
+SECTION_LINE: str = '\tSection {}: {:.3f} s wall summed over the files'
+SLOWEST_COLUMNS_LINE: str = '\tSlowest columns:'
+SLOWEST_FILES_LINE: str = '\tSlowest files:'
+STAGE_LINE: str = '\tStage {}: {:.3f} s wall, {:.3f} s CPU in this process'
+SUMMARIZE_SECTION: str = 'summarize'
+THROUGHPUT_LINE: str = '\tThroughput: {} files in {:.3f} s ({:.3f} files/s), {:.3f} MB ({:.3f} MB/s), {} rows'
+WALK_STAGE: str = 'walk'
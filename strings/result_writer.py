@@ -0,0 +1,10 @@
+"""Module containing strings used by the result writer"""
+
+JSONL_FORMAT: str = 'jsonl'
+PARQUET_FORMAT: str = 'parquet'
+PARQUET_NOT_INSTALLED_MSG: str = 'Writing the results as parquet requires pyarrow, which can be installed with: ' \
+                                 'pip install pyarrow'
+RECORD_LINE: str = '{}\n'
+TEXT_FORMAT: str = 'text'
+WRITE_BYTES_OPT: str = 'wb'
+WRITE_OPT: str = 'w'
@@ -0,0 +1,24 @@
+"""Module containing strings for the serve and client handlers"""
+
+CONNECTION_FAILED_MSG: str = 'Could not connect to a server of inspect queries at {}, start one with the serve ' \
+                             'command first'
+CONTENT_LENGTH_HEADER: str = 'Content-Length'
+CONTENT_TYPE_HEADER: str = 'Content-Type'
+GET_METHOD: str = 'GET'
+INSPECT_ROUTE: str = '/inspect'
+JSON_CONTENT_TYPE: str = 'application/json'
+KEY_WORDS_PARAM: str = 'key_words'
+LINES_FIELD: str = 'lines'
+LOCALHOST: str = '127.0.0.1'
+NO_KEY_WORDS_MSG: str = 'An inspect query needs at least one key_words parameter'
+QUERY_FAILED_MSG: str = 'The server of inspect queries failed to answer with status {}: {}'
+RECORDS_FIELD: str = 'records'
+REFRESH_FAILED_MSG: str = 'Failed to refresh the summaries of the CSVs, trying again later: {}'
+ROUTE_NOT_FOUND_MSG: str = 'There is nothing at {}, inspect queries are made at /inspect'
+ROUTE_QUERY: str = '{}?{}'
+SERVING_MSG: str = 'Serving inspect queries of {} at {}'
+SOCKET_EXISTS_MSG: str = 'The socket {} already exists, remove it if no server is listening on it'
+SOCKET_URL: str = 'unix:{}'
+TCP_URL: str = 'http://{}:{}'
+TRUE_PARAM: str = 'true'
+VERBOSE_PARAM: str = 'verbose'
@@ -0,0 +1,38 @@
+"""Module containing strings used by the telemetry"""
+
+ARCHIVES_EXTRACTED_KEY: str = 'archives_extracted'
+BYTES_KEY: str = 'bytes'
+COUNTERS_EVENT: str = 'counters'
+ELAPSED_SECONDS_KEY: str = 'elapsed_seconds'
+ERRORS_KEY: str = 'errors'
+ERROR_KEY: str = 'error'
+EVENT_KEY: str = 'event'
+EVENT_LINE: str = '{}\n'
+EXTRACT_FINISHED_EVENT: str = 'extract_finished'
+EXTRACT_STARTED_EVENT: str = 'extract_started'
+FILES_FINISHED_KEY: str = 'files_finished'
+FILES_FOUND_KEY: str = 'files_found'
+FILES_PER_SECOND_KEY: str = 'files_per_second'
+FILE_FINISHED_EVENT: str = 'file_finished'
+FILE_STARTED_EVENT: str = 'file_started'
+MB_PER_SECOND_KEY: str = 'mb_per_second'
+PATH_KEY: str = 'path'
+PEAK_BYTES_KEY: str = 'peak_bytes'
+PROC_STATM_PATH: str = '/proc/self/statm'
+PROGRESS_LINE: str = '\rFound {} | inspected {} ({} errors) | extracted {} | {:.1f} files/s | {:.2f} MB/s | ' \
+                     'queue {} | RSS {}'
+QUEUE_DEPTH_KEY: str = 'queue_depth'
+READ_OPT: str = 'r'
+RELEVANT_KEY: str = 'relevant'
+ROWS_KEY: str = 'rows'
+RSS_BYTES_KEY: str = 'rss_bytes'
+RSS_MB: str = '{:.0f} MB'
+RSS_UNKNOWN: str = '?'
+RUN_FINISHED_EVENT: str = 'run_finished'
+RUN_STARTED_EVENT: str = 'run_started'
+SC_PAGE_SIZE: str = 'SC_PAGE_SIZE'
+SECONDS_KEY: str = 'seconds'
+TIME_KEY: str = 'time'
+WALK_EVENT: str = 'walk'
+WALK_FINISHED_EVENT: str = 'walk_finished'
+WRITE_OPT: str = 'w'
@@ -1,5 +1,8 @@
 """Module containing strings for creating the test data set"""
 
+CACHE_NAME: str = 'cache.sqlite'
+CORRUPT_ZIP_LINE: str = 'This is not a zip file'
+CORRUPT_ZIP_NAME: str = 'corrupt.zip'
 CSV1_NAME: str = 'DATA'
 CSV1_NOMINAL_FEAT1_NAME: str = 'TYPE'
 CSV1_NOMINAL_FEAT1_VAL1: str = 'Yes'
@@ -16,6 +19,7 @@ CSV1_NUMERIC_FEAT_VAL1: str = '200'
 CSV1_NUMERIC_FEAT_VAL2: str = '20'
 CSV1_NUMERIC_FEAT_VAL3: str = '10'
 CSV1_NUMERIC_FEAT_VAL4: str = '2'
+CSV2_FEAT3_NAME: str = 'AllNaNs'
 CSV2_NAME: str = 'MOCA'
 CSV2_NUMERIC_FEAT1_NAME: str = 'AllFloat'
 CSV2_NUMERIC_FEAT1_VAL1: str = '200.2'
@@ -23,7 +27,6 @@ CSV2_NUMERIC_FEAT1_VAL2: str = '42.0'
 CSV2_NUMERIC_FEAT2_NAME: str = 'IntFloat'
 CSV2_NUMERIC_FEAT2_VAL1: str = '16'
 CSV2_NUMERIC_FEAT2_VAL2: str = '15.75'
-CSV2_FEAT3_NAME: str = 'AllNaNs'
 CSV3_NAME: str = 'adas'
 CSV3_NOMINAL_FEAT1_NAME: str = 'mAy'
 CSV3_NOMINAL_FEAT1_VAL1: str = '11.1'
@@ -38,21 +41,35 @@ CSV3_NUMERIC_FEAT2_NAME: str = 'IntNaNs'
 CSV3_NUMERIC_FEAT2_VAL1: str = '42'
 CSV3_NUMERIC_FEAT2_VAL2: str = '24'
 DIR1_NAME: str = 'nUMeric'
-DIR2_NAME: str = 'nUmeric.gz.Nominal'
-DIR2A_NAME: str = 'data'
 DIR2A1_NAME: str = 'CSV'
-DIR3_NAME: str = 'nomINAL'
+DIR2A_NAME: str = 'data'
+DIR2_NAME: str = 'nUmeric.gz.Nominal'
 DIR3A_NAME: str = 'txt'
+DIR3_NAME: str = 'nomINAL'
 EMPTY_DIR_NAME: str = 'emptyDir'
+FILTERED_NAME: str = 'filtered'
 GZ_COMPRESS_COMMAND: str = 'gzip {}'
+INDEX_NAME: str = 'index.sqlite'
+JSONL_NAME: str = 'results.jsonl'
+LOOP_LINK_NAME: str = 'loop'
+METRICS_NAME: str = 'metrics.jsonl'
+OUTPUT_NAME: str = 'output.txt'
+PARQUET_NAME: str = 'results.parquet'
+PSTATS_NAME: str = 'profile.pstats'
+READ_BYTES_OPT: str = 'rb'
 REMOVE_COMMAND: str = 'rm -r {}'
+SOCKET_NAME: str = 'inspect.sock'
 SPACE: str = ' '
+STORED_NAME: str = 'stored'
+STORED_ZIP_COMPRESS_COMMAND: str = 'zip -0 {}.zip {} > /dev/null'
 TAR_COMPRESS_COMMAND: str = 'tar -cf {}.tar {}'
 TEST_DATA_PATH: str = 'test_data'
 TGZ_COMPRESS_COMMAND: str = 'tar -czf {}.tgz {}'
-TXT_EXTENSION: str = '.txt'
+TRUNCATED_CSV_BYTES: int = 15
+TRUNCATED_CSV_NAME: str = 'truncated.csv'
 TXT1_NAME: str = '.zip.tar.gz.moca'
 TXT2_NAME: str = 'ADAS'
+TXT_EXTENSION: str = '.txt'
 UNREADABLE_CSV_LINE1: str = \
     '''1,1,4,1,b,2,,1,2,3,,,,5,d,
     1,1,7,1,b,2,,1,2,3,,,,1,
@@ -61,6 +78,7 @@ UNREADABLE_CSV_LINE1: str = \
 UNREADABLE_CSV_LINE2: bytes = b'\x96'
 UNREADABLE_CSV_NAME1: str = 'unreadable1.csv'
 UNREADABLE_CSV_NAME2: str = 'unreadable2.csv'
-WRITE_OPT: str = 'w'
+UNREADABLE_DIR_NAME: str = 'unreadableDir'
 WRITE_BYTES_OPT: str = 'wb'
+WRITE_OPT: str = 'w'
 ZIP_COMPRESS_COMMAND: str = 'zip {}.zip {} > /dev/null'
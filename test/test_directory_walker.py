@@ -0,0 +1,52 @@
+"""Module containing the directory walker test case class"""
+
+from os import chmod, mkdir, symlink, walk
+from os.path import join, relpath
+from unittest import TestCase
+
+from handler.directory_walker import DirectoryWalker
+from strings.test_data import (
+    DIR3_NAME, DIR3A_NAME, LOOP_LINK_NAME, TEST_DATA_PATH, TXT2_NAME, UNREADABLE_DIR_NAME, WRITE_OPT
+)
+from test.utils import TestDataCreator
+
+
+class TestDirectoryWalker(TestCase):
+    """Contains a test for the directory walker"""
+
+    def test_iter(self):
+        """
+        Tests that the directory walker yields every file exactly once, even with a symbolic link loop, and skips the
+        directories that cannot be listed like os.walk does
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        # Link a subdirectory back to the root of the test data, which would be walked forever if it were followed
+        loop_link_path: str = join(TEST_DATA_PATH, DIR3_NAME, DIR3A_NAME, LOOP_LINK_NAME)
+        symlink(relpath(TEST_DATA_PATH, join(TEST_DATA_PATH, DIR3_NAME, DIR3A_NAME)), loop_link_path)
+
+        # Take away the permissions of a directory, which only keeps a user other than root from listing it
+        unreadable_dir_path: str = join(TEST_DATA_PATH, UNREADABLE_DIR_NAME)
+        mkdir(unreadable_dir_path)
+        with open(join(unreadable_dir_path, TXT2_NAME), WRITE_OPT):
+            pass
+
+        chmod(unreadable_dir_path, 0o000)
+
+        expected_rel_paths: list = []
+        for root, _, files in walk(TEST_DATA_PATH):
+            for file in files:
+                expected_rel_paths.append(relpath(join(root, file), TEST_DATA_PATH))
+
+        actual_rel_paths: list = []
+        for root, file_path, rel_path in DirectoryWalker(dir_path=TEST_DATA_PATH):
+            self.assertEqual(file_path, join(TEST_DATA_PATH, rel_path))
+            self.assertTrue(file_path.startswith(root))
+            actual_rel_paths.append(rel_path)
+
+        self.assertEqual(sorted(actual_rel_paths), sorted(expected_rel_paths))
+
+        chmod(unreadable_dir_path, 0o755)
+        creator.destroy_test_data()
@@ -1,10 +1,28 @@
 """Module containing the extract handler test case class"""
 
-from os.path import isdir, isfile
+from gzip import open as open_gz
+from json import dumps
+from os import mkdir
+from os.path import isdir, isfile, join
 from unittest import TestCase
+from unittest.mock import patch
+from zipfile import ZipFile
 
+from handler.extract_handler import ExtractHandler
 from handler.master_handler import MasterHandler
-from strings.args import EXTRACT_HANDLER_NAME
+from strings.args import (
+    BACKEND_ARG, EXTRACT_HANDLER_NAME, ONLY_ARG, PROCESS_BACKEND, PROFILE_ARG, TEST_ONLY_GLOB, TEST_WORKERS,
+    WORKERS_ARG
+)
+from strings.extract_handler import (
+    GZ_EXTENSION, IN_PROGRESS_STATE, JOURNAL_FILE_NAME, JOURNAL_LINE, JOURNAL_PATH_KEY, JOURNAL_STATE_KEY,
+    PARTIAL_SUFFIX, TAR_EXTENSION, ZIP_EXTENSION
+)
+from strings.general import CSV_EXTENSION
+from strings.test_data import (
+    CORRUPT_ZIP_LINE, CORRUPT_ZIP_NAME, CSV1_NAME, DIR3A_NAME, DIR3_NAME, FILTERED_NAME, READ_BYTES_OPT, TEST_DATA_PATH,
+    TXT2_NAME, TXT_EXTENSION, WRITE_BYTES_OPT, WRITE_OPT
+)
 from test.utils import TestDataCreator, get_master_handler
 
 
@@ -15,13 +33,149 @@ class TestExtractHandler(TestCase):
         """Tests that the extract handler properly extracts all the compressed files and directories in the test data"""
 
         creator: TestDataCreator = TestDataCreator()
+
+        # Test extracting every file one compressed file at a time and with parallel thread and process workers, which
+        # are profiled as well
+        only_args: list = [ONLY_ARG, TEST_ONLY_GLOB]
+        parallel_args: list = only_args + [WORKERS_ARG, TEST_WORKERS]
+        for extra_args in [only_args, parallel_args, parallel_args + [BACKEND_ARG, PROCESS_BACKEND, PROFILE_ARG]]:
+            creator.create_test_data(compress=True)
+            test_data_paths: set = creator.get_test_data_paths()
+
+            master_handler: MasterHandler = get_master_handler(handler_type=EXTRACT_HANDLER_NAME, extra_args=extra_args)
+            master_handler.handle()
+
+            self._verify_test_data(test_data_paths)
+
+        # Test that a compressed file which cannot be extracted is kept rather than stopping the extraction
+        corrupt_zip_path: str = join(TEST_DATA_PATH, CORRUPT_ZIP_NAME)
+        with open(corrupt_zip_path, WRITE_OPT) as f:
+            f.write(CORRUPT_ZIP_LINE)
+
+        master_handler: MasterHandler = get_master_handler(handler_type=EXTRACT_HANDLER_NAME, extra_args=only_args)
+        master_handler.handle()
+
+        self.assertTrue(isfile(corrupt_zip_path))
+        self._verify_test_data(test_data_paths)
+
+        # Test that only the CSVs are extracted by default, including those inside nested and compressed files
         creator.create_test_data(compress=True)
         test_data_paths: set = creator.get_test_data_paths()
 
         master_handler: MasterHandler = get_master_handler(handler_type=EXTRACT_HANDLER_NAME)
         master_handler.handle()
 
+        for path in test_data_paths:
+            if path.endswith(CSV_EXTENSION):
+                self.assertTrue(isfile(path))
+            elif path.endswith(TXT_EXTENSION):
+                self.assertFalse(TestExtractHandler._path_exists(path=path))
+
+        creator.destroy_test_data()
+
+    def test_resume(self):
+        """Tests that the extract handler resumes a run that was interrupted while extracting a compressed file"""
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=True)
+        test_data_paths: set = creator.get_test_data_paths()
+
+        # Leave behind the journal and partial extraction of a run that was interrupted while extracting a tar file
+        journal_path: str = join(TEST_DATA_PATH, JOURNAL_FILE_NAME)
+        with open(journal_path, WRITE_OPT) as f:
+            f.write(JOURNAL_LINE.format(
+                dumps({JOURNAL_PATH_KEY: DIR3_NAME + TAR_EXTENSION, JOURNAL_STATE_KEY: IN_PROGRESS_STATE})
+            ))
+
+        partial_path: str = join(TEST_DATA_PATH, DIR3_NAME + PARTIAL_SUFFIX)
+        mkdir(partial_path)
+        with open(join(partial_path, TXT2_NAME + TXT_EXTENSION), WRITE_OPT) as f:
+            f.write(CORRUPT_ZIP_LINE)
+
+        # A directory of the user whose name merely ends like a partial extraction is extracted like any other
+        user_dir_path: str = join(TEST_DATA_PATH, CSV1_NAME + PARTIAL_SUFFIX)
+        user_csv_path: str = join(user_dir_path, CSV1_NAME + CSV_EXTENSION)
+        mkdir(user_dir_path)
+        with open_gz(user_csv_path + GZ_EXTENSION, WRITE_BYTES_OPT) as f:
+            f.write(CORRUPT_ZIP_LINE.encode())
+
+        master_handler: MasterHandler = get_master_handler(
+            handler_type=EXTRACT_HANDLER_NAME, extra_args=[ONLY_ARG, TEST_ONLY_GLOB]
+        )
+        master_handler.handle()
+
+        self._verify_test_data(test_data_paths)
+        self.assertFalse(isdir(partial_path))
+        self.assertFalse(isfile(journal_path))
+        self.assertTrue(isfile(user_csv_path))
+        self.assertFalse(isfile(user_csv_path + GZ_EXTENSION))
+
+        creator.destroy_test_data()
+
+    def test_filtered_archive(self):
+        """
+        Tests that the extract handler keeps a zip file whose files were not all selected, so that the files which were
+        not extracted are not lost, and that running it again does not extract the zip file twice
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        # The zip file holds a CSV, which is extracted by default, and a text file, which is not
+        zip_path: str = join(TEST_DATA_PATH, FILTERED_NAME + ZIP_EXTENSION)
+        csv_name: str = join(DIR3A_NAME, CSV1_NAME + CSV_EXTENSION)
+        txt_name: str = join(DIR3A_NAME, TXT2_NAME + TXT_EXTENSION)
+        with ZipFile(zip_path, WRITE_OPT) as zip_file:
+            zip_file.writestr(csv_name, CORRUPT_ZIP_LINE)
+            zip_file.writestr(txt_name, CORRUPT_ZIP_LINE)
+
+        for _ in range(2):
+            master_handler: MasterHandler = get_master_handler(handler_type=EXTRACT_HANDLER_NAME)
+            master_handler.handle()
+
+            self.assertTrue(isfile(join(TEST_DATA_PATH, FILTERED_NAME, csv_name)))
+            self.assertFalse(TestExtractHandler._path_exists(path=join(TEST_DATA_PATH, FILTERED_NAME, txt_name)))
+
+            with ZipFile(zip_path) as zip_file:
+                self.assertEqual(sorted(zip_file.namelist()), sorted([csv_name, txt_name]))
+
+        creator.destroy_test_data()
+
+    def test_stored_members(self):
+        """
+        Tests that the extract handler copies out the files stored in zip and tar files without being compressed, which
+        the kernel copies on this platform
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+        contents: dict = TestExtractHandler._read_files(paths=creator.get_test_data_paths())
+
+        creator.store_test_data()
+        test_data_paths: set = creator.get_test_data_paths()
+
+        master_handler: MasterHandler = get_master_handler(
+            handler_type=EXTRACT_HANDLER_NAME, extra_args=[ONLY_ARG, TEST_ONLY_GLOB]
+        )
+
+        # Record whether each stored file was copied by the kernel rather than read through this process
+        copy_range: callable = ExtractHandler._copy_range
+        kernel_copied: list = []
+
+        def spy_copy_range(**kwargs) -> bool:
+            copied: bool = copy_range(**kwargs)
+            kernel_copied.append(copied)
+            return copied
+
+        with patch.object(ExtractHandler, ExtractHandler._copy_range.__name__, side_effect=spy_copy_range):
+            master_handler.handle()
+
         self._verify_test_data(test_data_paths)
+        self.assertGreater(len(kernel_copied), 0)
+        self.assertTrue(all(kernel_copied))
+
+        stored_contents: dict = TestExtractHandler._read_files(paths=test_data_paths)
+        self.assertEqual(sorted(stored_contents.values()), sorted(contents.values()))
 
         creator.destroy_test_data()
 
@@ -36,6 +190,24 @@ class TestExtractHandler(TestCase):
             path_exists: bool = TestExtractHandler._path_exists(path=path)
             self.assertTrue(path_exists)
 
+    @staticmethod
+    def _read_files(paths: set) -> dict:
+        """
+        Reads the contents of the files among a collection of paths
+
+        @param paths: The paths to the files and directories
+        @return: The contents of each file mapped to by its path
+        """
+
+        contents: dict = {}
+
+        for path in paths:
+            if isfile(path):
+                with open(path, READ_BYTES_OPT) as f:
+                    contents[path] = f.read()
+
+        return contents
+
     @staticmethod
     def _path_exists(path: str) -> bool:
         """
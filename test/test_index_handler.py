@@ -0,0 +1,119 @@
+"""Module containing the index handler test case class"""
+
+from os import rename
+from os.path import join
+from unittest import TestCase
+
+from handler.index_handler.index_handler import IndexHandler
+from handler.index_handler.query_handler import QueryHandler
+from handler.master_handler import MasterHandler
+from strings.args import (
+    BACKEND_ARG, INCREMENTAL_ARG, INDEX_HANDLER_NAME, INDEX_PATH_ARG, KEY_WORDS_ARG, QUERY_HANDLER_NAME, TEST_KEY_WORD1,
+    TEST_KEY_WORD2, TEST_KEY_WORD3, TEST_KEY_WORD4, TEST_WORKERS, THREAD_BACKEND, VERBOSE_ARG, WORKERS_ARG
+)
+from strings.index_handler import ADDED_CHANGE, DELETED_CHANGE, MODIFIED_CHANGE
+from strings.test_data import INDEX_NAME, TEST_DATA_PATH, UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2
+from strings.test_inspect_handler import CSV_NOT_LOADED_LINE1, CSV_NOT_LOADED_LINE2
+from test import test_inspect_handler
+from test.utils import get_master_handler, TestDataCreator
+
+
+class TestIndexHandler(TestCase):
+    """Contains tests for the index and query handlers"""
+
+    def test_handle(self):
+        """Tests that querying the index outputs the same information as inspecting the test data"""
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        index_path: str = join(TEST_DATA_PATH, INDEX_NAME)
+        get_expected_output: callable = test_inspect_handler.TestInspectHandler._get_expected_output
+
+        # Test indexing the CSVs one at a time and with parallel workers
+        for options in [[], [WORKERS_ARG, TEST_WORKERS, BACKEND_ARG, THREAD_BACKEND]]:
+            self._run_index(index_path=index_path, options=options)
+
+            key_words: list = [TEST_KEY_WORD1, TEST_KEY_WORD2]
+            expected_output: list = get_expected_output(csv1=False, csv2=True, csv3=True)
+            self._run_query(key_words=key_words, expected_output=expected_output, index_path=index_path)
+
+            key_words: list = [TEST_KEY_WORD3]
+            expected_output: list = get_expected_output(csv1=True, csv2=False, csv3=True)
+            self._run_query(key_words=key_words, expected_output=expected_output, index_path=index_path)
+
+            key_words: list = [TEST_KEY_WORD4]
+            expected_output: list = get_expected_output(csv1=False, csv2=False, csv3=False)
+            self._run_query(key_words=key_words, expected_output=expected_output, index_path=index_path)
+
+            key_words: list = [TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3]
+            expected_output: list = get_expected_output(csv1=True, csv2=True, csv3=True, verbose=False)
+            self._run_query(key_words=key_words, expected_output=expected_output, index_path=index_path, verbose=False)
+
+            for unreadable_csv_name, csv_not_loaded_line in [
+                (UNREADABLE_CSV_NAME1, CSV_NOT_LOADED_LINE1), (UNREADABLE_CSV_NAME2, CSV_NOT_LOADED_LINE2)
+            ]:
+                expected_output: list = [unreadable_csv_name, csv_not_loaded_line]
+                self._run_query(key_words=[unreadable_csv_name], expected_output=expected_output, index_path=index_path)
+
+        # Test that incrementally indexing unchanged CSVs does not change anything
+        self._run_index(index_path=index_path, options=[INCREMENTAL_ARG])
+        self.assertEqual(IndexHandler._changes, {ADDED_CHANGE: [], MODIFIED_CHANGE: [], DELETED_CHANGE: []})
+        self.assertEqual(IndexHandler._n_unchanged, 5)
+
+        # Test that incrementally indexing finds a modified CSV and a deleted CSV
+        rename(join(TEST_DATA_PATH, UNREADABLE_CSV_NAME2), join(TEST_DATA_PATH, UNREADABLE_CSV_NAME1))
+        self._run_index(index_path=index_path, options=[INCREMENTAL_ARG])
+        self.assertEqual(
+            IndexHandler._changes,
+            {ADDED_CHANGE: [], MODIFIED_CHANGE: [UNREADABLE_CSV_NAME1], DELETED_CHANGE: [UNREADABLE_CSV_NAME2]}
+        )
+        self.assertEqual(IndexHandler._n_unchanged, 3)
+
+        expected_output: list = [UNREADABLE_CSV_NAME1, CSV_NOT_LOADED_LINE2]
+        self._run_query(key_words=[UNREADABLE_CSV_NAME1], expected_output=expected_output, index_path=index_path)
+        expected_output: list = get_expected_output(csv1=False, csv2=False, csv3=False)
+        self._run_query(key_words=[UNREADABLE_CSV_NAME2], expected_output=expected_output, index_path=index_path)
+
+        creator.destroy_test_data()
+
+    @staticmethod
+    def _run_index(index_path: str, options: list):
+        """
+        Runs the index handler
+
+        @param index_path: The path to the index to build
+        @param options: Additional options and their values to pass to the index handler
+        """
+
+        # Reset the index handler
+        IndexHandler._changes = None
+        IndexHandler._n_unchanged = None
+
+        index_handler: MasterHandler = get_master_handler(
+            handler_type=INDEX_HANDLER_NAME, extra_args=[INDEX_PATH_ARG, index_path] + options
+        )
+        index_handler.handle()
+
+    def _run_query(self, key_words: list, expected_output: list, index_path: str, verbose: bool = True):
+        """
+        Runs the query handler and tests the output for a given list of key words
+
+        @param key_words: The key words for the query handler
+        @param expected_output: The output to check against
+        @param index_path: The path to the index to query
+        @param verbose: Whether to include additional CSV information beyond file paths and column names
+        """
+
+        # Reset the query handler
+        QueryHandler._csv_objects = None
+
+        argv: list = [INDEX_PATH_ARG, index_path, KEY_WORDS_ARG] + key_words
+        if verbose:
+            argv.append(VERBOSE_ARG)
+
+        query_handler: MasterHandler = get_master_handler(handler_type=QUERY_HANDLER_NAME, extra_args=argv)
+        query_handler.handle()
+
+        actual_output: list = QueryHandler._get_info(verbose=verbose)
+        self.assertEqual(actual_output, expected_output)
@@ -1,15 +1,30 @@
 """Module containing the inspect handler test case class"""
 
+from contextlib import redirect_stderr
+from gzip import compress
+from io import StringIO
+from os.path import isfile, join
 from unittest import TestCase
 from pandas.errors import ParserError
 
-from handler.inspect_handler.inspect_handler import InspectHandler
+from handler.inspect_handler.inspector import Inspector
+from handler.inspect_handler.summary_cache import SummaryCache
 from handler.master_handler import MasterHandler
-from strings.args import INSPECT_HANDLER_NAME, TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3, TEST_KEY_WORD4
+from strings.args import (
+    ARCHIVES_ARG, BACKEND_ARG, CACHE_HASH_ARG, CACHE_SIZE_ARG, CHUNK_ROWS_ARG, INSPECT_HANDLER_NAME, MEMORY_BUDGET_ARG,
+    PREFILTER_ARG, PROCESS_BACKEND, PROFILE_ARG, PROFILE_PSTATS_ARG, PROFILE_TOP_ARG, REBUILD_CACHE_ARG,
+    TEST_CHUNK_ROWS, TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3, TEST_KEY_WORD4, TEST_MEMORY_BUDGET,
+    TEST_NOT_POSITIVE_INTS, TEST_WORKERS, THREAD_BACKEND, WORKERS_ARG
+)
+from strings.extract_handler import GZ_EXTENSION
+from strings.general import EMPTY_STRING
 from strings.inspect_handler import INDENT, NO_OUTPUT_MSG
-from strings.test_data import UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2
+from strings.test_data import (
+    CACHE_NAME, PSTATS_NAME, TEST_DATA_PATH, TRUNCATED_CSV_BYTES, TRUNCATED_CSV_NAME, UNREADABLE_CSV_LINE1,
+    UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2, WRITE_BYTES_OPT
+)
 from strings.test_inspect_handler import *
-from test.utils import get_inspect_args, get_master_handler, TestDataCreator
+from test.utils import get_inspect_args, get_master_handler, get_output, TestDataCreator
 
 
 class TestInspectHandler(TestCase):
@@ -62,9 +77,106 @@ class TestInspectHandler(TestCase):
         expected_output: list = TestInspectHandler._get_expected_output(csv1=True, csv2=True, csv3=True, verbose=False)
         self._run_handler(key_words=key_words, expected_output=expected_output, verbose=False)
 
+        # Test reading the CSVs in chunks
+        expected_output: list = TestInspectHandler._get_expected_output(csv1=True, csv2=True, csv3=True)
+        self._run_handler(
+            key_words=key_words, expected_output=expected_output, options=[CHUNK_ROWS_ARG, TEST_CHUNK_ROWS]
+        )
+
+        # Test skipping CSVs that do not contain any of the key words in their raw bytes
+        self._run_handler(key_words=key_words, expected_output=expected_output, options=[PREFILTER_ARG])
+
+        # Test inspecting the CSVs in parallel with both process and thread workers
+        for backend in [PROCESS_BACKEND, THREAD_BACKEND]:
+            self._run_handler(
+                key_words=key_words, expected_output=expected_output,
+                options=[WORKERS_ARG, TEST_WORKERS, BACKEND_ARG, backend]
+            )
+
+        # Test that reading the CSVs in chunks of or with a number of workers that is not positive, or a cache size,
+        # memory budget or number of slowest files and columns to profile that is not positive, is refused
+        for arg in [CHUNK_ROWS_ARG, WORKERS_ARG, CACHE_SIZE_ARG, MEMORY_BUDGET_ARG, PROFILE_TOP_ARG]:
+            for value in TEST_NOT_POSITIVE_INTS:
+                with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+                    get_master_handler(
+                        handler_type=INSPECT_HANDLER_NAME,
+                        extra_args=get_inspect_args(key_words=key_words, options=[arg, value])
+                    )
+
+        # Test that profiling, with the profiles of the files recorded in the workers, leaves the output unchanged
+        pstats_path: str = join(TEST_DATA_PATH, PSTATS_NAME)
+        profile_options: list = [PROFILE_ARG, PROFILE_PSTATS_ARG, pstats_path]
+        self._run_handler(
+            key_words=key_words, expected_output=expected_output,
+            options=profile_options + [WORKERS_ARG, TEST_WORKERS, BACKEND_ARG, PROCESS_BACKEND]
+        )
+        self.assertTrue(isfile(pstats_path))
+
+        # Test inspecting the CSVs within a memory budget, one at a time and with workers waiting for room in it
+        budget_options: list = [MEMORY_BUDGET_ARG, TEST_MEMORY_BUDGET]
+        for options in [budget_options, budget_options + [WORKERS_ARG, TEST_WORKERS, BACKEND_ARG, THREAD_BACKEND]]:
+            self._run_handler(key_words=key_words, expected_output=expected_output, options=options)
+
+        # Test caching the CSV summaries, inspecting the CSVs from the cache, rebuilding the cache, and validating the
+        # cached summaries by the contents of the CSVs
+        cache_path: str = join(TEST_DATA_PATH, CACHE_NAME)
+        for options in [[], [], [REBUILD_CACHE_ARG], [CACHE_HASH_ARG], [CACHE_HASH_ARG]]:
+            self._run_handler(
+                key_words=key_words, expected_output=expected_output, options=options, cache_path=cache_path
+            )
+
+        # Test matching different key words against the cached CSV summaries
+        key_words: list = [TEST_KEY_WORD3]
+        expected_output: list = TestInspectHandler._get_expected_output(csv1=True, csv2=False, csv3=True)
+        self._run_handler(key_words=key_words, expected_output=expected_output, cache_path=cache_path)
+
+        # Test that the errors of unreadable csvs are cached as well
+        for _ in range(2):
+            self._test_unreadable_csv(
+                unreadable_csv_name=UNREADABLE_CSV_NAME2, csv_not_loaded_line=CSV_NOT_LOADED_LINE2,
+                error_type=UnicodeDecodeError, cache_path=cache_path
+            )
+
+        # Test inspecting the CSVs inside archives without extracting them, one at a time and with parallel workers
+        creator.create_test_data(compress=True)
+        key_words: list = [TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3]
+        expected_output: list = TestInspectHandler._get_expected_output(csv1=True, csv2=True, csv3=True)
+
+        for options in [
+            [ARCHIVES_ARG], [ARCHIVES_ARG, WORKERS_ARG, TEST_WORKERS, BACKEND_ARG, PROCESS_BACKEND],
+            [
+                ARCHIVES_ARG, MEMORY_BUDGET_ARG, TEST_MEMORY_BUDGET, WORKERS_ARG, TEST_WORKERS, BACKEND_ARG,
+                PROCESS_BACKEND
+            ]
+        ]:
+            self._run_handler(key_words=key_words, expected_output=expected_output, options=options)
+
+        # Test inspecting CSVs that are each compressed on their own without decompressing them, which cannot be
+        # prefiltered, with and without caching them and reading them in chunks
+        creator.create_test_data(compress=False)
+        creator.compress_csvs()
+
+        # A compressed csv that is truncated cannot be decompressed, which is reported like any other unreadable csv
+        # without stopping the others from being inspected
+        with open(join(TEST_DATA_PATH, TRUNCATED_CSV_NAME + GZ_EXTENSION), WRITE_BYTES_OPT) as f:
+            f.write(compress(UNREADABLE_CSV_LINE1.encode())[:TRUNCATED_CSV_BYTES])
+
+        for options in [None, [PREFILTER_ARG, CHUNK_ROWS_ARG, TEST_CHUNK_ROWS]]:
+            self._run_handler(key_words=key_words, expected_output=expected_output, options=options)
+
+        for _ in range(2):
+            self._run_handler(key_words=key_words, expected_output=expected_output, cache_path=cache_path)
+
+        self._test_unreadable_csv(
+            unreadable_csv_name=TRUNCATED_CSV_NAME, csv_not_loaded_line=CSV_NOT_LOADED_LINE3, error_type=EOFError
+        )
+
         creator.destroy_test_data()
 
-    def _run_handler(self, key_words: list, expected_output: list, trailing_slash: bool = False, verbose: bool = True):
+    def _run_handler(
+        self, key_words: list, expected_output: list, trailing_slash: bool = False, verbose: bool = True,
+        options: list = None, cache_path: str = None
+    ):
         """
         Runs the inspect handler and tests the output for a given list of key words
 
@@ -72,21 +184,18 @@ class TestInspectHandler(TestCase):
         @param expected_output: The output to check against
         @param trailing_slash: Whether the test data directory path has a trailing slash at the end of it
         @param verbose: Whether to include additional CSV information beyond file paths and column names
+        @param options: Additional options and their values to pass to the inspect handler
+        @param cache_path: The path to the cache of csv summaries, or None to not cache them
         """
 
-        # Reset the inspect handler
-        InspectHandler._csv_objects = None
-        InspectHandler._key_words = None
-        InspectHandler._data_path = None
-
-        argv: list = get_inspect_args(key_words=key_words, verbose=verbose)
+        argv: list = get_inspect_args(key_words=key_words, verbose=verbose, options=options, cache_path=cache_path)
         master_handler: MasterHandler = get_master_handler(
             handler_type=INSPECT_HANDLER_NAME, extra_args=argv, trailing_slash=trailing_slash
         )
-        master_handler.handle()
 
-        actual_output: list = InspectHandler._get_info(verbose=verbose)
-        self.assertEqual(actual_output, expected_output)
+        # Some output lines span several lines of text, so the output is compared with the expected lines as printed
+        actual_output: str = get_output(master_handler=master_handler)
+        self.assertEqual(actual_output, EMPTY_STRING.join(PRINTED_LINE.format(line) for line in expected_output))
 
     @staticmethod
     def _get_expected_output(csv1: bool, csv2: bool, csv3: bool, verbose: bool = True) -> list:
@@ -164,17 +273,26 @@ class TestInspectHandler(TestCase):
             CSV3_LINE18, CSV3_LINE19
         ]
 
-    def _test_unreadable_csv(self, unreadable_csv_name: str, csv_not_loaded_line: str, error_type: type):
+    def _test_unreadable_csv(
+        self, unreadable_csv_name: str, csv_not_loaded_line: str, error_type: type, cache_path: str = None
+    ):
         """
         Tests attempting to read an unreadable csv
 
         @param unreadable_csv_name: The name of the unreadable csv file
         @param csv_not_loaded_line: The message that explains that the csv could not be read
         @param error_type: The type of error that resulted from not being able to read the csv
+        @param cache_path: The path to the cache of csv summaries, or None to not cache them
         """
 
         key_words: list = [unreadable_csv_name]
         expected_output: list = [unreadable_csv_name, csv_not_loaded_line]
-        self._run_handler(key_words=key_words, expected_output=expected_output)
-        e: Exception = InspectHandler._csv_objects[unreadable_csv_name]._read_error
+        self._run_handler(key_words=key_words, expected_output=expected_output, cache_path=cache_path)
+
+        cache: SummaryCache = None if cache_path is None else SummaryCache(cache_path=cache_path)
+        inspector: Inspector = Inspector(data_path=TEST_DATA_PATH, cache=cache)
+        e: Exception = inspector.match(key_words=key_words)[unreadable_csv_name]._read_error
         self.assertEqual(type(e), error_type)
+
+        if cache is not None:
+            cache.close()
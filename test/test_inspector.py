@@ -0,0 +1,157 @@
+"""Module containing the inspector test case class"""
+
+from bz2 import open as open_bz2
+from gzip import open as open_gz
+from os import remove
+from os.path import join
+from unittest import TestCase
+
+from handler.inspect_handler.csv_object import CSVObject
+from handler.inspect_handler.inspector import Inspector
+from handler.inspect_handler.summary_cache import SummaryCache
+from strings.args import TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3, TEST_KEY_WORD4, THREAD_BACKEND
+from strings.general import CSV_EXTENSION
+from strings.extract_handler import BZ2_EXTENSION, GZ_EXTENSION
+from strings.test_data import CACHE_NAME, CSV1_NAME, READ_BYTES_OPT, TEST_DATA_PATH, WRITE_BYTES_OPT, WRITE_OPT
+from test import test_inspect_handler
+from test.utils import TestDataCreator
+
+
+class TestInspector(TestCase):
+    """Contains tests for the inspector"""
+
+    def test_inspect(self):
+        """
+        Tests that an inspector answers repeated queries with the same output as the inspect handler from the
+        summaries it keeps warm, only reading the csv files that changed between them
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+        get_expected_output: callable = test_inspect_handler.TestInspectHandler._get_expected_output
+
+        for workers in [1, 2]:
+            inspector: Inspector = Inspector(data_path=TEST_DATA_PATH, workers=workers, backend=THREAD_BACKEND)
+
+            # Test queries with different key words, including one that requires reading every csv file
+            key_words: list = [TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3]
+            self.assertEqual(
+                inspector.inspect(key_words=key_words, verbose=True),
+                get_expected_output(csv1=True, csv2=True, csv3=True)
+            )
+            csv_objects: dict = inspector.match(key_words=key_words)
+
+            self.assertEqual(
+                inspector.inspect(key_words=[TEST_KEY_WORD3], verbose=True),
+                get_expected_output(csv1=True, csv2=False, csv3=True)
+            )
+            self.assertEqual(
+                inspector.inspect(key_words=[TEST_KEY_WORD1, TEST_KEY_WORD2], verbose=False),
+                get_expected_output(csv1=False, csv2=True, csv3=True, verbose=False)
+            )
+
+            # Test that the summaries are kept warm rather than read again
+            warm_csv_objects: dict = inspector.match(key_words=key_words)
+            for rel_path, csv_obj in csv_objects.items():
+                self.assertIs(warm_csv_objects[rel_path], csv_obj)
+
+        # Test that a removed csv file is forgotten and that a csv file added or modified in its place is read again
+        csv1_path: str = join(TEST_DATA_PATH, CSV1_NAME + CSV_EXTENSION)
+        csv1_rel_path: str = CSV1_NAME + CSV_EXTENSION
+        with open(csv1_path) as f:
+            csv1: str = f.read()
+
+        remove(csv1_path)
+        inspector.refresh()
+        self.assertNotIn(csv1_rel_path, inspector.match(key_words=key_words))
+
+        with open(csv1_path, WRITE_OPT) as f:
+            f.write(csv1)
+
+        inspector.refresh()
+        self.assertEqual(
+            inspector.inspect(key_words=key_words, verbose=True), get_expected_output(csv1=True, csv2=True, csv3=True)
+        )
+        self.assertIsNot(inspector.match(key_words=key_words)[csv1_rel_path], csv_objects[csv1_rel_path])
+
+        creator.destroy_test_data()
+
+    def test_stages(self):
+        """
+        Tests that an inspector that does not keep summaries warm only reads the header of a csv file matched by its
+        path unless asked to summarize the relevant csv files, and that its output without verbosity needs no more
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        inspector: Inspector = Inspector(data_path=TEST_DATA_PATH, keep_warm=False)
+        csv1_rel_path: str = CSV1_NAME + CSV_EXTENSION
+
+        csv_obj: CSVObject = inspector.match(key_words=[CSV1_NAME], summarize_relevant=False)[csv1_rel_path]
+        self.assertIsNone(csv_obj._col_names)
+        self.assertIsNone(csv_obj._csv_cols)
+
+        csv_obj.get_info(verbose=False)
+        self.assertIsNotNone(csv_obj._col_names)
+        self.assertIsNone(csv_obj._csv_cols)
+
+        csv_obj: CSVObject = inspector.match(key_words=[CSV1_NAME])[csv1_rel_path]
+        self.assertIsNotNone(csv_obj._csv_cols)
+
+        creator.destroy_test_data()
+
+    def test_compressed_paths(self):
+        """
+        Tests that a csv file compressed on its own is matched under the path it would have once decompressed, unless
+        another compressed file would decompress to the same path
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        inspector: Inspector = Inspector(data_path=TEST_DATA_PATH, keep_warm=False)
+        csv1_rel_path: str = CSV1_NAME + CSV_EXTENSION
+        csv1_path: str = join(TEST_DATA_PATH, csv1_rel_path)
+
+        with open(csv1_path, READ_BYTES_OPT) as csv_file:
+            csv1_bytes: bytes = csv_file.read()
+
+        for extension, open_compressed in [(GZ_EXTENSION, open_gz), (BZ2_EXTENSION, open_bz2)]:
+            with open_compressed(csv1_path + extension, WRITE_BYTES_OPT) as compressed_file:
+                compressed_file.write(csv1_bytes)
+
+        remove(csv1_path)
+        csv_objects: dict = inspector.match(key_words=[CSV1_NAME])
+        self.assertIn(csv1_rel_path + GZ_EXTENSION, csv_objects)
+        self.assertIn(csv1_rel_path + BZ2_EXTENSION, csv_objects)
+        self.assertNotIn(csv1_rel_path, csv_objects)
+
+        remove(csv1_path + BZ2_EXTENSION)
+        csv_objects: dict = inspector.match(key_words=[CSV1_NAME])
+        self.assertIn(csv1_rel_path, csv_objects)
+        self.assertNotIn(csv1_rel_path + GZ_EXTENSION, csv_objects)
+
+        creator.destroy_test_data()
+
+    def test_prefiltered_cache(self):
+        """
+        Tests that an inspector that both prefilters and caches the csv files matches the same csv files as one that
+        does neither, without holding on to the csv files that the prefilter rejected before they were read
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        key_words: list = [TEST_KEY_WORD1, TEST_KEY_WORD4]
+        expected_rel_paths: set = set(Inspector(data_path=TEST_DATA_PATH).match(key_words=key_words).keys())
+
+        cache: SummaryCache = SummaryCache(cache_path=join(TEST_DATA_PATH, CACHE_NAME))
+        inspector: Inspector = Inspector(data_path=TEST_DATA_PATH, prefilter=True, cache=cache, keep_warm=False)
+
+        for _ in range(2):
+            self.assertEqual(set(inspector.match(key_words=key_words).keys()), expected_rel_paths)
+            self.assertEqual(cache._pending_entries, {})
+
+        cache.close()
+        creator.destroy_test_data()
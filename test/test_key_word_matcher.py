@@ -0,0 +1,38 @@
+"""Module containing the key word matcher test case class"""
+
+from unittest import TestCase
+
+from handler.inspect_handler.key_word_matcher import KeyWordMatcher
+from strings.args import TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3
+from strings.general import NAN
+from strings.inspect_handler import MATCH_SEPARATOR, NUMERIC_TYPE_KEY, UNNAMED_COL_PREFIX
+from strings.test_data import CSV1_NOMINAL_FEAT1_VAL3, CSV1_NUMERIC_FEAT_VAL1, CSV3_NOMINAL_FEAT1_NAME, DIR2_NAME
+
+
+class TestKeyWordMatcher(TestCase):
+    """Contains tests for the key word matcher"""
+
+    def test_search(self):
+        """Tests that the key word matcher finds which key word matched, regardless of case"""
+
+        matcher: KeyWordMatcher = KeyWordMatcher(key_words=[TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3])
+
+        self.assertEqual(matcher.search(potential_matches=[CSV3_NOMINAL_FEAT1_NAME]), TEST_KEY_WORD3)
+        self.assertEqual(matcher.search(potential_matches=[CSV1_NOMINAL_FEAT1_VAL3]), TEST_KEY_WORD3)
+        self.assertTrue(matcher.search(potential_matches=[DIR2_NAME]) in {TEST_KEY_WORD1, TEST_KEY_WORD2})
+        self.assertIsNone(matcher.search(potential_matches=[]))
+
+        # A key word is not matched across two different strings
+        self.assertFalse(matcher.matches(potential_matches=[TEST_KEY_WORD3[:1], TEST_KEY_WORD3[1:]]))
+
+        # Nor is a key word containing the character joining the strings, which could otherwise match across them
+        with self.assertRaises(ValueError):
+            KeyWordMatcher(key_words=[TEST_KEY_WORD1, TEST_KEY_WORD3[:1] + MATCH_SEPARATOR + TEST_KEY_WORD3[1:]])
+
+    def test_can_prefilter(self):
+        """Tests that files are only prefiltered when the key words cannot match strings that were not in the file"""
+
+        self.assertTrue(KeyWordMatcher(key_words=[TEST_KEY_WORD1, TEST_KEY_WORD2]).can_prefilter())
+
+        for made_up_str in [NAN, NUMERIC_TYPE_KEY, UNNAMED_COL_PREFIX + CSV1_NUMERIC_FEAT_VAL1]:
+            self.assertFalse(KeyWordMatcher(key_words=[TEST_KEY_WORD1, made_up_str]).can_prefilter())
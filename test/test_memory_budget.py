@@ -0,0 +1,81 @@
+"""Module containing the memory budget test case class"""
+
+from concurrent.futures import ThreadPoolExecutor
+from shutil import rmtree
+from unittest import TestCase
+
+from pandas import read_csv
+
+from benchmarks.data_generator import SyntheticDataGenerator
+from handler.inspect_handler.csv_object import CSVObject
+from handler.inspect_handler.memory_budget import MemoryBudget
+from handler.utils import get_csv_paths
+from strings.test_data import TEST_DATA_PATH
+
+
+class TestMemoryBudget(TestCase):
+    """Contains tests for the memory budget"""
+
+    def test_plan(self):
+        """
+        Tests that the memory of parsing a csv that is larger than its sample is estimated closely enough to read it
+        in chunks that fit in a budget it would not fit in whole, and that the budget makes room for one csv at a time
+        """
+
+        generator: SyntheticDataGenerator = SyntheticDataGenerator(
+            n_dirs=1, depth=1, n_files=1, n_rows=50000, n_cols=8, cardinality=5, nominal_fraction=0.5,
+            archive_levels=0, n_unreadable=0, seed=0
+        )
+        generator.generate(data_path=TEST_DATA_PATH)
+        csv_paths: tuple = next(get_csv_paths(data_path=TEST_DATA_PATH))
+        csv_path, _ = csv_paths
+
+        footprint, row_footprint = CSVObject.estimate_footprint(csv_path=csv_path)
+        actual_footprint: int = read_csv(csv_path).memory_usage(deep=True).sum() * CSVObject.PARSE_OVERHEAD
+        self.assertGreater(footprint, actual_footprint / 2)
+        self.assertLess(footprint, actual_footprint * 2)
+
+        memory_budget: MemoryBudget = MemoryBudget(max_bytes=footprint // 4)
+        planned_footprint, chunk_rows = memory_budget.plan(csv_paths=csv_paths, chunk_rows=None)
+        self.assertIsNotNone(chunk_rows)
+        self.assertLessEqual(planned_footprint, memory_budget.get_max_bytes())
+        self.assertEqual(planned_footprint, chunk_rows * row_footprint)
+
+        # A csv that fits in the budget is read all at once
+        self.assertEqual(
+            MemoryBudget(max_bytes=footprint).plan(csv_paths=csv_paths, chunk_rows=None), (footprint, None)
+        )
+
+        self.assertTrue(memory_budget.reserve(footprint=planned_footprint))
+        self.assertFalse(memory_budget.reserve(footprint=planned_footprint))
+        self.assertTrue(memory_budget.reserve(footprint=planned_footprint, force=True))
+        memory_budget.release(footprint=planned_footprint)
+        memory_budget.release(footprint=planned_footprint)
+        self.assertTrue(memory_budget.reserve(footprint=planned_footprint))
+        memory_budget.release(footprint=planned_footprint)
+
+        rmtree(TEST_DATA_PATH)
+
+    def test_threads(self):
+        """Tests that the budget never lets threads sharing it reserve more than it has between them"""
+
+        n_threads: int = 8
+        memory_budget: MemoryBudget = MemoryBudget(max_bytes=n_threads // 2)
+
+        def reserve_and_release() -> int:
+            n_reserved: int = 0
+
+            for _ in range(10000):
+                if memory_budget.reserve(footprint=1):
+                    n_reserved += 1
+                    self.assertLessEqual(memory_budget._reserved_bytes, memory_budget.get_max_bytes())
+                    memory_budget.release(footprint=1)
+
+            return n_reserved
+
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            n_reserved: list = list(executor.map(lambda _: reserve_and_release(), range(n_threads)))
+
+        self.assertGreater(sum(n_reserved), 0)
+        self.assertTrue(memory_budget.reserve(footprint=memory_budget.get_max_bytes()))
+        memory_budget.release(footprint=memory_budget.get_max_bytes())
@@ -0,0 +1,62 @@
+"""Module containing the profiler test case class"""
+
+from unittest import TestCase
+
+from handler.profiler import FileProfile, Profiler
+from strings.profiler import (
+    INSPECT_STAGE, MATCH_SECTION, PROFILE_HEADER, READ_SECTION, SLOWEST_COLUMNS_LINE, SLOWEST_FILES_LINE
+)
+
+
+class TestProfiler(TestCase):
+    """Contains tests for the profiler"""
+
+    def test_get_report(self):
+        """Tests that the report covers the stages, the sections, the slowest files and the slowest columns"""
+
+        profiler: Profiler = Profiler(enabled=True, top=1)
+
+        with profiler.stage(name=INSPECT_STAGE):
+            for rel_path, n_rows in [('fast.csv', 1), ('slow.csv', 100000)]:
+                file_profile: FileProfile = FileProfile(rel_path=rel_path, n_bytes=n_rows)
+
+                with file_profile.record():
+                    with FileProfile.section(name=READ_SECTION):
+                        FileProfile.add_rows(n_rows=n_rows)
+
+                    with FileProfile.column(col_name=rel_path.upper()):
+                        sum(range(n_rows))
+
+                    for _ in FileProfile.time_iterator(name=MATCH_SECTION, iterator=range(n_rows)):
+                        pass
+
+                profiler.add_file(file_profile=file_profile)
+
+        report: list = profiler.get_report()
+        self.assertEqual(report[0], PROFILE_HEADER)
+        self.assertTrue(any(INSPECT_STAGE in line for line in report))
+        self.assertTrue(any(READ_SECTION in line for line in report))
+        self.assertTrue(any(MATCH_SECTION in line for line in report))
+
+        # Only the slowest file and column are reported
+        file_lines: list = report[report.index(SLOWEST_FILES_LINE) + 1:report.index(SLOWEST_COLUMNS_LINE)]
+        self.assertEqual(len(file_lines), 1)
+        self.assertTrue(file_lines[0].strip().startswith('slow.csv'))
+        col_lines: list = report[report.index(SLOWEST_COLUMNS_LINE) + 1:]
+        self.assertEqual(len(col_lines), 1)
+        self.assertIn('SLOW.CSV', col_lines[0])
+
+    def test_disabled(self):
+        """Tests that a profiler that is not enabled records nothing, even when files are handled outside a profile"""
+
+        profiler: Profiler = Profiler(enabled=False)
+
+        with profiler.stage(name=INSPECT_STAGE), FileProfile.section(name=READ_SECTION):
+            FileProfile.add_rows(n_rows=1)
+
+        profiler.add_file(file_profile=FileProfile(rel_path='a.csv', n_bytes=1))
+
+        report: list = profiler.get_report()
+        self.assertFalse(any(INSPECT_STAGE in line for line in report))
+        self.assertNotIn(SLOWEST_COLUMNS_LINE, report)
+        self.assertEqual(report[report.index(SLOWEST_FILES_LINE) + 1:], [])
@@ -0,0 +1,130 @@
+"""Module containing the result writer test case class"""
+
+from importlib.util import find_spec
+from json import loads
+from os.path import join
+from unittest import skipUnless, TestCase
+
+from handler.inspect_handler.inspector import Inspector
+from handler.master_handler import MasterHandler
+from strings.args import FORMAT_ARG, INSPECT_HANDLER_NAME, OUTPUT_ARG, TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3
+from strings.general import NAN
+from strings.inspect_handler import (
+    CLASSES_FIELD, COLUMNS_FIELD, ERROR_FIELD, INDENT, MAPPING_SYMBOL, MAX_FIELD, MAX_KEY, MEAN_FIELD, MEAN_KEY,
+    MIN_FIELD, MIN_KEY, NAME_FIELD, NUMERIC_TYPE, PATH_FIELD, RANGE_FIELD, RANGE_KEY, STD_FIELD, STD_KEY, TYPE_FIELD
+)
+from strings.result_writer import JSONL_FORMAT, PARQUET_FORMAT
+from strings.test_data import JSONL_NAME, PARQUET_NAME, TEST_DATA_PATH, UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2
+from test.utils import get_inspect_args, get_master_handler, TestDataCreator
+
+
+class TestResultWriter(TestCase):
+    """Contains tests for writing the results of inspecting in the machine readable formats"""
+
+    # The key words match every kind of column as well as the unreadable csv files
+    KEY_WORDS: list = [TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3, UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2]
+
+    def test_jsonl(self):
+        """Tests that the json lines have a record of each relevant csv file with the same information as the text"""
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        csv_objects: dict = Inspector(data_path=TEST_DATA_PATH).match(key_words=TestResultWriter.KEY_WORDS)
+
+        jsonl_path: str = join(TEST_DATA_PATH, JSONL_NAME)
+        TestResultWriter._inspect(options=[FORMAT_ARG, JSONL_FORMAT, OUTPUT_ARG, jsonl_path])
+
+        with open(jsonl_path) as f:
+            records: dict = {record[PATH_FIELD]: record for record in map(loads, f)}
+
+        self.assertEqual(set(records.keys()), set(csv_objects.keys()))
+
+        # Only the unreadable csv files have errors, and the others have the same lines as the text
+        for rel_path, record in records.items():
+            if rel_path in {UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2}:
+                self.assertIsNotNone(record[ERROR_FIELD])
+                self.assertEqual(record[COLUMNS_FIELD], [])
+            else:
+                self.assertIsNone(record[ERROR_FIELD])
+                self.assertEqual(
+                    TestResultWriter._get_lines(record=record), csv_objects[rel_path].get_info(verbose=True)
+                )
+
+        creator.destroy_test_data()
+
+    @skipUnless(find_spec('pyarrow') is not None, 'pyarrow is not installed')
+    def test_parquet(self):
+        """Tests that the parquet file has the same records as the json lines"""
+
+        from pyarrow.parquet import read_table
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        jsonl_path: str = join(TEST_DATA_PATH, JSONL_NAME)
+        parquet_path: str = join(TEST_DATA_PATH, PARQUET_NAME)
+        TestResultWriter._inspect(options=[FORMAT_ARG, JSONL_FORMAT, OUTPUT_ARG, jsonl_path])
+        TestResultWriter._inspect(options=[FORMAT_ARG, PARQUET_FORMAT, OUTPUT_ARG, parquet_path])
+
+        with open(jsonl_path) as f:
+            records: dict = {record[PATH_FIELD]: record for record in map(loads, f)}
+
+        rows: list = read_table(parquet_path).to_pylist()
+        self.assertEqual(len(rows), len(records))
+
+        for row in rows:
+            record: dict = records[row[PATH_FIELD]]
+            self.assertEqual(row[ERROR_FIELD], record[ERROR_FIELD])
+            self.assertEqual(len(row[COLUMNS_FIELD]), len(record[COLUMNS_FIELD]))
+
+            for col_row, col_record in zip(row[COLUMNS_FIELD], record[COLUMNS_FIELD]):
+                # The parquet file has every field for every column, with the class counts as pairs
+                classes: list = col_row.pop(CLASSES_FIELD)
+                if classes is not None:
+                    col_row[CLASSES_FIELD] = dict(classes)
+
+                self.assertEqual({field: val for field, val in col_row.items() if val is not None}, {
+                    field: val for field, val in col_record.items() if val is not None
+                })
+
+        creator.destroy_test_data()
+
+    @staticmethod
+    def _inspect(options: list):
+        """
+        Runs the inspect handler on the test data
+
+        @param options: Additional options and their values to pass to the inspect handler
+        """
+
+        argv: list = get_inspect_args(key_words=TestResultWriter.KEY_WORDS, verbose=True, options=options)
+        master_handler: MasterHandler = get_master_handler(handler_type=INSPECT_HANDLER_NAME, extra_args=argv)
+        master_handler.handle()
+
+    @staticmethod
+    def _get_lines(record: dict) -> list:
+        """
+        Creates the lines of the verbose text output of a csv file from its record
+
+        @param record: The record
+        @return: The lines
+        """
+
+        lines: list = []
+
+        for col_record in record[COLUMNS_FIELD]:
+            lines.append(INDENT + col_record[NAME_FIELD])
+
+            if col_record[TYPE_FIELD] == NUMERIC_TYPE:
+                for key, field in [
+                    (MIN_KEY, MIN_FIELD), (MAX_KEY, MAX_FIELD), (RANGE_KEY, RANGE_FIELD), (MEAN_KEY, MEAN_FIELD),
+                    (STD_KEY, STD_FIELD)
+                ]:
+                    val: str = NAN if col_record[field] is None else str(col_record[field])
+                    lines.append(INDENT * 2 + key + MAPPING_SYMBOL + val)
+            else:
+                for clazz, class_count in col_record[CLASSES_FIELD].items():
+                    lines.append(INDENT * 2 + clazz + MAPPING_SYMBOL + str(class_count))
+
+        return lines
@@ -0,0 +1,53 @@
+"""Module containing the scan handler test case class"""
+
+from os.path import isfile, join
+from unittest import TestCase
+
+from handler.master_handler import MasterHandler
+from strings.args import (
+    EXTRACT_WORKERS_ARG, OUTPUT_ARG, SCAN_HANDLER_NAME, TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3, TEST_WORKERS,
+    WORKERS_ARG
+)
+from strings.general import CSV_EXTENSION
+from strings.test_data import OUTPUT_NAME, TEST_DATA_PATH
+from test import test_inspect_handler
+from test.utils import get_inspect_args, get_master_handler, TestDataCreator
+
+
+class TestScanHandler(TestCase):
+    """Contains a test for the scan handler"""
+
+    def test_handle(self):
+        """
+        Tests that the scan handler extracts the CSVs in the test data and outputs the same information about them as
+        the inspect handler does once they are extracted
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+
+        key_words: list = [TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3]
+        expected_output: list = test_inspect_handler.TestInspectHandler._get_expected_output(
+            csv1=True, csv2=True, csv3=True
+        )
+
+        # Test scanning one file at a time and with parallel workers for both extracting and inspecting
+        for options in [None, [WORKERS_ARG, TEST_WORKERS, EXTRACT_WORKERS_ARG, TEST_WORKERS]]:
+            creator.create_test_data(compress=True)
+            test_data_paths: set = creator.get_test_data_paths()
+
+            # The output of the inspection is written to a file to keep it apart from that of the extraction
+            output_path: str = join(TEST_DATA_PATH, OUTPUT_NAME)
+            argv: list = get_inspect_args(key_words=key_words, options=[OUTPUT_ARG, output_path] + (options or []))
+            master_handler: MasterHandler = get_master_handler(handler_type=SCAN_HANDLER_NAME, extra_args=argv)
+            master_handler.handle()
+
+            with open(output_path) as f:
+                actual_output: list = f.read().splitlines()
+
+            self.assertEqual(actual_output, expected_output)
+
+            for path in test_data_paths:
+                if path.endswith(CSV_EXTENSION):
+                    self.assertTrue(isfile(path))
+
+        creator.destroy_test_data()
@@ -0,0 +1,159 @@
+"""Module containing the serve handler test case class"""
+
+from concurrent.futures import ThreadPoolExecutor
+from os import rename, stat
+from os.path import exists, join
+from stat import S_IMODE
+from threading import Thread
+from unittest import TestCase
+
+from handler.inspect_handler.inspector import Inspector
+from handler.master_handler import MasterHandler
+from handler.serve_handler.inspect_client import InspectClient
+from handler.serve_handler.inspect_server import InspectServer
+from strings.args import (
+    CLIENT_HANDLER_NAME, KEY_WORDS_ARG, PORT_ARG, TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3, TEST_KEY_WORD4,
+    THREAD_BACKEND, VERBOSE_ARG
+)
+from strings.general import EMPTY_STRING
+from strings.inspect_handler import MATCH_SEPARATOR, PATH_FIELD
+from strings.serve_handler import RECORDS_FIELD
+from strings.test_data import SOCKET_NAME, TEST_DATA_PATH, UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2
+from strings.test_inspect_handler import CSV_NOT_LOADED_LINE2, PRINTED_LINE
+from test import test_inspect_handler
+from test.utils import get_output, TestDataCreator
+
+
+class TestServeHandler(TestCase):
+    """Contains tests for the serve and client handlers"""
+
+    def test_serve(self):
+        """
+        Tests that a server answers the same output as inspecting the test data to concurrent clients over localhost
+        and picks up the csv files that change while it is serving
+        """
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+        get_expected_output: callable = test_inspect_handler.TestInspectHandler._get_expected_output
+
+        server, server_thread = TestServeHandler._start_server(socket_path=None)
+        client: InspectClient = InspectClient(port=server.get_port())
+
+        # Test that concurrent clients with different key words get the same output as the inspect handler
+        queries: list = [
+            ([TEST_KEY_WORD1, TEST_KEY_WORD2], True, get_expected_output(csv1=False, csv2=True, csv3=True)),
+            ([TEST_KEY_WORD3], True, get_expected_output(csv1=True, csv2=False, csv3=True)),
+            ([TEST_KEY_WORD4], True, get_expected_output(csv1=False, csv2=False, csv3=False)),
+            (
+                [TEST_KEY_WORD1, TEST_KEY_WORD2, TEST_KEY_WORD3], False,
+                get_expected_output(csv1=True, csv2=True, csv3=True, verbose=False)
+            )
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(queries) * 2) as executor:
+            outputs: list = list(executor.map(
+                lambda query: client.inspect(key_words=query[0], verbose=query[1]), queries * 2
+            ))
+
+        for output, (_, _, expected_output) in zip(outputs, queries * 2):
+            self.assertEqual(output, expected_output)
+
+        # Test that the client handler prints the same output as the inspect handler
+        master_handler: MasterHandler = MasterHandler([
+            CLIENT_HANDLER_NAME, PORT_ARG, str(server.get_port()), VERBOSE_ARG, KEY_WORDS_ARG, TEST_KEY_WORD3
+        ])
+        self.assertEqual(
+            get_output(master_handler=master_handler),
+            EMPTY_STRING.join(PRINTED_LINE.format(line) for line in queries[1][2])
+        )
+
+        # Test that a query has a record of each relevant csv file and that a query without valid key words is refused
+        records: list = client.query(key_words=[TEST_KEY_WORD3])[RECORDS_FIELD]
+        self.assertEqual(len(records), 2)
+        for record in records:
+            self.assertIn(record[PATH_FIELD], queries[1][2])
+
+        with self.assertRaises(RuntimeError):
+            client.query(key_words=[])
+
+        with self.assertRaises(RuntimeError):
+            client.query(key_words=[TEST_KEY_WORD3 + MATCH_SEPARATOR])
+
+        # Test that a csv file modified and another removed while serving are picked up by the next query
+        rename(join(TEST_DATA_PATH, UNREADABLE_CSV_NAME2), join(TEST_DATA_PATH, UNREADABLE_CSV_NAME1))
+        self.assertEqual(
+            client.inspect(key_words=[UNREADABLE_CSV_NAME1]), [UNREADABLE_CSV_NAME1, CSV_NOT_LOADED_LINE2]
+        )
+        self.assertEqual(
+            client.inspect(key_words=[UNREADABLE_CSV_NAME2]), get_expected_output(csv1=False, csv2=False, csv3=False)
+        )
+
+        TestServeHandler._stop_server(server=server, server_thread=server_thread)
+
+        with self.assertRaises(ConnectionError):
+            client.inspect(key_words=[TEST_KEY_WORD3])
+
+        creator.destroy_test_data()
+
+    def test_socket(self):
+        """Tests that a server answers queries over a Unix domain socket, which is removed once the server closes"""
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+        get_expected_output: callable = test_inspect_handler.TestInspectHandler._get_expected_output
+
+        socket_path: str = join(TEST_DATA_PATH, SOCKET_NAME)
+        server, server_thread = TestServeHandler._start_server(socket_path=socket_path)
+        client: InspectClient = InspectClient(socket_path=socket_path)
+
+        # Test that only the user running the server can connect to its socket
+        self.assertEqual(S_IMODE(stat(socket_path).st_mode), InspectServer.SOCKET_MODE)
+
+        self.assertEqual(
+            client.inspect(key_words=[TEST_KEY_WORD3], verbose=True),
+            get_expected_output(csv1=True, csv2=False, csv3=True)
+        )
+
+        # Test that a second server refuses to take over the socket of the first
+        with self.assertRaises(FileExistsError):
+            InspectServer(inspector=Inspector(data_path=TEST_DATA_PATH), socket_path=socket_path)
+
+        TestServeHandler._stop_server(server=server, server_thread=server_thread)
+        self.assertFalse(exists(socket_path))
+
+        with self.assertRaises(ConnectionError):
+            client.inspect(key_words=[TEST_KEY_WORD3])
+
+        creator.destroy_test_data()
+
+    @staticmethod
+    def _start_server(socket_path: str) -> tuple:
+        """
+        Starts serving the test data in another thread, on a port chosen by the operating system unless given a socket
+
+        @param socket_path: The path to the Unix domain socket to serve on or None to serve on localhost
+        @return: The server and the thread serving it
+        """
+
+        inspector: Inspector = Inspector(data_path=TEST_DATA_PATH, workers=2, backend=THREAD_BACKEND)
+        server: InspectServer = InspectServer(inspector=inspector, port=0, socket_path=socket_path)
+        server.load()
+
+        server_thread: Thread = Thread(target=server.serve_forever)
+        server_thread.start()
+
+        return server, server_thread
+
+    @staticmethod
+    def _stop_server(server: InspectServer, server_thread: Thread):
+        """
+        Stops serving and closes the server
+
+        @param server: The server
+        @param server_thread: The thread serving it
+        """
+
+        server.shutdown()
+        server_thread.join()
+        server.close()
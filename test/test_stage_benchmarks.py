@@ -0,0 +1,77 @@
+"""Module containing the stage benchmarks test case class"""
+
+from os.path import isdir
+from unittest import TestCase
+
+from benchmarks.data_generator import SyntheticDataGenerator
+from benchmarks.stage_benchmarks import StageBenchmarks
+from strings.benchmark import (
+    ARG_PREFIX, BASELINE_SECONDS_KEY, DEFAULT_KEY_WORDS, ERRORS_KEY, EXTRACT_STAGE, FILES_KEY, MATCH_STAGE, PARAMS_KEY,
+    PARSE_STAGE, PRINT_STAGE, REGRESSED_KEY, ROWS_KEY, SECONDS_KEY, SEED_ARG, STAGES_KEY, SUMMARIZE_STAGE, WALK_STAGE
+)
+from strings.test_data import TEST_DATA_PATH
+
+
+class TestStageBenchmarks(TestCase):
+    """Contains tests for the stage benchmarks"""
+
+    def test_run(self):
+        """Tests that the stage benchmarks time each stage on generated data with nested archives and unreadable CSVs"""
+
+        n_files: int = 4
+        n_rows: int = 20
+        n_unreadable: int = 2
+
+        generator: SyntheticDataGenerator = SyntheticDataGenerator(
+            n_dirs=3, depth=2, n_files=n_files, n_rows=n_rows, n_cols=6, cardinality=3, nominal_fraction=0.5,
+            archive_levels=2, n_unreadable=n_unreadable, seed=0
+        )
+        stage_benchmarks: StageBenchmarks = StageBenchmarks(
+            generator=generator, data_path=TEST_DATA_PATH, key_words=DEFAULT_KEY_WORDS
+        )
+        stages: dict = stage_benchmarks.run(repeat=2)
+
+        self.assertEqual(
+            set(stages.keys()), {EXTRACT_STAGE, WALK_STAGE, PARSE_STAGE, SUMMARIZE_STAGE, MATCH_STAGE, PRINT_STAGE}
+        )
+
+        for stage_results in stages.values():
+            self.assertGreaterEqual(stage_results[SECONDS_KEY], 0)
+
+        # Every csv is found once its archives are extracted, and every readable one has a column matching a key word
+        self.assertEqual(stages[WALK_STAGE][FILES_KEY], n_files + n_unreadable)
+        self.assertEqual(stages[PARSE_STAGE][ERRORS_KEY], n_unreadable)
+        self.assertEqual(stages[PARSE_STAGE][ROWS_KEY], n_files * n_rows)
+        self.assertEqual(stages[MATCH_STAGE][FILES_KEY], n_files)
+
+        # The generated data is removed afterwards
+        self.assertFalse(isdir(TEST_DATA_PATH))
+
+    def test_find_regressions(self):
+        """
+        Tests that only the stages that are slower than the baseline by more than the threshold are regressions, and
+        that nothing is compared against a baseline of data generated with different parameters
+        """
+
+        params: dict = {SEED_ARG.lstrip(ARG_PREFIX): 0}
+        baseline: dict = {
+            PARAMS_KEY: params, STAGES_KEY: {PARSE_STAGE: {SECONDS_KEY: 1.0}, WALK_STAGE: {SECONDS_KEY: 1.0}}
+        }
+        results: dict = {PARAMS_KEY: {SEED_ARG.lstrip(ARG_PREFIX): 1}, STAGES_KEY: {
+            PARSE_STAGE: {SECONDS_KEY: 1.5}, WALK_STAGE: {SECONDS_KEY: 1.1}, PRINT_STAGE: {SECONDS_KEY: 1.0}
+        }}
+
+        self.assertEqual(len(StageBenchmarks.find_param_mismatches(results=results, baseline=baseline)), 1)
+        self.assertEqual(StageBenchmarks.find_regressions(results=results, baseline=baseline, threshold=0.2), [])
+        self.assertNotIn(REGRESSED_KEY, results[STAGES_KEY][PARSE_STAGE])
+
+        results[PARAMS_KEY] = dict(params)
+        self.assertEqual(StageBenchmarks.find_param_mismatches(results=results, baseline=baseline), [])
+
+        regression_lines: list = StageBenchmarks.find_regressions(results=results, baseline=baseline, threshold=0.2)
+
+        self.assertEqual(len(regression_lines), 1)
+        self.assertTrue(results[STAGES_KEY][PARSE_STAGE][REGRESSED_KEY])
+        self.assertFalse(results[STAGES_KEY][WALK_STAGE][REGRESSED_KEY])
+        self.assertEqual(results[STAGES_KEY][WALK_STAGE][BASELINE_SECONDS_KEY], 1.0)
+        self.assertNotIn(REGRESSED_KEY, results[STAGES_KEY][PRINT_STAGE])
@@ -0,0 +1,60 @@
+"""Module containing the summary cache test case class"""
+
+from os.path import join
+from unittest import TestCase
+
+from handler.inspect_handler.csv_object import CSVObject
+from handler.inspect_handler.summary_cache import SummaryCache
+from strings.general import CSV_EXTENSION
+from strings.test_data import CACHE_NAME, CSV1_NAME, TEST_DATA_PATH, WRITE_OPT
+from test.utils import TestDataCreator
+
+
+class TestSummaryCache(TestCase):
+    """Contains tests for the summary cache"""
+
+    def test_get(self):
+        """Tests that the summary cache returns cached csv objects until their csv file changes or they are evicted"""
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+
+        cache_path: str = join(TEST_DATA_PATH, CACHE_NAME)
+        csv_path: str = join(TEST_DATA_PATH, CSV1_NAME + CSV_EXTENSION)
+        csv_obj: CSVObject = CSVObject(csv_path=csv_path)
+
+        # Test that a csv object is cached between runs
+        cache: SummaryCache = SummaryCache(cache_path=cache_path)
+        self.assertIsNone(cache.get(csv_path=csv_path))
+        cache.put(csv_path=csv_path, csv_obj=csv_obj)
+        cache.close()
+
+        cache: SummaryCache = SummaryCache(cache_path=cache_path)
+        cached_csv_obj: CSVObject = cache.get(csv_path=csv_path)
+        self.assertEqual(cached_csv_obj.get_info(verbose=True), csv_obj.get_info(verbose=True))
+
+        # Test that the csv object is not returned once its csv file is modified
+        with open(csv_path, WRITE_OPT) as f:
+            f.write(CACHE_NAME)
+
+        self.assertIsNone(cache.get(csv_path=csv_path))
+        cache.close()
+
+        # Test that a csv object larger than the cache is evicted right away
+        cache: SummaryCache = SummaryCache(cache_path=cache_path, max_bytes=1)
+        self.assertIsNone(cache.get(csv_path=csv_path))
+        cache.put(csv_path=csv_path, csv_obj=CSVObject(csv_path=csv_path))
+        self.assertIsNone(cache.get(csv_path=csv_path))
+        cache.close()
+
+        # Test that two runs sharing the cache see each other's entries while both have it open
+        cache: SummaryCache = SummaryCache(cache_path=cache_path)
+        other_cache: SummaryCache = SummaryCache(cache_path=cache_path)
+        self.assertIsNone(cache.get(csv_path=csv_path))
+        self.assertIsNone(other_cache.get(csv_path=csv_path))
+        cache.put(csv_path=csv_path, csv_obj=CSVObject(csv_path=csv_path))
+        self.assertIsNotNone(other_cache.get(csv_path=csv_path))
+        other_cache.close()
+        cache.close()
+
+        creator.destroy_test_data()
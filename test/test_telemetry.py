@@ -0,0 +1,110 @@
+"""Module containing the telemetry test case class"""
+
+from contextlib import redirect_stderr
+from io import StringIO
+from json import loads
+from os.path import join
+from unittest import TestCase
+
+from handler.master_handler import MasterHandler
+from strings.args import (
+    EXTRACT_HANDLER_NAME, INSPECT_HANDLER_NAME, METRICS_FILE_ARG, METRICS_INTERVAL_ARG, NO_CACHE_ARG, PROGRESS_ARG,
+    TEST_KEY_WORD1, TEST_NOT_POSITIVE_FLOATS
+)
+from strings.general import CSV_EXTENSION
+from strings.telemetry import *
+from strings.test_data import METRICS_NAME, TEST_DATA_PATH, UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2
+from test.utils import get_inspect_args, get_master_handler, TestDataCreator
+
+
+class TestTelemetry(TestCase):
+    """Contains tests for the telemetry of the handlers"""
+
+    def test_inspect(self):
+        """Tests that inspecting records each csv file starting and finishing along with the counters of the run"""
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=False)
+        # The unreadable csv files are not among the paths of the test data
+        unreadable_csv_names: set = {UNREADABLE_CSV_NAME1, UNREADABLE_CSV_NAME2}
+        n_csvs: int = len([path for path in creator.get_test_data_paths() if path.endswith(CSV_EXTENSION)])
+        n_csvs += len(unreadable_csv_names)
+
+        metrics_path: str = join(TEST_DATA_PATH, METRICS_NAME)
+        argv: list = get_inspect_args(
+            key_words=[TEST_KEY_WORD1], options=[METRICS_FILE_ARG, metrics_path, NO_CACHE_ARG]
+        )
+        master_handler: MasterHandler = get_master_handler(handler_type=INSPECT_HANDLER_NAME, extra_args=argv)
+        master_handler.handle()
+
+        events: list = TestTelemetry._read_events(metrics_path=metrics_path)
+        started: list = [event[PATH_KEY] for event in events if event[EVENT_KEY] == FILE_STARTED_EVENT]
+        finished: dict = {event[PATH_KEY]: event for event in events if event[EVENT_KEY] == FILE_FINISHED_EVENT}
+
+        self.assertEqual(len(started), n_csvs)
+        self.assertEqual(set(started), set(finished.keys()))
+
+        # Only the unreadable csv files have errors, and the rows of the others are counted
+        for rel_path, event in finished.items():
+            self.assertEqual(event[ERROR_KEY] is not None, rel_path in unreadable_csv_names)
+
+        counters: dict = events[-2]
+        self.assertEqual(counters[FILES_FINISHED_KEY], n_csvs)
+        self.assertEqual(counters[ERRORS_KEY], len(unreadable_csv_names))
+        self.assertEqual(counters[ROWS_KEY], sum(event[ROWS_KEY] for event in finished.values()))
+        self.assertGreater(counters[ROWS_KEY], 0)
+        self.assertEqual(counters[QUEUE_DEPTH_KEY], 0)
+
+        # Test that an interval between the counters that is not a positive number of seconds is refused
+        for value in TEST_NOT_POSITIVE_FLOATS:
+            argv: list = get_inspect_args(
+                key_words=[TEST_KEY_WORD1], options=[METRICS_FILE_ARG, metrics_path, METRICS_INTERVAL_ARG, value]
+            )
+
+            with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+                get_master_handler(handler_type=INSPECT_HANDLER_NAME, extra_args=argv)
+
+        creator.destroy_test_data()
+
+    def test_extract(self):
+        """Tests that extracting, with the progress line shown as well, records each compressed file being extracted"""
+
+        creator: TestDataCreator = TestDataCreator()
+        creator.create_test_data(compress=True)
+
+        metrics_path: str = join(TEST_DATA_PATH, METRICS_NAME)
+        master_handler: MasterHandler = get_master_handler(
+            handler_type=EXTRACT_HANDLER_NAME, extra_args=[METRICS_FILE_ARG, metrics_path, PROGRESS_ARG]
+        )
+        master_handler.handle()
+
+        events: list = TestTelemetry._read_events(metrics_path=metrics_path)
+        started: list = [event[PATH_KEY] for event in events if event[EVENT_KEY] == EXTRACT_STARTED_EVENT]
+        finished: list = [event[PATH_KEY] for event in events if event[EVENT_KEY] == EXTRACT_FINISHED_EVENT]
+
+        self.assertGreater(len(started), 0)
+        self.assertEqual(sorted(started), sorted(finished))
+
+        counters: dict = events[-2]
+        self.assertEqual(counters[ARCHIVES_EXTRACTED_KEY], len(finished))
+        self.assertEqual(counters[QUEUE_DEPTH_KEY], 0)
+
+        creator.destroy_test_data()
+
+    @staticmethod
+    def _read_events(metrics_path: str) -> list:
+        """
+        Reads the events in a metrics file, checking that the run started and finished with its final counters
+
+        @param metrics_path: The path to the metrics file
+        @return: The events
+        """
+
+        with open(metrics_path, READ_OPT) as f:
+            events: list = [loads(line) for line in f]
+
+        assert events[0][EVENT_KEY] == RUN_STARTED_EVENT
+        assert events[-2][EVENT_KEY] == COUNTERS_EVENT
+        assert events[-1][EVENT_KEY] == RUN_FINISHED_EVENT
+
+        return events
@@ -1,14 +1,24 @@
 """Module containing functionality used for a number of different tests"""
 
-from os import chdir, getcwd, mkdir, system
-from os.path import isdir, isfile, join, realpath
+from bz2 import open as open_bz2
+from contextlib import redirect_stdout
+from gzip import open as open_gz
+from io import StringIO
+from itertools import cycle
+from lzma import open as open_xz
+from os import chdir, getcwd, listdir, mkdir, remove, system
+from os.path import isdir, isfile, join, realpath, relpath
 from pandas import DataFrame
+from shutil import copyfileobj
 from typing import Union
 
 from handler.master_handler import MasterHandler
 from handler.utils import add_trailing_slash
-from strings.extract_handler import GZ_EXTENSION, TAR_EXTENSION, TAR_GZ_EXTENSION, TGZ_EXTENSION, ZIP_EXTENSION
-from strings.args import DATA_PATH_ARG, KEY_WORDS_ARG, VERBOSE_ARG
+from strings.extract_handler import (
+    BZ2_EXTENSION, CURRENT_DIR, GZ_EXTENSION, TAR_EXTENSION, TAR_GZ_EXTENSION, TGZ_EXTENSION, XZ_EXTENSION,
+    ZIP_EXTENSION
+)
+from strings.args import CACHE_PATH_ARG, DATA_PATH_ARG, KEY_WORDS_ARG, NO_CACHE_ARG, VERBOSE_ARG
 from strings.general import CSV_EXTENSION, EMPTY_STRING, NAN
 from strings.test_data import *
 
@@ -364,6 +374,44 @@ class TestDataCreator:
         with open(unreadable_csv, write_opt) as f:
             f.write(unreadable_csv_line)
 
+    def compress_csvs(self):
+        """Compresses each csv in the test data on its own, taking turns compressing them with gzip, bzip2 and xz"""
+
+        compressors: dict = {GZ_EXTENSION: open_gz, BZ2_EXTENSION: open_bz2, XZ_EXTENSION: open_xz}
+        csv_paths: list = sorted(path for path in self.get_test_data_paths() if path.endswith(CSV_EXTENSION))
+
+        for csv_path, extension in zip(csv_paths, cycle(compressors)):
+            assert isfile(csv_path)
+
+            with open(csv_path, READ_BYTES_OPT) as csv_file:
+                with compressors[extension](csv_path + extension, WRITE_BYTES_OPT) as compressed_file:
+                    copyfileobj(csv_file, compressed_file)
+
+            remove(csv_path)
+            self._test_data_paths.remove(csv_path)
+            self._test_data_paths.add(csv_path + extension)
+
+    def store_test_data(self):
+        """
+        Stores all the test data in a tar file which is itself stored in a zip file, neither of which compress the files
+        in them, so that extracting them both recreates the test data inside the directories they are extracted to
+        """
+
+        stored_tar_name: str = STORED_NAME + TAR_EXTENSION
+
+        with NewWorkingDir(new_working_dir=TEST_DATA_PATH):
+            components: str = SPACE.join(sorted(listdir(CURRENT_DIR)))
+            system(TAR_COMPRESS_COMMAND.format(STORED_NAME, components))
+            TestDataCreator._remove(paths=components)
+
+            system(STORED_ZIP_COMPRESS_COMMAND.format(STORED_NAME, stored_tar_name))
+            TestDataCreator._remove(paths=stored_tar_name)
+
+        stored_path: str = join(TEST_DATA_PATH, STORED_NAME, STORED_NAME)
+        self._test_data_paths: set = {
+            join(stored_path, relpath(path, TEST_DATA_PATH)) for path in self.get_test_data_paths()
+        }
+
     def destroy_test_data(self):
         """Removes all the files and folders that are part of the data created for testing"""
 
@@ -417,12 +465,14 @@ def get_master_handler(handler_type: str, extra_args: list = None, trailing_slas
     return MasterHandler(argv)
 
 
-def get_inspect_args(key_words: list, verbose: bool = True) -> list:
+def get_inspect_args(key_words: list, verbose: bool = True, options: list = None, cache_path: str = None) -> list:
     """
     Creates the list of arguments especially for the inspect handler, for the purpose of testing
 
     @param key_words: The list of key words to test the inspect handler with
     @param verbose: Whether to have verbosity or not
+    @param options: Additional options and their values to pass to the inspect handler
+    @param cache_path: The path to the cache of csv summaries, or None to not cache them during the test
     @return: The inspect handler arguments
     """
 
@@ -431,7 +481,31 @@ def get_inspect_args(key_words: list, verbose: bool = True) -> list:
     if verbose:
         argv.append(VERBOSE_ARG)
 
+    if cache_path is None:
+        argv.append(NO_CACHE_ARG)
+    else:
+        argv.extend([CACHE_PATH_ARG, cache_path])
+
+    if options is not None:
+        argv.extend(options)
+
     argv.append(KEY_WORDS_ARG)
     argv.extend(key_words)
 
     return argv
+
+
+def get_output(master_handler: MasterHandler) -> str:
+    """
+    Runs a master handler and captures what its handler prints, for the purpose of testing
+
+    @param master_handler: The master handler
+    @return: The text printed to standard output
+    """
+
+    output: StringIO = StringIO()
+
+    with redirect_stdout(output):
+        master_handler.handle()
+
+    return output.getvalue()